@@ -56,6 +56,7 @@ import (
 
 	"github.com/faramesh/faramesh-core/internal/core"
 	"github.com/faramesh/faramesh-core/internal/core/credential"
+	deferwork "github.com/faramesh/faramesh-core/internal/core/defer"
 	"github.com/faramesh/faramesh-core/internal/core/delegate"
 	"github.com/faramesh/faramesh-core/internal/daemon/agentsupervisor"
 	"github.com/faramesh/faramesh-core/internal/core/observe"
@@ -125,6 +126,7 @@ type governResponse struct {
 }
 
 type auditEvent struct {
+	Seq             uint64
 	Decision        core.Decision
 	AgentID         string
 	SessionID       string
@@ -140,6 +142,7 @@ type auditEvent struct {
 }
 
 type callbackEvent struct {
+	Seq       uint64 `json:"seq,omitempty"`
 	EventType string `json:"event_type"`
 	Timestamp string `json:"timestamp"`
 
@@ -425,13 +428,18 @@ type Server struct {
 	compMu            sync.RWMutex
 	compensations     map[string]*compensateRecord
 	// subscribers receive copies of every decision for audit tail.
-	subsMu     sync.Mutex
-	subs       []chan auditEvent
-	cbSubs     []chan callbackEvent
-	wg         sync.WaitGroup
-	rlMu       sync.Mutex
-	rl         map[string]*rate.Limiter
-	connTokens chan struct{}
+	// The rings number each stream and retain recent events for since_seq
+	// replay; streamEpoch changes on every daemon start.
+	subsMu      sync.Mutex
+	subs        []chan auditEvent
+	cbSubs      []chan callbackEvent
+	auditRing   eventRing[auditEvent]
+	cbRing      eventRing[callbackEvent]
+	streamEpoch string
+	wg          sync.WaitGroup
+	rlMu        sync.Mutex
+	rl          map[string]*rate.Limiter
+	connTokens  chan struct{}
 	// standingAdminToken, when non-empty, requires matching "admin_token" on
 	// standing_grant_* JSON requests (constant-time compare). When empty,
 	// standing grant APIs are disabled (fail closed).
@@ -443,7 +451,7 @@ type Server struct {
 
 // NewServer creates a new SDK socket server.
 func NewServer(pipeline *core.Pipeline, log *zap.Logger) *Server {
-	return &Server{
+	s := &Server{
 		pipeline:    pipeline,
 		log:         log,
 		started:     time.Now(),
@@ -461,7 +469,30 @@ func NewServer(pipeline *core.Pipeline, log *zap.Logger) *Server {
 		compensations:    make(map[string]*compensateRecord),
 		rl:               make(map[string]*rate.Limiter),
 		connTokens:       make(chan struct{}, 256),
+		streamEpoch:      uuid.NewString(),
 	}
+	if pipeline != nil {
+		if wf := pipeline.DeferWorkflow(); wf != nil {
+			// Every resolution path (CLI, proxy, MCP gateway, batch, expiry)
+			// pushes defer_resolved to callback subscribers.
+			wf.OnResolve(s.broadcastDeferResolved)
+		}
+	}
+	return s
+}
+
+func (s *Server) broadcastDeferResolved(token, agentID string, res deferwork.Resolution) {
+	approved := res.Approved
+	s.broadcastCallback(callbackEvent{
+		EventType:  "defer_resolved",
+		Timestamp:  time.Now().UTC().Format(time.RFC3339Nano),
+		AgentID:    agentID,
+		DeferToken: token,
+		Status:     string(res.Status),
+		Approved:   &approved,
+		ApproverID: res.ApproverID,
+		Reason:     res.Reason,
+	})
 }
 
 // SetPrincipalResolver wires bearer-token principal verification into govern requests.
@@ -802,11 +833,11 @@ func (s *Server) handle(conn net.Conn) {
 			s.handleGovernOutput(conn, line)
 		case "audit_subscribe":
 			// This call blocks — it streams decisions until the connection closes.
-			s.handleAuditSubscribe(conn)
+			s.handleAuditSubscribe(conn, line)
 			return
 		case "callback_subscribe":
 			// This call blocks — it streams callback events until the connection closes.
-			s.handleCallbackSubscribe(conn)
+			s.handleCallbackSubscribe(conn, line)
 			return
 		default:
 			writeJSON(conn, map[string]any{"error": "unknown type: " + msgType})
@@ -1883,26 +1914,6 @@ func (s *Server) handlePollDefer(conn net.Conn, line []byte) {
 		return
 	}
 	status, _ := s.pipeline.DeferWorkflow().Status(req.DeferToken)
-	switch status {
-	case "approved", "denied", "expired":
-		var approved *bool
-		switch status {
-		case "approved":
-			v := true
-			approved = &v
-		case "denied", "expired":
-			v := false
-			approved = &v
-		}
-		s.broadcastCallback(callbackEvent{
-			EventType:  "defer_resolved",
-			Timestamp:  time.Now().UTC().Format(time.RFC3339Nano),
-			AgentID:    req.AgentID,
-			DeferToken: req.DeferToken,
-			Status:     string(status),
-			Approved:   approved,
-		})
-	}
 	writeJSON(conn, pollDeferResponse{
 		DeferToken: req.DeferToken,
 		Status:     string(status),
@@ -1927,20 +1938,6 @@ func (s *Server) handleApproveDefer(conn net.Conn, line []byte) {
 		writeJSON(conn, map[string]any{"ok": false, "error": err.Error()})
 		return
 	}
-	status := "denied"
-	if req.Approved {
-		status = "approved"
-	}
-	approved := req.Approved
-	s.broadcastCallback(callbackEvent{
-		EventType:  "defer_resolved",
-		Timestamp:  time.Now().UTC().Format(time.RFC3339Nano),
-		DeferToken: req.DeferToken,
-		Status:     status,
-		Approved:   &approved,
-		ApproverID: req.ApproverID,
-		Reason:     reason,
-	})
 	writeJSON(conn, map[string]any{"ok": true})
 }
 
@@ -2174,49 +2171,74 @@ func (s *Server) handleShutdown(conn net.Conn, line []byte) {
 
 // handleAuditSubscribe streams every decision to this connection until it closes.
 // The connection sends {"type":"audit_subscribe"} once, then receives a stream
-// of decision JSON objects (one per line) until it disconnects.
-func (s *Server) handleAuditSubscribe(conn net.Conn) {
-	ch := s.Subscribe()
+// of decision JSON objects (one per line) until it disconnects. Each decision
+// carries a monotonic "seq"; a reconnecting client sends the last seq it saw
+// as "since_seq" (plus the "epoch" from its previous confirmation) and is
+// replayed what it missed from the bounded replay window first. The
+// confirmation reports "missed" when part of that gap is no longer retained.
+func (s *Server) handleAuditSubscribe(conn net.Conn, line []byte) {
+	ch, replay, cutoff, resume, ack := s.subscribeAuditFrom(parseSubscribeRequest(line))
 	defer s.Unsubscribe(ch)
 
-	writeJSON(conn, map[string]any{"subscribed": true})
-
+	writeJSON(conn, ack)
+	for _, event := range replay {
+		writeJSON(conn, auditEventJSON(event))
+	}
+	if resume {
+		catchUp(&s.subsMu, &s.auditRing, ch, cutoff,
+			func(e auditEvent) uint64 { return e.Seq },
+			func(e auditEvent) { writeJSON(conn, auditEventJSON(e)) })
+	}
 	for event := range ch {
-		decision := event.Decision
-		writeJSON(conn, map[string]any{
-			"effect":            string(decision.Effect),
-			"agent_id":          event.AgentID,
-			"session_id":        event.SessionID,
-			"tool_id":           event.ToolID,
-			"tool_name":         event.ToolName,
-			"operation":         event.Operation,
-			"rule_id":           decision.RuleID,
-			"reason_code":       reasons.Normalize(decision.ReasonCode),
-			"reason":            event.Reason,
-			"record_id":         decision.DPRRecordID,
-			"defer_token":       decision.DeferToken,
-			"latency_ms":        decision.Latency.Milliseconds(),
-			"timestamp":         decision.Timestamp.UTC().Format(time.RFC3339Nano),
-			"policy_version":    decision.PolicyVersion,
-			"incident_category": decision.IncidentCategory,
-			"incident_severity": decision.IncidentSeverity,
-			"blast_radius":      event.BlastRadius,
-			"reversibility":     event.Reversibility,
-			"principal_id":      event.PrincipalID,
-			"principal_method":  event.PrincipalMethod,
-			"args":              event.Args,
-		})
+		writeJSON(conn, auditEventJSON(event))
+	}
+}
+
+// auditEventJSON is the audit_subscribe wire form of a decision.
+func auditEventJSON(event auditEvent) map[string]any {
+	decision := event.Decision
+	return map[string]any{
+		"seq":               event.Seq,
+		"effect":            string(decision.Effect),
+		"agent_id":          event.AgentID,
+		"session_id":        event.SessionID,
+		"tool_id":           event.ToolID,
+		"tool_name":         event.ToolName,
+		"operation":         event.Operation,
+		"rule_id":           decision.RuleID,
+		"reason_code":       reasons.Normalize(decision.ReasonCode),
+		"reason":            event.Reason,
+		"record_id":         decision.DPRRecordID,
+		"defer_token":       decision.DeferToken,
+		"latency_ms":        decision.Latency.Milliseconds(),
+		"timestamp":         decision.Timestamp.UTC().Format(time.RFC3339Nano),
+		"policy_version":    decision.PolicyVersion,
+		"incident_category": decision.IncidentCategory,
+		"incident_severity": decision.IncidentSeverity,
+		"blast_radius":      event.BlastRadius,
+		"reversibility":     event.Reversibility,
+		"principal_id":      event.PrincipalID,
+		"principal_method":  event.PrincipalMethod,
+		"args":              event.Args,
 	}
 }
 
 // handleCallbackSubscribe streams lifecycle callback events to this connection
-// until it closes. This stream is optional and backward-compatible.
-func (s *Server) handleCallbackSubscribe(conn net.Conn) {
-	ch := s.SubscribeCallbacks()
+// until it closes. This stream is optional and backward-compatible. Events are
+// sequenced and resumable with since_seq exactly like audit_subscribe.
+func (s *Server) handleCallbackSubscribe(conn net.Conn, line []byte) {
+	ch, replay, cutoff, resume, ack := s.subscribeCallbacksFrom(parseSubscribeRequest(line))
 	defer s.UnsubscribeCallbacks(ch)
 
-	writeJSON(conn, map[string]any{"subscribed": true, "stream": "callbacks"})
-
+	writeJSON(conn, ack)
+	for _, event := range replay {
+		writeJSON(conn, event)
+	}
+	if resume {
+		catchUp(&s.subsMu, &s.cbRing, ch, cutoff,
+			func(e callbackEvent) uint64 { return e.Seq },
+			func(e callbackEvent) { writeJSON(conn, e) })
+	}
 	for event := range ch {
 		writeJSON(conn, event)
 	}
@@ -2226,6 +2248,7 @@ func (s *Server) handleCallbackSubscribe(conn net.Conn) {
 func (s *Server) broadcast(e auditEvent) {
 	s.subsMu.Lock()
 	defer s.subsMu.Unlock()
+	e = s.auditRing.push(e, func(ev *auditEvent, seq uint64) { ev.Seq = seq })
 	for _, ch := range s.subs {
 		select {
 		case ch <- e:
@@ -2238,6 +2261,7 @@ func (s *Server) broadcast(e auditEvent) {
 func (s *Server) broadcastCallback(e callbackEvent) {
 	s.subsMu.Lock()
 	defer s.subsMu.Unlock()
+	e = s.cbRing.push(e, func(ev *callbackEvent, seq uint64) { ev.Seq = seq })
 	for _, ch := range s.cbSubs {
 		select {
 		case ch <- e:
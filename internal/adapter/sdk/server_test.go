@@ -120,6 +120,38 @@ func TestCallbackSubscribeDeferResolvedEventFires(t *testing.T) {
 	}
 }
 
+func TestCallbackSubscribeDeferResolvedFiresForOutOfBandResolution(t *testing.T) {
+	srv := NewServer(core.NewPipeline(core.Config{}), zap.NewNop())
+	token := "tok-out-of-band"
+	if _, err := srv.pipeline.DeferWorkflow().DeferWithToken(token, "agent-x", "tool.defer", "needs approval"); err != nil {
+		t.Fatalf("seed defer token: %v", err)
+	}
+
+	cbClient := startSocketHandler(t, srv)
+	defer cbClient.conn.Close()
+	writeLine(t, cbClient.conn, `{"type":"callback_subscribe"}`)
+	readJSONWithDeadline(t, cbClient, 500*time.Millisecond)
+
+	// Resolved by another adapter (proxy, MCP gateway, batch), not approve_defer.
+	if err := srv.pipeline.DeferWorkflow().Resolve(token, false, "approver-7", "too risky"); err != nil {
+		t.Fatalf("resolve: %v", err)
+	}
+
+	ev := readJSONWithDeadline(t, cbClient, 500*time.Millisecond)
+	if got := asString(ev["event_type"]); got != "defer_resolved" {
+		t.Fatalf("event_type = %q, want defer_resolved", got)
+	}
+	if got := asString(ev["defer_token"]); got != token {
+		t.Fatalf("defer_token = %q, want %s", got, token)
+	}
+	if got := asString(ev["agent_id"]); got != "agent-x" {
+		t.Fatalf("agent_id = %q, want agent-x", got)
+	}
+	if got := asString(ev["status"]); got != "denied" {
+		t.Fatalf("status = %q, want denied", got)
+	}
+}
+
 func TestApproveDeferCarriesApproverID(t *testing.T) {
 	srv := NewServer(core.NewPipeline(core.Config{}), zap.NewNop())
 	token := "tok-approve-id"
@@ -146,6 +178,51 @@ func TestApproveDeferCarriesApproverID(t *testing.T) {
 	}
 }
 
+func TestAuditSubscribeReplaysSinceSeq(t *testing.T) {
+	srv := NewServer(core.NewPipeline(core.Config{}), zap.NewNop())
+
+	first := startSocketHandler(t, srv)
+	writeLine(t, first.conn, `{"type":"audit_subscribe","agent_id":""}`)
+	ack := readJSONWithDeadline(t, first, 500*time.Millisecond)
+	epoch := asString(ack["epoch"])
+	if epoch == "" || ack["seq"] != float64(0) {
+		t.Fatalf("unexpected ack: %#v", ack)
+	}
+	first.conn.Close()
+
+	governClient := startSocketHandler(t, srv)
+	defer governClient.conn.Close()
+	for i := 0; i < 3; i++ {
+		writeLine(t, governClient.conn, fmt.Sprintf(`{"type":"govern","call_id":"c-%d","agent_id":"a-1","session_id":"s-1","tool_id":"tool.echo","args":{}}`, i))
+		_ = readJSONWithDeadline(t, governClient, 500*time.Millisecond)
+	}
+
+	resumed := startSocketHandler(t, srv)
+	defer resumed.conn.Close()
+	writeLine(t, resumed.conn, `{"type":"audit_subscribe","agent_id":"","since_seq":1,"epoch":"`+epoch+`"}`)
+	ack = readJSONWithDeadline(t, resumed, 500*time.Millisecond)
+	if ack["seq"] != float64(3) || ack["replayed"] != float64(2) || ack["missed"] != float64(0) {
+		t.Fatalf("unexpected resume ack: %#v", ack)
+	}
+	for want := 2; want <= 3; want++ {
+		ev := readJSONWithDeadline(t, resumed, 500*time.Millisecond)
+		if ev["seq"] != float64(want) {
+			t.Fatalf("replayed seq = %v, want %d", ev["seq"], want)
+		}
+	}
+
+	restarted := startSocketHandler(t, srv)
+	defer restarted.conn.Close()
+	writeLine(t, restarted.conn, `{"type":"callback_subscribe","since_seq":40,"epoch":"previous-daemon"}`)
+	ack = readJSONWithDeadline(t, restarted, 500*time.Millisecond)
+	if ack["epoch_changed"] != true || ack["replayed"] != float64(3) || asString(ack["stream"]) != "callbacks" {
+		t.Fatalf("unexpected callback resume ack: %#v", ack)
+	}
+	if ev := readJSONWithDeadline(t, restarted, 500*time.Millisecond); ev["seq"] != float64(1) {
+		t.Fatalf("first replayed callback seq = %v, want 1", ev["seq"])
+	}
+}
+
 func TestIdentityVerifyReturnsClientAssertedVerificationMethod(t *testing.T) {
 	coreObs, logs := observer.New(zapcore.WarnLevel)
 	logger := zap.New(coreObs)
@@ -0,0 +1,158 @@
+package sdk
+
+import (
+	"encoding/json"
+	"sync"
+)
+
+// subscribeReplayWindow is how many recent events each stream keeps for
+// since_seq replay after a subscriber reconnects.
+const subscribeReplayWindow = 4096
+
+// subscribeRequest is the optional resume payload of audit_subscribe and
+// callback_subscribe. Without since_seq the stream starts live, as before.
+type subscribeRequest struct {
+	Type     string  `json:"type"`
+	SinceSeq *uint64 `json:"since_seq,omitempty"`
+	Epoch    string  `json:"epoch,omitempty"`
+}
+
+// eventRing assigns monotonic sequence numbers (starting at 1) to a stream
+// and retains the last subscribeReplayWindow events for replay. Callers
+// hold Server.subsMu.
+type eventRing[T any] struct {
+	buf   []T
+	start int
+	n     int
+	last  uint64
+}
+
+// push records ev under the next sequence number and returns it. stamp
+// stores the number on the event before it is retained.
+func (r *eventRing[T]) push(ev T, stamp func(*T, uint64)) T {
+	if r.buf == nil {
+		r.buf = make([]T, subscribeReplayWindow)
+	}
+	r.last++
+	stamp(&ev, r.last)
+	if r.n < len(r.buf) {
+		r.buf[(r.start+r.n)%len(r.buf)] = ev
+		r.n++
+	} else {
+		r.buf[r.start] = ev
+		r.start = (r.start + 1) % len(r.buf)
+	}
+	return ev
+}
+
+// since returns the retained events after seq, oldest first, and how many
+// events after seq have already fallen out of the window.
+func (r *eventRing[T]) since(seq uint64) (events []T, missed uint64) {
+	if seq >= r.last || r.n == 0 {
+		return nil, 0
+	}
+	oldest := r.last - uint64(r.n) + 1
+	first := seq + 1
+	if first < oldest {
+		missed = oldest - first
+		first = oldest
+	}
+	skip := int(first - oldest)
+	events = make([]T, 0, r.n-skip)
+	for i := skip; i < r.n; i++ {
+		events = append(events, r.buf[(r.start+i)%len(r.buf)])
+	}
+	return events, missed
+}
+
+// subscribeAck builds the subscription confirmation for a stream whose
+// latest sequence number is last, and reports where replay should start.
+// A client resuming from another daemon epoch (the daemon restarted, so
+// numbering restarted) is replayed everything retained since the restart.
+func (s *Server) subscribeAck(req subscribeRequest, last uint64) (ack map[string]any, since uint64, resume bool) {
+	ack = map[string]any{"subscribed": true, "seq": last, "epoch": s.streamEpoch}
+	if req.SinceSeq == nil {
+		return ack, 0, false
+	}
+	since = *req.SinceSeq
+	if req.Epoch != "" && req.Epoch != s.streamEpoch {
+		ack["epoch_changed"] = true
+		since = 0
+	}
+	return ack, since, true
+}
+
+// subscribeAuditFrom registers an audit subscriber and, under the same lock,
+// takes the events it must be replayed and the replay cutoff (the last
+// sequence number at registration), so none is both replayed and streamed
+// live. Resuming subscribers then go through catchUp before reading ch.
+func (s *Server) subscribeAuditFrom(req subscribeRequest) (ch chan auditEvent, replay []auditEvent, cutoff uint64, resume bool, ack map[string]any) {
+	ch = make(chan auditEvent, 64)
+	s.subsMu.Lock()
+	defer s.subsMu.Unlock()
+	s.subs = append(s.subs, ch)
+	cutoff = s.auditRing.last
+	ack, since, resume := s.subscribeAck(req, cutoff)
+	if !resume {
+		return ch, nil, cutoff, false, ack
+	}
+	replay, missed := s.auditRing.since(since)
+	ack["replayed"] = len(replay)
+	ack["missed"] = missed
+	return ch, replay, cutoff, true, ack
+}
+
+// subscribeCallbacksFrom is subscribeAuditFrom for the callback stream.
+func (s *Server) subscribeCallbacksFrom(req subscribeRequest) (ch chan callbackEvent, replay []callbackEvent, cutoff uint64, resume bool, ack map[string]any) {
+	ch = make(chan callbackEvent, 64)
+	s.subsMu.Lock()
+	defer s.subsMu.Unlock()
+	s.cbSubs = append(s.cbSubs, ch)
+	cutoff = s.cbRing.last
+	ack, since, resume := s.subscribeAck(req, cutoff)
+	ack["stream"] = "callbacks"
+	if !resume {
+		return ch, nil, cutoff, false, ack
+	}
+	replay, missed := s.cbRing.since(since)
+	ack["replayed"] = len(replay)
+	ack["missed"] = missed
+	return ch, replay, cutoff, true, ack
+}
+
+// catchUp brings a resuming subscriber from the replay cutoff up to the live
+// stream. Writing a long replay to a slow client can take longer than the
+// 64-slot live channel lasts, and broadcast drops events for a full
+// channel, so events sequenced meanwhile are read back from the ring rather
+// than the channel. Once the ring holds nothing newer, the channel (which
+// then only holds events already written) is emptied under mu, so live
+// delivery resumes with an empty buffer and no gap. Events that fall out of
+// the ring before they are written show up to the client as a seq gap.
+func catchUp[T any](mu *sync.Mutex, ring *eventRing[T], ch chan T, after uint64, seqOf func(T) uint64, write func(T)) {
+	for {
+		mu.Lock()
+		events, _ := ring.since(after)
+		if len(events) == 0 {
+			for drained := false; !drained; {
+				select {
+				case <-ch:
+				default:
+					drained = true
+				}
+			}
+			mu.Unlock()
+			return
+		}
+		mu.Unlock()
+		for _, ev := range events {
+			write(ev)
+			after = seqOf(ev)
+		}
+	}
+}
+
+func parseSubscribeRequest(line []byte) subscribeRequest {
+	var req subscribeRequest
+	_ = json.Unmarshal(line, &req)
+	return req
+}
@@ -0,0 +1,66 @@
+package sdk
+
+import (
+	"sync"
+	"testing"
+)
+
+type seqEvent struct{ Seq uint64 }
+
+func stampSeq(ev *seqEvent, seq uint64) { ev.Seq = seq }
+
+func TestCatchUpIsLosslessWhileLiveChannelOverflows(t *testing.T) {
+	var mu sync.Mutex
+	var ring eventRing[seqEvent]
+	ch := make(chan seqEvent, 4)
+	publish := func() {
+		mu.Lock()
+		defer mu.Unlock()
+		ev := ring.push(seqEvent{}, stampSeq)
+		select {
+		case ch <- ev:
+		default: // dropped, like broadcast on a full channel
+		}
+	}
+
+	for i := 0; i < 100; i++ {
+		publish()
+	}
+	mu.Lock()
+	replay, missed := ring.since(10)
+	cutoff := ring.last
+	mu.Unlock()
+	if missed != 0 || len(replay) != 90 {
+		t.Fatalf("replay = %d events, missed = %d", len(replay), missed)
+	}
+
+	var written []uint64
+	write := func(ev seqEvent) {
+		written = append(written, ev.Seq)
+		// Live events keep arriving while the replay is written.
+		if len(written)%3 == 0 && len(written) < 150 {
+			publish()
+		}
+	}
+	for _, ev := range replay {
+		write(ev)
+	}
+	catchUp(&mu, &ring, ch, cutoff, func(ev seqEvent) uint64 { return ev.Seq }, write)
+
+	for i, seq := range written {
+		if seq != uint64(11+i) {
+			t.Fatalf("written[%d] = %d, want %d", i, seq, 11+i)
+		}
+	}
+	if got := written[len(written)-1]; got != ring.last {
+		t.Fatalf("caught up to %d, ring is at %d", got, ring.last)
+	}
+	if len(ch) != 0 {
+		t.Fatalf("live channel still holds %d already-written events", len(ch))
+	}
+
+	publish()
+	if ev := <-ch; ev.Seq != ring.last {
+		t.Fatalf("first live event seq = %d, want %d", ev.Seq, ring.last)
+	}
+}
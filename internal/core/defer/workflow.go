@@ -161,6 +161,7 @@ type Workflow struct {
 	backend             backendstore.Backend
 	contexts            *DeferContextStore
 	approvalHMACKey     []byte
+	resolveHooks        []func(token, agentID string, res Resolution)
 }
 
 // NewWorkflow creates a new DEFER workflow manager.
@@ -176,6 +177,28 @@ func NewWorkflow(slackWebhookURL string) *Workflow {
 	return w
 }
 
+// OnResolve registers fn to run after every successful DEFER resolution,
+// whichever path resolved it: direct Resolve calls (SDK socket, proxy, MCP
+// gateway, batch approvals), durable-backend sync, or expiry. fn runs on the
+// resolving goroutine after the workflow lock has been released.
+func (w *Workflow) OnResolve(fn func(token, agentID string, res Resolution)) {
+	if fn == nil {
+		return
+	}
+	w.mu.Lock()
+	defer w.mu.Unlock()
+	w.resolveHooks = append(w.resolveHooks, fn)
+}
+
+func (w *Workflow) notifyResolved(token, agentID string, res Resolution) {
+	w.mu.Lock()
+	hooks := w.resolveHooks
+	w.mu.Unlock()
+	for _, fn := range hooks {
+		fn(token, agentID, res)
+	}
+}
+
 // SetLogger sets the workflow logger for structured governance events.
 func (w *Workflow) SetLogger(log *zap.Logger) {
 	w.mu.Lock()
@@ -503,6 +526,7 @@ func (w *Workflow) resolveInternal(token string, res Resolution) (bool, error) {
 			if w.triage != nil {
 				w.triage.Remove(token)
 			}
+			w.notifyResolved(token, "", res)
 			return true, nil
 		}
 		w.mu.Unlock()
@@ -518,6 +542,7 @@ func (w *Workflow) resolveInternal(token string, res Resolution) (bool, error) {
 
 	select {
 	case h.ch <- res:
+		w.notifyResolved(token, h.AgentID, res)
 		return true, nil
 	default:
 		observe.EmitGovernanceLog(w.log, zapcore.WarnLevel, "defer resolution conflict", observe.EventDeferResolveConflict,
@@ -726,6 +751,7 @@ func (w *Workflow) resolveLocalOnly(token string, res Resolution) (bool, error)
 		if w.triage != nil {
 			w.triage.Remove(token)
 		}
+		w.notifyResolved(token, "", res)
 		return true, nil
 	}
 	delete(w.pending, token)
@@ -737,6 +763,7 @@ func (w *Workflow) resolveLocalOnly(token string, res Resolution) (bool, error)
 	}
 	select {
 	case h.ch <- res:
+		w.notifyResolved(token, h.AgentID, res)
 		return true, nil
 	default:
 		return false, &ResolveConflictError{Token: token, Code: ResolveConflictCode, Status: res.Status}
@@ -149,6 +149,51 @@ func TestStatusPendingResolvedAndUnknown(t *testing.T) {
 	}
 }
 
+func TestOnResolveFiresOnceForEveryResolutionPath(t *testing.T) {
+	w := NewWorkflow("")
+	type fired struct {
+		token, agentID string
+		status         DeferStatus
+		approverID     string
+	}
+	var got []fired
+	w.OnResolve(func(token, agentID string, res Resolution) {
+		got = append(got, fired{token, agentID, res.Status, res.ApproverID})
+	})
+
+	for _, tok := range []string{"tok-api", "tok-backend"} {
+		if _, err := w.DeferWithToken(tok, "agent-h", "tool-h", "needs review"); err != nil {
+			t.Fatalf("DeferWithToken(%s) error = %v", tok, err)
+		}
+	}
+	if err := w.Resolve("tok-api", true, "approver-1", "ok"); err != nil {
+		t.Fatalf("Resolve() error = %v", err)
+	}
+	if err := w.Resolve("tok-api", false, "approver-2", "late"); err == nil {
+		t.Fatalf("expected conflict on second Resolve")
+	}
+	if _, err := w.syncBackendResolution("tok-backend", backendstore.DeferResolution{
+		Token:      "tok-backend",
+		Status:     "denied",
+		ResolvedBy: "approver-3",
+	}); err != nil {
+		t.Fatalf("syncBackendResolution() error = %v", err)
+	}
+
+	want := []fired{
+		{"tok-api", "agent-h", StatusApproved, "approver-1"},
+		{"tok-backend", "agent-h", StatusDenied, "approver-3"},
+	}
+	if len(got) != len(want) {
+		t.Fatalf("hook fired %d times, want %d: %#v", len(got), len(want), got)
+	}
+	for i := range want {
+		if got[i] != want[i] {
+			t.Fatalf("hook call %d = %#v, want %#v", i, got[i], want[i])
+		}
+	}
+}
+
 func TestResolveUnknownToken(t *testing.T) {
 	w := NewWorkflow("")
 	err := w.Resolve("missing-token", true, "", "x")
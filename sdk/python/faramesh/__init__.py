@@ -7,114 +7,258 @@ Quick Start:
     >>> print(f"Action {action['id']} status: {action['status']}")
 """
 
-from .client import (
-    # Configuration
-    configure,
-    ClientConfig,
-    
-    # Core functions
-    submit_action,
-    submit_actions,
-    submit_actions_bulk,
-    submit_and_wait,
-    block_until_approved,
-    get_action,
-    list_actions,
-    approve_action,
-    deny_action,
-    start_action,
-    replay_action,
-    wait_for_completion,
-    apply,
-    tail_events,
-    stream_events,
-    
-    # Convenience aliases
-    allow,
-    deny,
-    
-    # Exceptions
-    FarameshError,
-    FarameshAuthError,
-    FarameshNotFoundError,
-    FarameshPolicyError,
-    FarameshTimeoutError,
-    FarameshConnectionError,
-    FarameshValidationError,
-    FarameshServerError,
-    FarameshBatchError,
-    FarameshDeniedError,
-    DenyError,
-    DeferredError,
-    
-    # Legacy class-based API (for backward compatibility)
-    ExecutionGovernorClient,
-    GovernorConfig,
-    GovernorError,
-    GovernorTimeoutError,
-    GovernorAuthError,
-    GovernorConnectionError,
-)
-
-# Import new modules
-from .govern import govern
-from .governed_tool import governed_tool
-from .governed_toolset import GovernedToolSet
-from .exceptions import ToolDeniedException
-from .snapshot import ActionSnapshotStore, get_default_store
-from .policy_helpers import validate_policy_file, test_policy_against_action
-
-# Import canonicalization helpers
-from .canonicalization import (
-    canonicalize,
-    canonicalize_action_payload,
-    compute_request_hash,
-    compute_hash,
-    CanonicalizeError,
-)
-
-# Import gate helpers
-from .gate import (
-    gate_decide,
-    gate_decide_dict,
-    replay_decision,
-    verify_request_hash,
-    execute_if_allowed,
-    GateDecision,
-    ReplayResult,
-)
-
-# Import socket-stream submodules:
-#   audit     -> wraps `audit_subscribe`     (governance decisions)
-#   callbacks -> wraps `callback_subscribe`  (lifecycle events: defer_resolved, etc.)
-from . import audit, callbacks
-
-# Import version
-from .client import __version__
-
-# Import policy models
-from .policy import (
-    Policy,
-    PolicyRule,
-    MatchCondition,
-    RiskRule,
-    RiskLevel,
-    create_policy,
-)
+from __future__ import annotations
+
+import importlib
+import sys
+import types
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from . import audit, callbacks, dpr
+    from .canonicalization import (
+        CanonicalizeError,
+        canonicalize,
+        canonicalize_action_payload,
+        compute_hash,
+        compute_request_hash,
+    )
+    from .client import (
+        ClientConfig,
+        DeferredError,
+        DenyError,
+        ExecutionGovernorClient,
+        FarameshAuthError,
+        FarameshBatchError,
+        FarameshCircuitOpenError,
+        FarameshConnectionError,
+        FarameshDeniedError,
+        FarameshError,
+        FarameshNotFoundError,
+        FarameshPolicyError,
+        FarameshServerError,
+        FarameshTimeoutError,
+        FarameshValidationError,
+        GovernorAuthError,
+        GovernorConfig,
+        GovernorConnectionError,
+        GovernorError,
+        GovernorTimeoutError,
+        __version__,
+        allow,
+        apply,
+        approve_action,
+        block_until_approved,
+        close_sessions,
+        configure,
+        deny,
+        deny_action,
+        get_action,
+        iter_actions,
+        list_actions,
+        replay_action,
+        start_action,
+        stream_events,
+        submit_action,
+        submit_actions,
+        submit_actions_bulk,
+        submit_and_wait,
+        submit_stream,
+        tail_events,
+        wait_for_completion,
+    )
+    from .exceptions import ToolDeniedException
+    from .gate import (
+        GateDecision,
+        ProvenanceIndex,
+        ReplayReport,
+        ReplayResult,
+        enable_provenance_index,
+        execute_if_allowed,
+        find_action_by_provenance,
+        gate_decide,
+        gate_decide_dict,
+        replay_decision,
+        replay_decisions,
+        verify_request_hash,
+    )
+    from .govern import govern
+    from .governed_tool import governed_tool
+    from .governed_toolset import GovernedToolSet
+    from .pending import PendingToolCall, get_pending_call, pending_calls
+    from .policy import (
+        MatchCondition,
+        Policy,
+        PolicyRule,
+        RiskLevel,
+        RiskRule,
+        create_policy,
+    )
+    from .policy_helpers import test_policy_against_action, validate_policy_file
+    from .snapshot import (
+        ActionSnapshotStore,
+        LiveActionView,
+        SQLiteActionSnapshotStore,
+        get_default_store,
+    )
+
+
+# Public API, grouped by the submodule that defines it. Names are resolved on
+# first attribute access (PEP 562) so that `import faramesh` does not pull in
+# requests/yaml for processes that only need faramesh.autopatch or
+# faramesh.transport.
+_LAZY_IMPORTS: dict[str, tuple[str, ...]] = {
+    "client": (
+        # Configuration
+        "configure",
+        "ClientConfig",
+        "close_sessions",
+        # Core functions
+        "submit_action",
+        "submit_actions",
+        "submit_actions_bulk",
+        "submit_and_wait",
+        "submit_stream",
+        "block_until_approved",
+        "get_action",
+        "list_actions",
+        "iter_actions",
+        "approve_action",
+        "deny_action",
+        "start_action",
+        "replay_action",
+        "wait_for_completion",
+        "apply",
+        "tail_events",
+        "stream_events",
+        # Convenience aliases
+        "allow",
+        "deny",
+        # Exceptions
+        "FarameshError",
+        "FarameshAuthError",
+        "FarameshNotFoundError",
+        "FarameshPolicyError",
+        "FarameshTimeoutError",
+        "FarameshConnectionError",
+        "FarameshCircuitOpenError",
+        "FarameshValidationError",
+        "FarameshServerError",
+        "FarameshBatchError",
+        "FarameshDeniedError",
+        "DenyError",
+        "DeferredError",
+        # Legacy class-based API (for backward compatibility)
+        "ExecutionGovernorClient",
+        "GovernorConfig",
+        "GovernorError",
+        "GovernorTimeoutError",
+        "GovernorAuthError",
+        "GovernorConnectionError",
+        # Version
+        "__version__",
+    ),
+    "govern": ("govern",),
+    "governed_tool": ("governed_tool",),
+    "governed_toolset": ("GovernedToolSet",),
+    "exceptions": ("ToolDeniedException",),
+    "pending": ("PendingToolCall", "get_pending_call", "pending_calls"),
+    "snapshot": (
+        "ActionSnapshotStore",
+        "LiveActionView",
+        "SQLiteActionSnapshotStore",
+        "get_default_store",
+    ),
+    "policy_helpers": ("validate_policy_file", "test_policy_against_action"),
+    "canonicalization": (
+        "canonicalize",
+        "canonicalize_action_payload",
+        "compute_request_hash",
+        "compute_hash",
+        "CanonicalizeError",
+    ),
+    "gate": (
+        "gate_decide",
+        "gate_decide_dict",
+        "replay_decision",
+        "replay_decisions",
+        "verify_request_hash",
+        "execute_if_allowed",
+        "find_action_by_provenance",
+        "enable_provenance_index",
+        "GateDecision",
+        "ReplayResult",
+        "ReplayReport",
+        "ProvenanceIndex",
+    ),
+    "policy": (
+        "Policy",
+        "PolicyRule",
+        "MatchCondition",
+        "RiskRule",
+        "RiskLevel",
+        "create_policy",
+    ),
+}
+
+_LAZY_ATTRS: dict[str, str] = {
+    name: module for module, names in _LAZY_IMPORTS.items() for name in names
+}
+
+# Submodules that share their name with the function they export.
+_SHADOWED_SUBMODULES = frozenset({"govern", "governed_tool"})
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        # Any real submodule (faramesh.client, faramesh.audit, ...) resolves
+        # as an attribute, as it did when the package imported them eagerly.
+        if name.startswith("__"):
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        try:
+            return importlib.import_module(f".{name}", __name__)
+        except ModuleNotFoundError as exc:
+            if exc.name != f"{__name__}.{name}":
+                raise
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+class _LazyPackage(types.ModuleType):
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Importing faramesh.govern (or faramesh.governed_tool) binds the
+        # submodule on the package; keep the same-named function as the public
+        # attribute, as the former eager imports did.
+        if name in _SHADOWED_SUBMODULES and isinstance(value, types.ModuleType):
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _LazyPackage
 
 __all__ = [
     # Configuration
     "configure",
     "ClientConfig",
+    "close_sessions",
     
     # Core functions
     "submit_action",
     "submit_actions",
     "submit_actions_bulk",
     "submit_and_wait",
+    "submit_stream",
     "block_until_approved",
     "get_action",
     "list_actions",
+    "iter_actions",
     "approve_action",
     "deny_action",
     "start_action",
@@ -151,21 +295,31 @@ __all__ = [
     "gate_decide",
     "gate_decide_dict",
     "replay_decision",
+    "replay_decisions",
     "verify_request_hash",
     "execute_if_allowed",
+    "find_action_by_provenance",
+    "enable_provenance_index",
     "GateDecision",
     "ReplayResult",
+    "ReplayReport",
+    "ProvenanceIndex",
     
     # Governance gate
     "govern",
     "GovernedToolSet",
     "ToolDeniedException",
+    "PendingToolCall",
+    "get_pending_call",
+    "pending_calls",
 
     # Decorators
     "governed_tool",
     
     # Utilities
     "ActionSnapshotStore",
+    "LiveActionView",
+    "SQLiteActionSnapshotStore",
     "get_default_store",
     
     # Exceptions
@@ -175,6 +329,7 @@ __all__ = [
     "FarameshPolicyError",
     "FarameshTimeoutError",
     "FarameshConnectionError",
+    "FarameshCircuitOpenError",
     "FarameshValidationError",
     "FarameshServerError",
     "FarameshBatchError",
@@ -194,6 +349,9 @@ __all__ = [
     "audit",
     "callbacks",
 
+    # Offline DPR reader
+    "dpr",
+
     # Version
     "__version__",
 ]
@@ -0,0 +1,262 @@
+"""Shared DEFER resolution for Faramesh tool wrappers.
+
+Internal module — used by :mod:`faramesh.autopatch` and the framework
+adapters while a deferred tool call waits for a human decision.
+
+Every pending defer token in the process is registered with one
+:class:`~faramesh._waiters.WaiterRegistry` per daemon socket, so a
+thousand parked approvals share one I/O thread and two connections:
+
+* a :class:`DeferListener` holding a single ``callback_subscribe`` stream,
+  which resolves waiters as soon as a ``defer_resolved`` event arrives;
+* a :class:`_DeferPoller` that checks every due token with pipelined
+  ``poll_defer`` requests over one persistent connection.
+
+Tokens are still checked once right after registering (closing the race
+with an approval that landed before the stream saw it) and re-checked at
+roughly the plain polling cadence as a safety net, since daemons older
+than the resolve-hook broadcast only push ``defer_resolved`` for SDK
+socket and CLI approvals. If the stream cannot be opened, tokens are
+polled with exponential backoff and the stream is retried periodically.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import socket as _socket
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any
+
+from ._subscription import CALLBACK_SUBSCRIBE, Subscription
+from ._waiters import WaiterRegistry
+
+logger = logging.getLogger("faramesh.defer")
+
+TERMINAL_STATUSES = frozenset({"approved", "denied", "expired"})
+
+# How long a failed stream connect is remembered before retrying.
+_STREAM_RETRY_SECONDS = 30.0
+
+
+class DeferListener:
+    """Feeds ``defer_resolved`` events from one shared stream into a registry."""
+
+    def __init__(self, socket_path: str, registry: WaiterRegistry, *, connect_timeout: float = 5.0):
+        self._socket_path = socket_path
+        self._registry = registry
+        self._connect_timeout = connect_timeout
+        self._lock = threading.Lock()
+        self._subscription: Subscription | None = None
+        self._retry_at = 0.0
+
+    @property
+    def active(self) -> bool:
+        """True while the lifecycle stream is connected."""
+        sub = self._subscription
+        return sub is not None and sub.active
+
+    def ensure_started(self) -> bool:
+        """Open the lifecycle stream if needed. Returns True when it is live.
+
+        Connect failures are remembered for a while so that a daemon without
+        the stream isn't asked again on every poll round.
+        """
+        if self.active:
+            return True
+        with self._lock:
+            if self.active:
+                return True
+            now = time.monotonic()
+            if now < self._retry_at:
+                return False
+            sub = Subscription(
+                self._on_event,
+                request_type=CALLBACK_SUBSCRIBE,
+                socket_path=self._socket_path,
+                connect_timeout=self._connect_timeout,
+            )
+            try:
+                sub.start()
+            except Exception as exc:
+                logger.debug("faramesh: defer stream unavailable (%s); polling instead", exc)
+                self._retry_at = now + _STREAM_RETRY_SECONDS
+                return False
+            self._subscription = sub
+            return True
+
+    def close(self) -> None:
+        with self._lock:
+            sub, self._subscription = self._subscription, None
+        if sub is not None:
+            sub.close()
+
+    def _on_event(self, event: dict[str, Any]) -> None:
+        if event.get("event_type") != "defer_resolved":
+            return
+        status = str(event.get("status") or "").strip().lower()
+        if status not in TERMINAL_STATUSES:
+            approved = event.get("approved")
+            if approved is None:
+                return
+            status = "approved" if approved else "denied"
+        self._registry.resolve(str(event.get("defer_token") or ""), status)
+
+
+def parse_poll_response(response: dict[str, Any]) -> str:
+    """Validate a ``poll_defer`` response and return its status."""
+    err = str(response.get("error") or "").strip()
+    if err:
+        raise RuntimeError(err)
+
+    status = str(response.get("status") or "pending").strip().lower()
+    if status not in {"pending", "approved", "denied", "expired"}:
+        raise RuntimeError(f"unexpected defer status: {status}")
+    return status
+
+
+class _DeferPoller:
+    """Batch ``poll_defer`` over one persistent daemon connection.
+
+    The daemon answers requests on a connection strictly in order, so
+    all due tokens are written at once and the responses read back in
+    the same order. Each response echoes its ``defer_token``; a response
+    for a different token means the stream is out of step, so it is
+    dropped and the connection reset before the next poll.
+    """
+
+    def __init__(self, socket_path: str, *, timeout: float = 5.0):
+        self._socket_path = socket_path
+        self._timeout = timeout
+        self._sock: _socket.socket | None = None
+        self._buf = b""
+
+    def __call__(self, due: dict[str, str]) -> dict[str, Any]:
+        tokens = list(due)
+        try:
+            responses = self._exchange(tokens, due)
+        except OSError:
+            # The daemon may have closed an idle connection; retry once fresh.
+            self.close()
+            responses = self._exchange(tokens, due)
+
+        resolved: dict[str, Any] = {}
+        for token, response in zip(tokens, responses):
+            echoed = response.get("defer_token")
+            if echoed is not None and str(echoed) != token:
+                logger.warning(
+                    "faramesh: poll_defer response for %r answered %r; resetting",
+                    echoed,
+                    token,
+                )
+                self.close()
+                continue
+            try:
+                status = parse_poll_response(response)
+            except RuntimeError as exc:
+                resolved[token] = exc
+                continue
+            if status in TERMINAL_STATUSES:
+                resolved[token] = status
+        return resolved
+
+    def close(self) -> None:
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            except OSError:
+                pass
+        self._sock = None
+        self._buf = b""
+
+    def _exchange(self, tokens: list[str], agents: dict[str, str]) -> list[dict[str, Any]]:
+        try:
+            return self._exchange_once(tokens, agents)
+        except BaseException:
+            # A partial read leaves the socket and buffer mid-stream.
+            self.close()
+            raise
+
+    def _exchange_once(
+        self, tokens: list[str], agents: dict[str, str]
+    ) -> list[dict[str, Any]]:
+        if self._sock is None:
+            sock = _socket.socket(_socket.AF_UNIX, _socket.SOCK_STREAM)
+            sock.settimeout(self._timeout)
+            try:
+                sock.connect(self._socket_path)
+            except OSError:
+                sock.close()
+                raise
+            self._sock = sock
+        request = b"".join(
+            json.dumps(
+                {"type": "poll_defer", "agent_id": agents[token], "defer_token": token}
+            ).encode("utf-8")
+            + b"\n"
+            for token in tokens
+        )
+        self._sock.sendall(request)
+
+        responses: list[dict[str, Any]] = []
+        while len(responses) < len(tokens):
+            while b"\n" not in self._buf:
+                chunk = self._sock.recv(65536)
+                if not chunk:
+                    raise ConnectionResetError("daemon closed the poll connection")
+                self._buf += chunk
+            line, self._buf = self._buf.split(b"\n", 1)
+            if line.strip():
+                responses.append(json.loads(line))
+        return responses
+
+
+_registries: dict[str, tuple[WaiterRegistry, DeferListener, _DeferPoller]] = {}
+_registries_lock = threading.Lock()
+
+
+def get_registry(
+    socket_path: str,
+    *,
+    poll_interval: float = 1.0,
+    max_poll_interval: float = 30.0,
+    recheck_interval: float = 2.0,
+) -> WaiterRegistry:
+    """Return the process-wide defer registry for ``socket_path``.
+
+    The interval settings apply when the registry is first created.
+    """
+    with _registries_lock:
+        entry = _registries.get(socket_path)
+        if entry is None:
+            poller = _DeferPoller(socket_path)
+            listener: DeferListener | None = None
+            registry = WaiterRegistry(
+                "defer",
+                poller,
+                poll_interval=poll_interval,
+                max_poll_interval=max_poll_interval,
+                push_active=lambda: listener is not None and listener.ensure_started(),
+                recheck_interval=recheck_interval,
+            )
+            listener = DeferListener(socket_path, registry)
+            entry = _registries[socket_path] = (registry, listener, poller)
+        return entry[0]
+
+
+def watch(defer_token: str, *, agent_id: str, socket_path: str, **intervals: float) -> Future:
+    """Register a pending defer token; the future yields its final status."""
+    return get_registry(socket_path, **intervals).watch(defer_token, context=agent_id)
+
+
+def close_all() -> None:
+    """Close every registry, stream and poll connection (cancels waiters)."""
+    with _registries_lock:
+        entries = list(_registries.values())
+        _registries.clear()
+    for registry, listener, poller in entries:
+        registry.close()
+        listener.close()
+        poller.close()
@@ -0,0 +1,120 @@
+"""Process-wide governance scope shared by every Faramesh tool wrapper.
+
+Internal module — used by :mod:`faramesh.autopatch`, the framework adapters
+and :class:`faramesh.GovernedToolSet`.
+
+A single logical tool call can cross several patched layers: a LangGraph
+``ToolNode`` dispatch wraps ``BaseTool.invoke``, which calls ``run``; a
+``GovernedToolSet`` tool may run inside an auto-patched framework. Each
+wrapper asks :func:`is_governed` before evaluating policy and brackets the
+underlying call with :func:`enter` / :func:`leave`, so the outermost layer
+evaluates the call and the inner layers pass straight through.
+
+Every layer describes a call with :func:`tool_identity`: the
+framework-visible tool name plus the underlying tool function, resolved
+through framework attributes (``func``, ``coroutine``, ``function``, ...)
+and ``functools.wraps`` chains. Two layers refer to the same call when
+either agrees, so a ``GovernedToolSet`` wrapper registered under its
+function name still matches the framework tool that carries a different
+name. Layers that know the tool call id pass it too; it only
+disambiguates when both layers know it. A different tool invoked from
+inside a governed tool is still governed. The scope lives in a ContextVar,
+so it is isolated per thread and per asyncio task.
+"""
+
+from __future__ import annotations
+
+import inspect
+from contextvars import ContextVar, Token
+from typing import Any, NamedTuple, Optional, Tuple, Union
+
+# Attributes frameworks use to hold the user function behind a tool object.
+_FUNCTION_ATTRS = ("func", "coroutine", "function", "fn", "_fn", "_func", "_tool_func")
+
+
+class ToolIdentity(NamedTuple):
+    """Canonical identity of a tool: its name and underlying callable."""
+
+    name: str
+    target: Any = None
+
+
+_CallKey = Tuple[ToolIdentity, Optional[str]]
+
+_ACTIVE_CALLS: ContextVar[Tuple[_CallKey, ...]] = ContextVar(
+    "faramesh_governed_calls", default=()
+)
+
+
+def _resolve_target(tool: Any) -> Any:
+    if tool is None:
+        return None
+    for attr in _FUNCTION_ATTRS:
+        value = getattr(tool, attr, None)
+        if callable(value):
+            tool = value
+            break
+    try:
+        return inspect.unwrap(tool)
+    except ValueError:
+        return tool
+
+
+def tool_identity(tool_name: Any, tool: Any = None) -> ToolIdentity:
+    """Build the identity every layer uses for ``tool_name`` backed by ``tool``.
+
+    ``tool`` may be a framework tool object or the callable being wrapped;
+    pass None when the layer only knows the name.
+    """
+    return ToolIdentity(str(tool_name), _resolve_target(tool))
+
+
+def _as_identity(tool: Union[ToolIdentity, str]) -> ToolIdentity:
+    if isinstance(tool, ToolIdentity):
+        return tool
+    return ToolIdentity(str(tool))
+
+
+def _same_target(a: Any, b: Any) -> bool:
+    if a is None or b is None:
+        return False
+    if a is b:
+        return True
+    # Bound methods are recreated on every attribute access.
+    return (
+        inspect.ismethod(a)
+        and inspect.ismethod(b)
+        and a.__self__ is b.__self__
+        and a.__func__ is b.__func__
+    )
+
+
+def is_governed(
+    tool: Union[ToolIdentity, str], tool_call_id: str | None = None
+) -> bool:
+    """Return True if an enclosing layer already governed this tool call.
+
+    Tool call ids only disambiguate when both layers know them; a layer
+    without an id matches any active call of the same tool.
+    """
+    ident = _as_identity(tool)
+    if tool_call_id is not None:
+        tool_call_id = str(tool_call_id)
+    for active, call_id in _ACTIVE_CALLS.get():
+        if active.name != ident.name and not _same_target(active.target, ident.target):
+            continue
+        if call_id is None or tool_call_id is None or call_id == tool_call_id:
+            return True
+    return False
+
+
+def enter(tool: Union[ToolIdentity, str], tool_call_id: str | None = None) -> Token:
+    """Mark a tool call as governed for the duration of the underlying call."""
+    if tool_call_id is not None:
+        tool_call_id = str(tool_call_id)
+    return _ACTIVE_CALLS.set(_ACTIVE_CALLS.get() + ((_as_identity(tool), tool_call_id),))
+
+
+def leave(token: Token) -> None:
+    """Close a scope opened by :func:`enter`."""
+    _ACTIVE_CALLS.reset(token)
@@ -0,0 +1,234 @@
+"""Retry pacing and circuit breaking shared by the Faramesh transports.
+
+Internal module — used by :mod:`faramesh.client` (REST calls) and
+:mod:`faramesh.transport` (daemon socket and remote evaluate). It only
+depends on the standard library so the transport layer stays cheap to
+import.
+
+Three pieces, each keyed by endpoint so every caller in the process
+shares them:
+
+* :class:`Backoff` — per-call decorrelated-jitter delays, so clients that
+  failed together do not retry together.
+* :class:`RetryBudget` — a token bucket capping how many retries the whole
+  process may send to one endpoint; once it is drained, calls fail on
+  their first error instead of multiplying load on a struggling server.
+* :class:`CircuitBreaker` — closed/open/half-open breaker that fails calls
+  fast with :class:`CircuitOpenError` while an endpoint is down and lets a
+  single probe through once ``reset_timeout`` has passed.
+
+Defaults can be tuned with ``FARAMESH_RETRY_BUDGET`` (bucket size),
+``FARAMESH_RETRY_BUDGET_REFILL`` (tokens per second),
+``FARAMESH_BREAKER_THRESHOLD`` (consecutive failures that open the
+breaker; 0 disables it) and ``FARAMESH_BREAKER_RESET_SECONDS``.
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import threading
+import time
+from collections.abc import Hashable
+from typing import Optional
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Never sleep longer than this for a single Retry-After hint.
+MAX_RETRY_AFTER_SECONDS = 60.0
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling an endpoint whose breaker is open."""
+
+    def __init__(self, name: str, retry_in: float):
+        super().__init__(f"circuit open for {name}; retry in {retry_in:.1f}s")
+        self.name = name
+        self.retry_in = retry_in
+
+
+class Backoff:
+    """Decorrelated-jitter delays: ``uniform(base, previous * 3)``, capped."""
+
+    __slots__ = ("base", "cap", "_previous")
+
+    def __init__(self, base: float, cap: float = 30.0):
+        self.base = max(0.0, base)
+        self.cap = max(self.base, cap)
+        self._previous = self.base
+
+    def next(self) -> float:
+        if self.base <= 0:
+            return 0.0
+        delay = min(self.cap, random.uniform(self.base, self._previous * 3))
+        self._previous = delay
+        return delay
+
+
+class RetryBudget:
+    """Token bucket shared by every retry sent to one endpoint.
+
+    First attempts are free; each retry spends one token. Tokens refill at
+    ``refill_rate`` per second up to ``capacity``.
+    """
+
+    def __init__(self, capacity: float = 10.0, refill_rate: float = 1.0):
+        self.capacity = max(0.0, capacity)
+        self.refill_rate = max(0.0, refill_rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self) -> float:
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    def try_acquire(self) -> bool:
+        """Spend one token for a retry. False when the budget is exhausted."""
+        with self._lock:
+            self._refill()
+            if self._tokens < 1.0:
+                return False
+            self._tokens -= 1.0
+            return True
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.refill_rate)
+        self._updated = now
+
+
+class CircuitBreaker:
+    """Closed/open/half-open breaker for one endpoint.
+
+    ``failure_threshold`` consecutive failures open the breaker. While open,
+    :meth:`before_call` raises :class:`CircuitOpenError` without touching the
+    network. After ``reset_timeout`` seconds it goes half-open and admits one
+    probe: success closes it, failure opens it again. A probe that never
+    reports back is replaced after another ``reset_timeout``.
+    """
+
+    def __init__(self, name: str, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_started: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+                return HALF_OPEN
+            return self._state
+
+    def before_call(self) -> None:
+        """Admit a call or raise :class:`CircuitOpenError`."""
+        if self.failure_threshold <= 0:
+            return
+        with self._lock:
+            if self._state == CLOSED:
+                return
+            now = time.monotonic()
+            if self._state == OPEN:
+                remaining = self.reset_timeout - (now - self._opened_at)
+                if remaining > 0:
+                    raise CircuitOpenError(self.name, remaining)
+                self._state = HALF_OPEN
+                self._probe_started = None
+            probe_started = self._probe_started
+            if probe_started is not None and now - probe_started < self.reset_timeout:
+                raise CircuitOpenError(self.name, self.reset_timeout - (now - probe_started))
+            self._probe_started = now
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._state = CLOSED
+            self._failures = 0
+            self._probe_started = None
+
+    def record_failure(self) -> None:
+        if self.failure_threshold <= 0:
+            return
+        with self._lock:
+            self._failures += 1
+            if self._state == HALF_OPEN or self._failures >= self.failure_threshold:
+                self._state = OPEN
+                self._opened_at = time.monotonic()
+                self._probe_started = None
+
+    def reset(self) -> None:
+        self.record_success()
+
+
+_breakers: dict[Hashable, CircuitBreaker] = {}
+_budgets: dict[Hashable, RetryBudget] = {}
+_registry_lock = threading.Lock()
+
+
+def get_breaker(key: Hashable) -> CircuitBreaker:
+    """Process-wide breaker for ``key`` (e.g. a base URL or socket path)."""
+    with _registry_lock:
+        breaker = _breakers.get(key)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                str(key),
+                failure_threshold=int(_env_float("FARAMESH_BREAKER_THRESHOLD", 5)),
+                reset_timeout=_env_float("FARAMESH_BREAKER_RESET_SECONDS", 30.0),
+            )
+            _breakers[key] = breaker
+        return breaker
+
+
+def get_budget(key: Hashable) -> RetryBudget:
+    """Process-wide retry budget for ``key``."""
+    with _registry_lock:
+        budget = _budgets.get(key)
+        if budget is None:
+            budget = RetryBudget(
+                capacity=_env_float("FARAMESH_RETRY_BUDGET", 10.0),
+                refill_rate=_env_float("FARAMESH_RETRY_BUDGET_REFILL", 1.0),
+            )
+            _budgets[key] = budget
+        return budget
+
+
+def reset_all() -> None:
+    """Forget every breaker and budget (tests, or after reconfiguration)."""
+    with _registry_lock:
+        _breakers.clear()
+        _budgets.clear()
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a ``Retry-After`` header (delta or HTTP date)."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        seconds = float(value)
+    except ValueError:
+        import email.utils
+
+        try:
+            when = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when is None:
+            return None
+        seconds = when.timestamp() - time.time()
+    return min(max(0.0, seconds), MAX_RETRY_AFTER_SECONDS)
@@ -9,57 +9,342 @@ newline-delimited JSON request of a known ``type`` (``audit_subscribe``
 or ``callback_subscribe``), wait for a ``{"subscribed": true, ...}``
 confirmation, then read newline-delimited JSON events on a background
 thread until the consumer closes the subscription.
+
+The daemon numbers each stream's events with a monotonic ``seq`` and keeps
+a bounded replay window. With ``reconnect=True`` a dropped connection is
+re-established with jittered backoff and resumed with ``since_seq`` so
+the gap is replayed; sequence gaps that could not be replayed are counted
+as ``missed`` rather than passing silently.
+
+The reader thread only decodes and enqueues. Callbacks run on separate
+worker threads (or on an asyncio event loop) fed from a bounded queue, so
+a slow callback does not stall the socket and push the daemon into
+dropping events on its side. What happens when the queue itself fills up
+is the subscription's ``overflow`` policy.
 """
 
 from __future__ import annotations
 
+import concurrent.futures
+import inspect
 import json
 import logging
 import os
 import socket as _socket
+import tempfile
 import threading
+import time
+from collections import deque
 from collections.abc import Callable
-from typing import Any
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Tuple
+
+from ._retry import Backoff
+
+if TYPE_CHECKING:
+    import asyncio
 
 logger = logging.getLogger("faramesh.subscription")
 
 AUDIT_SUBSCRIBE = "audit_subscribe"
 CALLBACK_SUBSCRIBE = "callback_subscribe"
 
+# Overflow policies for the in-process event queue.
+OVERFLOW_BLOCK = "block"
+OVERFLOW_DROP_OLDEST = "drop_oldest"
+OVERFLOW_SPILL = "spill"
+_OVERFLOW_POLICIES = (OVERFLOW_BLOCK, OVERFLOW_DROP_OLDEST, OVERFLOW_SPILL)
+
+_Item = Tuple[float, Any]  # (monotonic enqueue time, event)
+
+_RECV_SIZE = 65536
+
+
+def _decode_lines(data: bytes) -> list[dict[str, Any]]:
+    """Decode a run of complete newline-delimited JSON objects.
+
+    Everything one ``recv`` delivered is parsed with a single ``json.loads``
+    of the lines joined into an array; only when that fails (a malformed
+    line) does it fall back to decoding line by line and skipping the bad
+    ones.
+    """
+    lines = [line for line in data.split(b"\n") if line.strip()]
+    if not lines:
+        return []
+    try:
+        events = json.loads(b"[" + b",".join(lines) + b"]")
+    except json.JSONDecodeError:
+        events = []
+        for line in lines:
+            try:
+                events.append(json.loads(line))
+            except json.JSONDecodeError as exc:
+                logger.warning("Skipping malformed event: %s", exc)
+    return [event for event in events if isinstance(event, dict)]
+
 
 def default_socket_path() -> str:
     """Resolve the daemon socket path. Matches autopatch.py's convention."""
     return os.environ.get("FARAMESH_SOCKET", "/tmp/faramesh.sock")
 
 
+@dataclass
+class SubscriptionStats:
+    """Point-in-time counters for one subscription.
+
+    ``queued`` is the current backlog between the socket reader and the
+    callbacks (including events spilled to disk), and ``lag_seconds`` the
+    age of the oldest of them. ``dropped`` counts events discarded by the
+    ``drop_oldest`` policy or left undelivered at close. ``missed`` counts
+    events the daemon sequenced but this subscriber never received (seq
+    gaps, or a reconnect gap longer than the daemon's replay window), and
+    ``reconnects`` how often the stream was re-established.
+    """
+
+    received: int = 0
+    delivered: int = 0
+    errors: int = 0
+    dropped: int = 0
+    spilled: int = 0
+    queued: int = 0
+    max_queued: int = 0
+    lag_seconds: float = 0.0
+    missed: int = 0
+    reconnects: int = 0
+
+
+class _EventQueue:
+    """Bounded FIFO between the socket reader and the dispatch workers.
+
+    Full-queue behaviour follows ``overflow``: ``block`` makes the reader
+    wait (backpressure reaches the daemon's own per-subscriber buffer),
+    ``drop_oldest`` discards the oldest queued event, and ``spill`` appends
+    to an unbounded temporary file that is read back, in order, once the
+    in-memory queue has drained.
+    """
+
+    def __init__(self, maxsize: int, overflow: str, spill_dir: str | None = None):
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self._spill_dir = spill_dir
+        self._items: deque[_Item] = deque()
+        self._cond = threading.Condition()
+        self._closed = False
+        self._spill: Any = None
+        self._spill_read = 0
+        self._spill_count = 0
+        self.dropped = 0
+        self.spilled = 0
+        self.max_queued = 0
+
+    def __len__(self) -> int:
+        return len(self._items) + self._spill_count
+
+    def put(self, event: Any) -> None:
+        self.put_many((event,))
+
+    def put_many(self, events: Any) -> None:
+        """Enqueue events in order under one lock acquisition."""
+        now = time.monotonic()
+        with self._cond:
+            for event in events:
+                if self._closed:
+                    return
+                self._put_locked((now, event))
+            self.max_queued = max(self.max_queued, len(self))
+            self._cond.notify_all()
+
+    def _put_locked(self, item: _Item) -> None:
+        if self._spill_count or len(self._items) >= self.maxsize:
+            if self.overflow == OVERFLOW_SPILL:
+                self._spill_write(item)
+            elif self.overflow == OVERFLOW_DROP_OLDEST:
+                self._items.popleft()
+                self._items.append(item)
+                self.dropped += 1
+            else:
+                self._cond.notify_all()  # wake workers for what is queued so far
+                while len(self._items) >= self.maxsize and not self._closed:
+                    self._cond.wait()
+                if not self._closed:
+                    self._items.append(item)
+        else:
+            self._items.append(item)
+
+    def get(self) -> _Item | None:
+        """Next item, blocking while empty. None once closed and drained."""
+        with self._cond:
+            while not self._items:
+                if self._spill_count:
+                    self._spill_refill()
+                    break
+                if self._closed:
+                    return None
+                self._cond.wait()
+            item = self._items.popleft()
+            self._cond.notify_all()
+            return item
+
+    def get_batch(self, size: int, max_wait: float) -> list[_Item] | None:
+        """Up to ``size`` items, waiting at most ``max_wait`` seconds past the
+        oldest one's enqueue time for the batch to fill. None once closed
+        and drained."""
+        with self._cond:
+            while not self._items and not self._spill_count:
+                if self._closed:
+                    return None
+                self._cond.wait()
+            if not self._items:
+                self._spill_refill()
+            deadline = self._items[0][0] + max_wait
+            while len(self) < size and not self._closed:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            batch: list[_Item] = []
+            while len(batch) < size:
+                if not self._items:
+                    if not self._spill_count:
+                        break
+                    self._spill_refill()
+                batch.append(self._items.popleft())
+            self._cond.notify_all()
+            return batch
+
+    def lag(self) -> float:
+        with self._cond:
+            return time.monotonic() - self._items[0][0] if self._items else 0.0
+
+    def close(self) -> None:
+        """Refuse further puts; get() drains what is queued, then returns None."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def discard(self) -> int:
+        """Drop everything still queued. Returns how many events that was."""
+        with self._cond:
+            count = len(self)
+            self._items.clear()
+            self._spill_count = 0
+            if self._spill is not None:
+                self._spill.close()
+                self._spill = None
+            self.dropped += count
+            self._closed = True
+            self._cond.notify_all()
+            return count
+
+    def _spill_write(self, item: _Item) -> None:
+        if self._spill is None:
+            self._spill = tempfile.TemporaryFile(dir=self._spill_dir, prefix="faramesh-spill-")
+            self._spill_read = 0
+        self._spill.seek(0, os.SEEK_END)
+        self._spill.write(json.dumps(item, separators=(",", ":")).encode("utf-8") + b"\n")
+        self._spill_count += 1
+        self.spilled += 1
+
+    def _spill_refill(self) -> None:
+        # Only called with the memory queue empty, so order is preserved.
+        spill = self._spill
+        spill.seek(self._spill_read)
+        while self._spill_count and len(self._items) < self.maxsize:
+            enqueued, event = json.loads(spill.readline())
+            self._items.append((enqueued, event))
+            self._spill_count -= 1
+        self._spill_read = spill.tell()
+        if not self._spill_count:
+            spill.seek(0)
+            spill.truncate()
+            self._spill_read = 0
+
+
 class Subscription:
     """Handle for an active subscription to one of the daemon's streams.
 
     Constructed via :func:`faramesh.audit.subscribe` (decisions) or
     :func:`faramesh.callbacks.subscribe` (lifecycle). Use as a context
     manager (preferred) or call ``close()`` explicitly.
+
+    With ``workers=1`` (the default) callbacks see events in stream order;
+    more workers deliver concurrently and give up ordering. ``stats``
+    reports how far dispatch is behind the socket. With ``batch_size`` the
+    callback receives lists of up to that many events instead of one dict
+    per call, and no event waits longer than ``max_latency_ms`` for its
+    batch to fill.
+
+    With ``reconnect=True`` the subscription survives daemon restarts and
+    dropped sockets: it stays ``active`` while re-establishing the stream
+    and resumes from the last ``seq`` it saw.
     """
 
     def __init__(
         self,
-        callback: Callable[[dict[str, Any]], None],
+        callback: Callable[[Any], Any],
         *,
         request_type: str,
         agent_id: str | None = None,
         socket_path: str | None = None,
         connect_timeout: float = 5.0,
+        queue_size: int = 1024,
+        overflow: str = OVERFLOW_BLOCK,
+        workers: int = 1,
+        loop: asyncio.AbstractEventLoop | None = None,
+        spill_dir: str | None = None,
+        reconnect: bool = False,
+        reconnect_delay: float = 0.5,
+        max_reconnect_delay: float = 30.0,
+        batch_size: int | None = None,
+        max_latency_ms: float = 100.0,
     ):
+        if overflow not in _OVERFLOW_POLICIES:
+            raise ValueError(
+                f"overflow must be one of {', '.join(_OVERFLOW_POLICIES)}, got {overflow!r}"
+            )
+        if queue_size < 1 or workers < 1:
+            raise ValueError("queue_size and workers must be at least 1")
+        if batch_size is not None and batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if loop is None and inspect.iscoroutinefunction(callback):
+            import asyncio
+
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                raise ValueError(
+                    "coroutine callbacks need loop= or a running event loop"
+                ) from None
+
         self._callback = callback
         self._request_type = request_type
         self._agent_id = agent_id
         self._socket_path = socket_path or default_socket_path()
         self._connect_timeout = connect_timeout
+        self._loop = loop
+        self._workers = workers
+        self._batch_size = batch_size
+        self._max_latency = max(0.0, max_latency_ms) / 1000.0
+        self._reconnect = reconnect
+        self._reconnect_delay = reconnect_delay
+        self._max_reconnect_delay = max_reconnect_delay
 
         self._sock: _socket.socket | None = None
         self._thread: threading.Thread | None = None
+        self._worker_threads: list[threading.Thread] = []
+        self._queue = _EventQueue(queue_size, overflow, spill_dir)
         self._stop = threading.Event()
         self._ready = threading.Event()
         self._start_error: Exception | None = None
+        self._received = 0
+        self._delivered = 0
+        self._errors = 0
+        self._count_lock = threading.Lock()
+        self._connected = False
+        self._last_seq: int | None = None
+        self._epoch: str | None = None
+        self._missed = 0
+        self._reconnects = 0
 
     def __enter__(self) -> "Subscription":
         return self
@@ -67,6 +352,48 @@ class Subscription:
     def __exit__(self, *exc: Any) -> None:
         self.close()
 
+    @property
+    def active(self) -> bool:
+        """True while the background reader is running (and, with
+        ``reconnect=True``, while it is re-establishing the stream)."""
+        thread = self._thread
+        return thread is not None and thread.is_alive() and not self._stop.is_set()
+
+    @property
+    def connected(self) -> bool:
+        """True while the stream is confirmed and being read."""
+        return self._connected and self.active
+
+    @property
+    def last_seq(self) -> int | None:
+        """Sequence number of the last event read (None before the first,
+        or when the daemon does not number its events)."""
+        return self._last_seq
+
+    @property
+    def epoch(self) -> str | None:
+        """The daemon run that ``last_seq`` belongs to."""
+        return self._epoch
+
+    @property
+    def stats(self) -> SubscriptionStats:
+        """Delivery counters: received, delivered, dropped, current lag."""
+        q = self._queue
+        with self._count_lock:
+            received, delivered, errors = self._received, self._delivered, self._errors
+        return SubscriptionStats(
+            received=received,
+            delivered=delivered,
+            errors=errors,
+            dropped=q.dropped,
+            spilled=q.spilled,
+            queued=len(q),
+            max_queued=q.max_queued,
+            lag_seconds=q.lag(),
+            missed=self._missed,
+            reconnects=self._reconnects,
+        )
+
     def start(self) -> None:
         """Open the socket, send the subscribe request, and start the read loop.
 
@@ -74,6 +401,39 @@ class Subscription:
         (or the connect/handshake fails), so that errors surface immediately
         rather than from the background thread.
         """
+        self._sock = self._open()
+        name = f"faramesh-{self._request_type.replace('_', '-')}"
+        self._worker_threads = [
+            threading.Thread(target=self._work, name=f"{name}-worker-{i}", daemon=True)
+            for i in range(self._workers)
+        ]
+        for worker in self._worker_threads:
+            worker.start()
+        self._thread = threading.Thread(
+            target=self._run,
+            name=name,
+            daemon=True,
+        )
+        self._thread.start()
+
+        # Wait for the subscription confirmation (or an error from _run)
+        if not self._ready.wait(timeout=self._connect_timeout):
+            self.close()
+            raise TimeoutError(
+                "Did not receive subscription confirmation from Faramesh daemon"
+            )
+        if self._start_error is not None:
+            err = self._start_error
+            self.close()
+            raise err
+
+    def _open(self) -> _socket.socket:
+        """Connect and send the subscribe request (resuming when possible).
+
+        The socket keeps ``connect_timeout`` as its read timeout until the
+        confirmation arrives, so a daemon that accepts but never confirms
+        does not wedge a reconnect.
+        """
         sock = _socket.socket(_socket.AF_UNIX, _socket.SOCK_STREAM)
         try:
             sock.settimeout(self._connect_timeout)
@@ -89,6 +449,10 @@ class Subscription:
         payload: dict[str, Any] = {"type": self._request_type}
         if self._request_type == AUDIT_SUBSCRIBE:
             payload["agent_id"] = self._agent_id or ""
+        if self._last_seq is not None:
+            payload["since_seq"] = self._last_seq
+            if self._epoch:
+                payload["epoch"] = self._epoch
         request = json.dumps(payload).encode("utf-8") + b"\n"
         try:
             sock.sendall(request)
@@ -97,30 +461,17 @@ class Subscription:
             raise ConnectionError(
                 f"Failed to send {self._request_type} request: {exc}"
             ) from exc
+        return sock
 
-        sock.settimeout(None)  # blocking mode for the long-lived stream
-        self._sock = sock
-        self._thread = threading.Thread(
-            target=self._run,
-            name=f"faramesh-{self._request_type.replace('_', '-')}",
-            daemon=True,
-        )
-        self._thread.start()
-
-        # Wait for the subscription confirmation (or an error from _run)
-        if not self._ready.wait(timeout=self._connect_timeout):
-            self.close()
-            raise TimeoutError(
-                "Did not receive subscription confirmation from Faramesh daemon"
-            )
-        if self._start_error is not None:
-            err = self._start_error
-            self.close()
-            raise err
+    def close(self, drain_timeout: float = 2.0) -> None:
+        """Stop the read loop and close the socket. Safe to call multiple times.
 
-    def close(self) -> None:
-        """Stop the read loop and close the socket. Safe to call multiple times."""
+        Events already queued are still delivered for up to
+        ``drain_timeout`` seconds; whatever is left after that is discarded
+        and counted in ``stats.dropped``.
+        """
         self._stop.set()
+        self._queue.close()
         if self._sock is not None:
             try:
                 self._sock.shutdown(_socket.SHUT_RDWR)
@@ -135,55 +486,87 @@ class Subscription:
             self._thread.join(timeout=2.0)
         self._thread = None
 
+        deadline = time.monotonic() + drain_timeout
+        for worker in self._worker_threads:
+            worker.join(timeout=max(0.0, deadline - time.monotonic()))
+        if any(worker.is_alive() for worker in self._worker_threads):
+            dropped = self._queue.discard()
+            if dropped:
+                logger.warning("Subscription closed with %d undelivered events", dropped)
+        self._worker_threads = []
+
+    def _work(self) -> None:
+        """Worker thread: take queued events and invoke the callback."""
+        while True:
+            if self._batch_size is None:
+                item = self._queue.get()
+                if item is None:
+                    return
+                payload: Any = item[1]
+                count = 1
+            else:
+                batch = self._queue.get_batch(self._batch_size, self._max_latency)
+                if batch is None:
+                    return
+                payload = [event for _, event in batch]
+                count = len(payload)
+            try:
+                if self._loop is not None:
+                    self._deliver_on_loop(payload)
+                else:
+                    self._callback(payload)
+            except Exception:
+                with self._count_lock:
+                    self._errors += 1
+                logger.exception("Subscription callback raised; stream continuing")
+            else:
+                with self._count_lock:
+                    self._delivered += count
+
+    def _deliver_on_loop(self, payload: Any) -> None:
+        import asyncio
+
+        future = asyncio.run_coroutine_threadsafe(self._call_async(payload), self._loop)
+        while True:
+            try:
+                return future.result(timeout=0.1)
+            except concurrent.futures.TimeoutError:
+                if self._loop.is_closed():
+                    future.cancel()
+                    raise RuntimeError("event loop closed before the callback finished")
+
+    async def _call_async(self, payload: Any) -> None:
+        result = self._callback(payload)
+        if inspect.isawaitable(result):
+            await result
+
     def _run(self) -> None:
-        """Background thread: read newline-delimited JSON events, invoke callback."""
-        assert self._sock is not None
+        """Background thread: read the stream, reconnecting if configured."""
+        backoff = Backoff(self._reconnect_delay, cap=self._max_reconnect_delay)
         sock = self._sock
-        buf = b""
-        confirmed = False
-
         try:
-            while not self._stop.is_set():
+            while True:
+                if sock is not None:
+                    if self._read_stream(sock):
+                        backoff = Backoff(self._reconnect_delay, cap=self._max_reconnect_delay)
+                    self._connected = False
+                    sock.close()
+                if self._stop.is_set() or not self._reconnect or not self._ready.is_set():
+                    return
+                if self._start_error is not None:
+                    return
+                if self._stop.wait(backoff.next()):
+                    return
                 try:
-                    chunk = sock.recv(4096)
-                except OSError:
-                    break
-                if not chunk:
-                    break
-                buf += chunk
-
-                while b"\n" in buf:
-                    line, buf = buf.split(b"\n", 1)
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        event = json.loads(line)
-                    except json.JSONDecodeError as exc:
-                        logger.warning("Skipping malformed event: %s", exc)
-                        continue
-
-                    if not confirmed:
-                        confirmed = True
-                        if event.get("subscribed") is True:
-                            self._ready.set()
-                            continue
-                        self._start_error = RuntimeError(
-                            f"Unexpected handshake response: {event}"
-                        )
-                        self._ready.set()
-                        return
-
-                    # Client-side agent_id filter (daemon does not filter)
-                    if self._agent_id and event.get("agent_id") != self._agent_id:
-                        continue
-
-                    try:
-                        self._callback(event)
-                    except Exception:
-                        logger.exception(
-                            "Subscription callback raised; stream continuing"
-                        )
+                    sock = self._open()
+                except ConnectionError as exc:
+                    logger.debug("Resubscribe to %s failed: %s", self._request_type, exc)
+                    sock = None
+                    continue
+                self._sock = sock
+                if self._stop.is_set():
+                    sock.close()
+                    return
         finally:
             # Unblock start() if we exited before confirmation
             if not self._ready.is_set():
@@ -192,3 +575,96 @@ class Subscription:
                         "Subscription stream ended before confirmation"
                     )
                 self._ready.set()
+
+    def _read_stream(self, sock: _socket.socket) -> bool:
+        """Read one connection until it ends. True if it was confirmed."""
+        buf = b""
+        confirmed = False
+        while not self._stop.is_set():
+            try:
+                chunk = sock.recv(_RECV_SIZE)
+            except OSError:
+                break
+            if not chunk:
+                break
+            complete, sep, buf = (buf + chunk).rpartition(b"\n")
+            if not sep:
+                buf = complete
+                continue
+
+            accepted = []
+            for event in _decode_lines(complete):
+                if not confirmed:
+                    if event.get("subscribed") is not True:
+                        if not self._ready.is_set():
+                            self._start_error = RuntimeError(
+                                f"Unexpected handshake response: {event}"
+                            )
+                            self._ready.set()
+                        else:
+                            logger.warning("Unexpected resubscribe response: %s", event)
+                        return False
+                    confirmed = True
+                    sock.settimeout(None)  # blocking mode for the long-lived stream
+                    self._confirmed(event)
+                    continue
+
+                if not self._in_sequence(event.get("seq")):
+                    continue
+
+                # Client-side agent_id filter (daemon does not filter)
+                if self._agent_id and event.get("agent_id") != self._agent_id:
+                    continue
+                accepted.append(event)
+
+            if accepted:
+                with self._count_lock:
+                    self._received += len(accepted)
+                self._queue.put_many(accepted)
+        return confirmed
+
+    def _confirmed(self, ack: dict[str, Any]) -> None:
+        """Record where the (re)subscribed stream starts."""
+        resumed = self._ready.is_set()
+        epoch = ack.get("epoch")
+        if resumed:
+            self._reconnects += 1
+            if ack.get("epoch_changed") or (self._epoch and epoch != self._epoch):
+                logger.warning(
+                    "Faramesh daemon restarted; events from before the restart "
+                    "that were not yet received are lost"
+                )
+                self._last_seq = None
+            missed = int(ack.get("missed") or 0)
+            if missed:
+                self._missed += missed
+                logger.warning(
+                    "%s resumed with %d events beyond the daemon's replay window",
+                    self._request_type, missed,
+                )
+            if "replayed" not in ack:
+                # Daemon without replay support: numbering restarts live.
+                self._last_seq = None
+        else:
+            seq = ack.get("seq")
+            self._last_seq = seq if isinstance(seq, int) else None
+        self._epoch = epoch if isinstance(epoch, str) else None
+        self._connected = True
+        self._ready.set()
+
+    def _in_sequence(self, seq: Any) -> bool:
+        """Track ``seq``: count gaps, and reject events already read."""
+        if not isinstance(seq, int):
+            return True
+        last = self._last_seq
+        if last is not None:
+            if seq <= last:
+                return False
+            if seq > last + 1:
+                self._missed += seq - last - 1
+                logger.warning(
+                    "%s skipped %d events (seq %d -> %d)",
+                    self._request_type, seq - last - 1, last, seq,
+                )
+        self._last_seq = seq
+        return True
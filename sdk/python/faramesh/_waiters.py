@@ -0,0 +1,241 @@
+"""Process-wide waiter registry for Faramesh approvals and completions.
+
+Internal module — used by :mod:`faramesh._defer` (DEFER tokens on the
+daemon socket) and :mod:`faramesh.client` (REST action ids).
+
+Every caller that waits on an outside decision registers a key and gets
+a :class:`concurrent.futures.Future` back. Sync callers block on
+``future.result(timeout)``; asyncio callers await
+``asyncio.wrap_future(future)``. One I/O thread per registry serves all
+outstanding keys: it checks every due key in a single batch, and a push
+source (a subscription stream) can resolve keys directly through
+:meth:`WaiterRegistry.resolve` (or ask for an early check through
+:meth:`WaiterRegistry.check_soon`). Thousands of parked waiters therefore
+cost one thread and one batch check per interval instead of one polling
+loop each.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable, Hashable, Iterable
+from concurrent import futures
+from concurrent.futures import Future
+from typing import Any
+
+logger = logging.getLogger("faramesh.waiters")
+
+# check(keys) receives {key: context} for every due key and returns
+# {key: value} for the keys that resolved. A value that is an exception
+# instance fails that key's futures instead of resolving them.
+CheckFn = Callable[[dict[Hashable, Any]], dict[Hashable, Any]]
+
+
+class _Entry:
+    __slots__ = ("futures", "context", "next_check", "recheck", "delay", "max_delay")
+
+    def __init__(self, context: Any, delay: float, max_delay: float) -> None:
+        self.futures: list[Future] = []
+        self.context = context
+        self.next_check = 0.0
+        self.recheck = True
+        self.delay = delay
+        self.max_delay = max_delay
+
+
+class WaiterRegistry:
+    """Map keys to futures and resolve them from one background thread.
+
+    Args:
+        name: Thread name suffix, for debugging.
+        check: Batch status check run on the I/O thread (see ``CheckFn``).
+        poll_interval: Default delay before re-checking a pending key.
+        max_poll_interval: Default cap for the exponentially growing delay.
+        push_active: Returns True while a push source is resolving keys;
+            pending keys are then only re-checked every ``recheck_interval``.
+        recheck_interval: Safety re-check interval while pushes are active;
+            kept short so a missed push costs seconds, not minutes.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        check: CheckFn,
+        *,
+        poll_interval: float = 1.0,
+        max_poll_interval: float = 30.0,
+        push_active: Callable[[], bool] | None = None,
+        recheck_interval: float = 2.0,
+    ):
+        self._name = name
+        self._check = check
+        self._poll_interval = poll_interval
+        self._max_poll_interval = max_poll_interval
+        self._push_active = push_active
+        self._recheck_interval = recheck_interval
+
+        self._entries: dict[Hashable, _Entry] = {}
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._closed = False
+
+    def __len__(self) -> int:
+        with self._cond:
+            return len(self._entries)
+
+    def watch(
+        self,
+        key: Hashable,
+        *,
+        context: Any = None,
+        poll_interval: float | None = None,
+        max_poll_interval: float | None = None,
+    ) -> Future:
+        """Register interest in ``key`` and return a future for its value.
+
+        The key is checked right away, which closes the race with a
+        resolution that happened before registration. Cancel the future
+        (or let a timeout cancel it) to stop waiting.
+        """
+        future: Future = Future()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError(f"faramesh {self._name} waiter registry is closed")
+            entry = self._entries.get(key)
+            if entry is None:
+                delay = self._poll_interval if poll_interval is None else poll_interval
+                cap = self._max_poll_interval if max_poll_interval is None else max_poll_interval
+                entry = self._entries[key] = _Entry(context, delay, max(cap, delay))
+            entry.futures.append(future)
+            entry.next_check = 0.0
+            entry.recheck = True
+            self._ensure_thread()
+            self._cond.notify()
+        future.add_done_callback(lambda f: self._discard(key, f))
+        return future
+
+    def wait(self, key: Hashable, timeout: float | None = None, **kwargs: Any) -> Any:
+        """Block until ``key`` resolves. Raises TimeoutError after ``timeout``."""
+        future = self.watch(key, **kwargs)
+        try:
+            return future.result(timeout)
+        except futures.TimeoutError:
+            future.cancel()
+            raise TimeoutError(f"timed out waiting for {key!r}") from None
+
+    def resolve(self, key: Hashable, value: Any) -> bool:
+        """Resolve every waiter on ``key`` (push sources call this).
+
+        Returns True if anyone was waiting.
+        """
+        with self._cond:
+            entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        _settle(entry.futures, value)
+        return True
+
+    def check_soon(self, keys: Iterable[Hashable]) -> None:
+        """Check the given keys on the next round (push hints without a value)."""
+        with self._cond:
+            woke = False
+            for key in keys:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    entry.next_check = 0.0
+                    entry.recheck = True
+                    woke = True
+            if woke:
+                self._cond.notify()
+
+    def close(self) -> None:
+        """Stop the I/O thread and cancel every outstanding waiter."""
+        with self._cond:
+            self._closed = True
+            entries = list(self._entries.values())
+            self._entries.clear()
+            self._cond.notify()
+        for entry in entries:
+            for future in entry.futures:
+                future.cancel()
+
+    def _discard(self, key: Hashable, future: Future) -> None:
+        with self._cond:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            try:
+                entry.futures.remove(future)
+            except ValueError:
+                return
+            if not entry.futures:
+                del self._entries[key]
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name=f"faramesh-{self._name}-waiters", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._closed:
+                    now = time.monotonic()
+                    due = {k: e.context for k, e in self._entries.items() if e.next_check <= now}
+                    if due:
+                        for key in due:
+                            self._entries[key].recheck = False
+                        break
+                    wake = min((e.next_check for e in self._entries.values()), default=None)
+                    self._cond.wait(None if wake is None else wake - now)
+                if self._closed:
+                    return
+
+            pushing = False
+            if self._push_active is not None:
+                try:
+                    pushing = self._push_active()
+                except Exception:
+                    logger.debug("faramesh: %s push source check failed", self._name, exc_info=True)
+            try:
+                resolved = self._check(due)
+            except Exception:
+                logger.warning("faramesh: %s status check failed; retrying", self._name, exc_info=True)
+                resolved = {}
+
+            now = time.monotonic()
+            settled: list[tuple[list[Future], Any]] = []
+            with self._cond:
+                for key in due:
+                    entry = self._entries.get(key)
+                    if entry is None:
+                        continue
+                    if key in resolved:
+                        del self._entries[key]
+                        settled.append((entry.futures, resolved[key]))
+                    elif entry.recheck:
+                        continue  # a new waiter registered mid-check; check again now
+                    elif pushing:
+                        entry.next_check = now + self._recheck_interval
+                    else:
+                        entry.next_check = now + entry.delay
+                        entry.delay = min(entry.delay * 2, entry.max_delay)
+            for waiting, value in settled:
+                _settle(waiting, value)
+
+
+def _settle(futures: list[Future], value: Any) -> None:
+    for future in list(futures):
+        if future.done():
+            continue
+        try:
+            if isinstance(value, BaseException):
+                future.set_exception(value)
+            else:
+                future.set_result(value)
+        except Exception:  # cancelled concurrently
+            pass
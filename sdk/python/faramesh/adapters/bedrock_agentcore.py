@@ -43,6 +43,8 @@ import time
 from dataclasses import dataclass, field
 from typing import Any, Callable, Optional
 
+from faramesh import _governance_scope
+
 logger = logging.getLogger("faramesh.adapters.bedrock_agentcore")
 
 
@@ -141,11 +143,14 @@ def govern_agentcore_tool(
     """
     import functools
     tool_id = policy_tool_id or fn.__name__
+    ident = _governance_scope.tool_identity(fn.__name__, fn)
 
     @functools.wraps(fn)
     def wrapper(*args, **kwargs):
         from faramesh.autopatch import _govern_call, _normalize_effect
 
+        if _governance_scope.is_governed(ident):
+            return fn(*args, **kwargs)
         result = _govern_call(tool_id, dict(kwargs))
         effect = _normalize_effect(result.get("effect", ""))
         if effect == "DENY":
@@ -154,6 +159,10 @@ def govern_agentcore_tool(
         if effect == "DEFER":
             token = result.get("defer_token", "")
             raise RuntimeError(f"Faramesh DEFER: approval required (token={token}, tool={tool_id})")
-        return fn(*args, **kwargs)
+        scope = _governance_scope.enter(ident)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _governance_scope.leave(scope)
 
     return wrapper
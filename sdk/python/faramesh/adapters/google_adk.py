@@ -28,6 +28,8 @@ import logging
 import os
 from typing import Any, Callable, Optional
 
+from faramesh import _governance_scope
+
 logger = logging.getLogger("faramesh.adapters.google_adk")
 
 
@@ -49,11 +51,14 @@ def faramesh_tool(
     """
     def decorator(fn: Callable) -> Callable:
         tool_id = policy_tool_id or fn.__name__
+        ident = _governance_scope.tool_identity(fn.__name__, fn)
 
         @functools.wraps(fn)
         def governed_wrapper(*args, **kwargs):
             from faramesh.autopatch import _govern_call, _normalize_effect
 
+            if _governance_scope.is_governed(ident):
+                return fn(*args, **kwargs)
             try:
                 result = _govern_call(tool_id, dict(kwargs))
             except RuntimeError:
@@ -70,7 +75,11 @@ def faramesh_tool(
                 token = result.get("defer_token", "")
                 raise RuntimeError(f"Faramesh DEFER: approval required (token={token}, tool={tool_id})")
 
-            return fn(*args, **kwargs)
+            scope = _governance_scope.enter(ident)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                _governance_scope.leave(scope)
 
         return governed_wrapper
     return decorator
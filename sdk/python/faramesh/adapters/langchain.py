@@ -23,12 +23,11 @@ import importlib
 import inspect
 import logging
 import os
-from contextvars import ContextVar
 from typing import Any
 
-logger = logging.getLogger("faramesh.adapters.langchain")
+from faramesh import _governance_scope
 
-_GOVERNANCE_DEPTH: ContextVar[int] = ContextVar("faramesh_langchain_governance_depth", default=0)
+logger = logging.getLogger("faramesh.adapters.langchain")
 
 
 def install_langchain_interceptor(
@@ -153,24 +152,40 @@ def _wrap_toolnode_execute_method(
             request = _extract_tool_request_from_execute_args(args, kwargs)
             tool_call = _extract_tool_call_from_request(request)
             tool_name = str(tool_call.get("name", "unknown_tool"))
+            tool_call_id = tool_call.get("id") or tool_call.get("tool_call_id")
+            ident = _governance_scope.tool_identity(
+                tool_name, _toolnode_tool(self, tool_name)
+            )
+            if _governance_scope.is_governed(ident, tool_call_id):
+                return await original(self, *args, **kwargs)
             payload = {
                 "framework": "langgraph",
                 "method": method_name,
                 "tool_name": tool_name,
-                "tool_call_id": tool_call.get("id") or tool_call.get("tool_call_id"),
+                "tool_call_id": tool_call_id,
                 "input": _json_safe(tool_call.get("args", {})),
             }
-            _enforce_policy(
+            deferred = await _aenforce_policy(
                 tool_id=f"{tool_name}/{method_name}",
                 payload=payload,
                 fail_open=fail_open,
             )
-
-            token = _GOVERNANCE_DEPTH.set(_GOVERNANCE_DEPTH.get() + 1)
+            if deferred is not None:
+                return _pending_result(
+                    tool_id=f"{tool_name}/{method_name}",
+                    tool_name=tool_name,
+                    tool_call_id=tool_call_id,
+                    result=deferred,
+                    resume=functools.partial(original, self, *args, **kwargs),
+                    as_message=True,
+                    scope=ident,
+                )
+
+            token = _governance_scope.enter(ident, tool_call_id)
             try:
                 return await original(self, *args, **kwargs)
             finally:
-                _GOVERNANCE_DEPTH.reset(token)
+                _governance_scope.leave(token)
 
         async_wrapper._faramesh_langchain_patched = True
         setattr(cls, method_name, async_wrapper)
@@ -181,24 +196,40 @@ def _wrap_toolnode_execute_method(
         request = _extract_tool_request_from_execute_args(args, kwargs)
         tool_call = _extract_tool_call_from_request(request)
         tool_name = str(tool_call.get("name", "unknown_tool"))
+        tool_call_id = tool_call.get("id") or tool_call.get("tool_call_id")
+        ident = _governance_scope.tool_identity(
+            tool_name, _toolnode_tool(self, tool_name)
+        )
+        if _governance_scope.is_governed(ident, tool_call_id):
+            return original(self, *args, **kwargs)
         payload = {
             "framework": "langgraph",
             "method": method_name,
             "tool_name": tool_name,
-            "tool_call_id": tool_call.get("id") or tool_call.get("tool_call_id"),
+            "tool_call_id": tool_call_id,
             "input": _json_safe(tool_call.get("args", {})),
         }
-        _enforce_policy(
+        deferred = _enforce_policy(
             tool_id=f"{tool_name}/{method_name}",
             payload=payload,
             fail_open=fail_open,
         )
+        if deferred is not None:
+            return _pending_result(
+                tool_id=f"{tool_name}/{method_name}",
+                tool_name=tool_name,
+                tool_call_id=tool_call_id,
+                result=deferred,
+                resume=functools.partial(original, self, *args, **kwargs),
+                as_message=True,
+                scope=ident,
+            )
 
-        token = _GOVERNANCE_DEPTH.set(_GOVERNANCE_DEPTH.get() + 1)
+        token = _governance_scope.enter(ident, tool_call_id)
         try:
             return original(self, *args, **kwargs)
         finally:
-            _GOVERNANCE_DEPTH.reset(token)
+            _governance_scope.leave(token)
 
     sync_wrapper._faramesh_langchain_patched = True
     setattr(cls, method_name, sync_wrapper)
@@ -216,12 +247,12 @@ def _wrap_tool_method(cls: type, method_name: str, *, fail_open: bool) -> bool:
 
         @functools.wraps(original)
         async def async_wrapper(self, *args: Any, **kwargs: Any) -> Any:
-            if _GOVERNANCE_DEPTH.get() > 0:
-                return await original(self, *args, **kwargs)
-
             tool_name = getattr(self, "name", type(self).__name__)
             tool_input = _extract_tool_input(method_name, args, kwargs)
             tool_call_id = _extract_tool_call_id(tool_input, kwargs)
+            ident = _governance_scope.tool_identity(tool_name, self)
+            if _governance_scope.is_governed(ident, tool_call_id):
+                return await original(self, *args, **kwargs)
             payload = _build_payload(
                 framework="langchain",
                 method=method_name,
@@ -230,17 +261,27 @@ def _wrap_tool_method(cls: type, method_name: str, *, fail_open: bool) -> bool:
                 tool_call_id=tool_call_id,
                 kwargs=kwargs,
             )
-            _enforce_policy(
+            deferred = await _aenforce_policy(
                 tool_id=f"{tool_name}/{method_name}",
                 payload=payload,
                 fail_open=fail_open,
             )
-
-            token = _GOVERNANCE_DEPTH.set(_GOVERNANCE_DEPTH.get() + 1)
+            if deferred is not None:
+                return _pending_result(
+                    tool_id=f"{tool_name}/{method_name}",
+                    tool_name=tool_name,
+                    tool_call_id=tool_call_id,
+                    result=deferred,
+                    resume=functools.partial(original, self, *args, **kwargs),
+                    as_message=False,
+                    scope=ident,
+                )
+
+            token = _governance_scope.enter(ident, tool_call_id)
             try:
                 return await original(self, *args, **kwargs)
             finally:
-                _GOVERNANCE_DEPTH.reset(token)
+                _governance_scope.leave(token)
 
         async_wrapper._faramesh_langchain_patched = True
         setattr(cls, method_name, async_wrapper)
@@ -248,12 +289,12 @@ def _wrap_tool_method(cls: type, method_name: str, *, fail_open: bool) -> bool:
 
     @functools.wraps(original)
     def sync_wrapper(self, *args: Any, **kwargs: Any) -> Any:
-        if _GOVERNANCE_DEPTH.get() > 0:
-            return original(self, *args, **kwargs)
-
         tool_name = getattr(self, "name", type(self).__name__)
         tool_input = _extract_tool_input(method_name, args, kwargs)
         tool_call_id = _extract_tool_call_id(tool_input, kwargs)
+        ident = _governance_scope.tool_identity(tool_name, self)
+        if _governance_scope.is_governed(ident, tool_call_id):
+            return original(self, *args, **kwargs)
         payload = _build_payload(
             framework="langchain",
             method=method_name,
@@ -262,17 +303,27 @@ def _wrap_tool_method(cls: type, method_name: str, *, fail_open: bool) -> bool:
             tool_call_id=tool_call_id,
             kwargs=kwargs,
         )
-        _enforce_policy(
+        deferred = _enforce_policy(
             tool_id=f"{tool_name}/{method_name}",
             payload=payload,
             fail_open=fail_open,
         )
+        if deferred is not None:
+            return _pending_result(
+                tool_id=f"{tool_name}/{method_name}",
+                tool_name=tool_name,
+                tool_call_id=tool_call_id,
+                result=deferred,
+                resume=functools.partial(original, self, *args, **kwargs),
+                as_message=False,
+                scope=ident,
+            )
 
-        token = _GOVERNANCE_DEPTH.set(_GOVERNANCE_DEPTH.get() + 1)
+        token = _governance_scope.enter(ident, tool_call_id)
         try:
             return original(self, *args, **kwargs)
         finally:
-            _GOVERNANCE_DEPTH.reset(token)
+            _governance_scope.leave(token)
 
     sync_wrapper._faramesh_langchain_patched = True
     setattr(cls, method_name, sync_wrapper)
@@ -292,24 +343,40 @@ def _wrap_toolnode_method(cls: type, method_name: str, *, fail_open: bool) -> bo
         async def async_wrapper(self, *args: Any, **kwargs: Any) -> Any:
             tool_call = _extract_tool_call_from_toolnode_args(args, kwargs)
             tool_name = str(tool_call.get("name", "unknown_tool"))
+            tool_call_id = tool_call.get("id") or tool_call.get("tool_call_id")
+            ident = _governance_scope.tool_identity(
+                tool_name, _toolnode_tool(self, tool_name)
+            )
+            if _governance_scope.is_governed(ident, tool_call_id):
+                return await original(self, *args, **kwargs)
             payload = {
                 "framework": "langgraph",
                 "method": method_name,
                 "tool_name": tool_name,
-                "tool_call_id": tool_call.get("id") or tool_call.get("tool_call_id"),
+                "tool_call_id": tool_call_id,
                 "input": _json_safe(tool_call.get("args", {})),
             }
-            _enforce_policy(
+            deferred = await _aenforce_policy(
                 tool_id=f"{tool_name}/{method_name}",
                 payload=payload,
                 fail_open=fail_open,
             )
-
-            token = _GOVERNANCE_DEPTH.set(_GOVERNANCE_DEPTH.get() + 1)
+            if deferred is not None:
+                return _pending_result(
+                    tool_id=f"{tool_name}/{method_name}",
+                    tool_name=tool_name,
+                    tool_call_id=tool_call_id,
+                    result=deferred,
+                    resume=functools.partial(original, self, *args, **kwargs),
+                    as_message=True,
+                    scope=ident,
+                )
+
+            token = _governance_scope.enter(ident, tool_call_id)
             try:
                 return await original(self, *args, **kwargs)
             finally:
-                _GOVERNANCE_DEPTH.reset(token)
+                _governance_scope.leave(token)
 
         async_wrapper._faramesh_langchain_patched = True
         setattr(cls, method_name, async_wrapper)
@@ -319,30 +386,55 @@ def _wrap_toolnode_method(cls: type, method_name: str, *, fail_open: bool) -> bo
     def sync_wrapper(self, *args: Any, **kwargs: Any) -> Any:
         tool_call = _extract_tool_call_from_toolnode_args(args, kwargs)
         tool_name = str(tool_call.get("name", "unknown_tool"))
+        tool_call_id = tool_call.get("id") or tool_call.get("tool_call_id")
+        ident = _governance_scope.tool_identity(
+            tool_name, _toolnode_tool(self, tool_name)
+        )
+        if _governance_scope.is_governed(ident, tool_call_id):
+            return original(self, *args, **kwargs)
         payload = {
             "framework": "langgraph",
             "method": method_name,
             "tool_name": tool_name,
-            "tool_call_id": tool_call.get("id") or tool_call.get("tool_call_id"),
+            "tool_call_id": tool_call_id,
             "input": _json_safe(tool_call.get("args", {})),
         }
-        _enforce_policy(
+        deferred = _enforce_policy(
             tool_id=f"{tool_name}/{method_name}",
             payload=payload,
             fail_open=fail_open,
         )
+        if deferred is not None:
+            return _pending_result(
+                tool_id=f"{tool_name}/{method_name}",
+                tool_name=tool_name,
+                tool_call_id=tool_call_id,
+                result=deferred,
+                resume=functools.partial(original, self, *args, **kwargs),
+                as_message=True,
+                scope=ident,
+            )
 
-        token = _GOVERNANCE_DEPTH.set(_GOVERNANCE_DEPTH.get() + 1)
+        token = _governance_scope.enter(ident, tool_call_id)
         try:
             return original(self, *args, **kwargs)
         finally:
-            _GOVERNANCE_DEPTH.reset(token)
+            _governance_scope.leave(token)
 
     sync_wrapper._faramesh_langchain_patched = True
     setattr(cls, method_name, sync_wrapper)
     return True
 
 
+def _toolnode_tool(node: Any, tool_name: str) -> Any:
+    """Look up the tool a ToolNode will dispatch ``tool_name`` to, if it exposes it."""
+    for attr in ("tools_by_name", "_tools_by_name"):
+        tools = getattr(node, attr, None)
+        if isinstance(tools, dict):
+            return tools.get(tool_name)
+    return None
+
+
 def _extract_tool_request_from_execute_args(
     args: tuple[Any, ...], kwargs: dict[str, Any]
 ) -> Any | None:
@@ -431,34 +523,117 @@ def _build_payload(
     return payload
 
 
-def _enforce_policy(*, tool_id: str, payload: dict[str, Any], fail_open: bool) -> None:
+def _enforce_policy(
+    *, tool_id: str, payload: dict[str, Any], fail_open: bool
+) -> dict[str, Any] | None:
+    """Govern one call. Returns the DEFER result when FARAMESH_DEFER_MODE=pending."""
     from faramesh.autopatch import _govern_call, _normalize_effect, _require_defer_approval
+    from faramesh.pending import defer_mode_pending
 
     try:
         result = _govern_call(tool_id, payload)
     except Exception:
         if fail_open:
             logger.warning("faramesh: governance transport failed for %s (fail-open)", tool_id)
-            return
+            return None
         raise
 
     effect = _normalize_effect(result.get("effect", ""))
     if effect == "PERMIT":
-        return
+        return None
 
     if effect == "DENY":
         reason = result.get("reason_code") or "POLICY_DENY"
         raise RuntimeError(f"Faramesh DENY: {reason} (tool={tool_id})")
 
     if effect == "DEFER":
+        if defer_mode_pending():
+            return result
         try:
             _require_defer_approval(tool_id, result)
         except Exception:
             if fail_open:
                 logger.warning("faramesh: defer approval wait failed for %s (fail-open)", tool_id)
-                return
+                return None
             raise
+    return None
+
+
+async def _aenforce_policy(
+    *, tool_id: str, payload: dict[str, Any], fail_open: bool
+) -> dict[str, Any] | None:
+    from faramesh.autopatch import _agovern_call, _arequire_defer_approval, _normalize_effect
+    from faramesh.pending import defer_mode_pending
+
+    try:
+        result = await _agovern_call(tool_id, payload)
+    except Exception:
+        if fail_open:
+            logger.warning("faramesh: governance transport failed for %s (fail-open)", tool_id)
+            return None
+        raise
+
+    effect = _normalize_effect(result.get("effect", ""))
+    if effect == "PERMIT":
+        return None
+
+    if effect == "DENY":
+        reason = result.get("reason_code") or "POLICY_DENY"
+        raise RuntimeError(f"Faramesh DENY: {reason} (tool={tool_id})")
 
+    if effect == "DEFER":
+        if defer_mode_pending():
+            return result
+        try:
+            await _arequire_defer_approval(tool_id, result)
+        except Exception:
+            if fail_open:
+                logger.warning("faramesh: defer approval wait failed for %s (fail-open)", tool_id)
+                return None
+            raise
+    return None
+
+
+def _pending_result(
+    *,
+    tool_id: str,
+    tool_name: str,
+    tool_call_id: Any,
+    result: dict[str, Any],
+    resume: Any,
+    as_message: bool,
+    scope: Any = None,
+) -> Any:
+    """Park a deferred call and return its pending handle.
+
+    Tool-level wrappers return the PendingToolCall itself (LangChain
+    stringifies it into the tool output). ToolNode dispatch must return a
+    message, so there the handle travels as a ToolMessage artifact.
+    """
+    from faramesh.autopatch import _defer_wait_params
+    from faramesh.pending import start_pending_call
+
+    _, socket_path, agent_id, _ = _defer_wait_params(tool_id, result)
+    pending = start_pending_call(
+        tool_name,
+        result,
+        resume,
+        socket_path=socket_path,
+        agent_id=agent_id,
+        tool_call_id=None if tool_call_id is None else str(tool_call_id),
+        scope=scope,
+    )
+    if not as_message:
+        return pending
+
+    from langchain_core.messages import ToolMessage
+
+    return ToolMessage(
+        content=str(pending),
+        name=tool_name,
+        tool_call_id=str(tool_call_id or ""),
+        artifact=pending,
+    )
 
 
 def _json_safe(value: Any) -> Any:
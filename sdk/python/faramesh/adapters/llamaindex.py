@@ -28,6 +28,8 @@ import functools
 import logging
 from typing import Any, Callable, Optional
 
+from faramesh import _governance_scope
+
 logger = logging.getLogger("faramesh.adapters.llamaindex")
 
 
@@ -58,11 +60,14 @@ def governed_function_tool(
 
     tool_name = name or fn.__name__
     tool_id = policy_tool_id or tool_name
+    ident = _governance_scope.tool_identity(tool_name, fn)
 
     @functools.wraps(fn)
     def governed_fn(*args, **kw):
         from faramesh.autopatch import _govern_call, _normalize_effect
 
+        if _governance_scope.is_governed(ident):
+            return fn(*args, **kw)
         try:
             result = _govern_call(tool_id, dict(kw))
         except RuntimeError:
@@ -78,7 +83,11 @@ def governed_function_tool(
         if effect == "DEFER":
             token = result.get("defer_token", "")
             raise RuntimeError(f"Faramesh DEFER: approval required (token={token}, tool={tool_id})")
-        return fn(*args, **kw)
+        scope = _governance_scope.enter(ident)
+        try:
+            return fn(*args, **kw)
+        finally:
+            _governance_scope.leave(scope)
 
     return FunctionTool.from_defaults(
         fn=governed_fn,
@@ -100,13 +109,9 @@ def govern_llamaindex_tools(tools: list[Any]) -> list[Any]:
     Returns:
         The same list with governance wrappers applied.
     """
-    from faramesh.autopatch import _wrap_method
+    from faramesh.autopatch import _LLAMAINDEX_TOOL_ID, _wrap_method
 
     for tool in tools:
-        tool_id_fn = lambda self, a, kw: getattr(
-            self, "name",
-            getattr(getattr(self, "metadata", None), "name", type(self).__name__)
-        )
-        _wrap_method(type(tool), "call", "llamaindex", tool_id_fn)
+        _wrap_method(type(tool), "call", "llamaindex", _LLAMAINDEX_TOOL_ID)
 
     return tools
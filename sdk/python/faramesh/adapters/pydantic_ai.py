@@ -22,6 +22,8 @@ import logging
 import os
 from typing import Any, Callable, Optional
 
+from faramesh import _governance_scope
+
 logger = logging.getLogger("faramesh.adapters.pydantic_ai")
 
 
@@ -43,16 +45,20 @@ def governed_tool(
     """
     def decorator(fn: Callable) -> Callable:
         tool_id = policy_tool_id or fn.__name__
+        ident = _governance_scope.tool_identity(fn.__name__, fn)
 
         @functools.wraps(fn)
         async def governed_wrapper(*args, **kwargs):
-            from faramesh.autopatch import _govern_call, _normalize_effect
+            from faramesh.autopatch import _agovern_call, _normalize_effect
+
+            if _governance_scope.is_governed(ident):
+                return await fn(*args, **kwargs) if _is_async(fn) else fn(*args, **kwargs)
 
             call_args = dict(kwargs)
             if args and len(args) > 1:
                 call_args["_positional"] = list(args[1:])
 
-            result = _govern_call(tool_id, call_args)
+            result = await _agovern_call(tool_id, call_args)
             effect = _normalize_effect(result.get("effect", ""))
 
             if effect == "DENY":
@@ -62,7 +68,11 @@ def governed_tool(
                 token = result.get("defer_token", "")
                 raise RuntimeError(f"Faramesh DEFER: approval required (token={token}, tool={tool_id})")
 
-            return await fn(*args, **kwargs) if _is_async(fn) else fn(*args, **kwargs)
+            scope = _governance_scope.enter(ident)
+            try:
+                return await fn(*args, **kwargs) if _is_async(fn) else fn(*args, **kwargs)
+            finally:
+                _governance_scope.leave(scope)
 
         if plain:
             agent.tool_plain(retries=retries)(governed_wrapper)
@@ -16,28 +16,56 @@ Example:
     >>> with audit.subscribe(lambda e: print(e["effect"], e["tool_id"])):
     ...     run_my_agent()
 
-The callback runs on a background daemon thread. The daemon buffers ~64
-events per subscriber and silently drops further events if the consumer
-falls behind, so keep the callback fast — for slow downstream work
-(network calls, etc.), enqueue events and process them out-of-band.
+The daemon buffers ~64 events per subscriber and silently drops further
+events if the consumer falls behind. The SDK therefore reads the socket
+on its own thread and hands events to the callback through a bounded
+in-process queue, so a slow callback backs up that queue rather than the
+daemon's. Size it with ``queue_size``, choose what happens when it fills
+with ``overflow`` (``"block"``, ``"drop_oldest"``, ``"spill"``), add
+``workers`` for slow I/O-bound callbacks, and watch ``sub.stats`` for
+drops and lag:
+
+    >>> sub = audit.subscribe(ship_to_siem, workers=4, overflow="spill")
+    >>> sub.stats.lag_seconds
+
+Pass ``reconnect=True`` to survive daemon restarts and dropped sockets:
+the stream is re-established with backoff and resumed from the last
+event ``seq``, and anything that could not be replayed is counted in
+``sub.stats.missed``.
+
+High-volume shippers can take events in batches, which pairs naturally
+with batched writes to Kafka, files or HTTP sinks:
+
+    >>> audit.subscribe(producer.send_batch, batch_size=500, max_latency_ms=50)
 """
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable
 from typing import Any
 
-from ._subscription import AUDIT_SUBSCRIBE, Subscription
+from ._subscription import AUDIT_SUBSCRIBE, OVERFLOW_BLOCK, Subscription, SubscriptionStats
 
-__all__ = ["Subscription", "subscribe"]
+__all__ = ["Subscription", "SubscriptionStats", "subscribe"]
 
 
 def subscribe(
-    callback: Callable[[dict[str, Any]], None],
+    callback: Callable[[Any], Any],
     *,
     agent_id: str | None = None,
     socket_path: str | None = None,
     connect_timeout: float = 5.0,
+    queue_size: int = 1024,
+    overflow: str = OVERFLOW_BLOCK,
+    workers: int = 1,
+    loop: asyncio.AbstractEventLoop | None = None,
+    spill_dir: str | None = None,
+    reconnect: bool = False,
+    reconnect_delay: float = 0.5,
+    max_reconnect_delay: float = 30.0,
+    batch_size: int | None = None,
+    max_latency_ms: float = 100.0,
 ) -> Subscription:
     """Subscribe to the daemon's decision stream (``audit_subscribe``).
 
@@ -48,7 +76,8 @@ def subscribe(
     ``args``, and others.
 
     Args:
-        callback: Invoked once per decision event from a background thread.
+        callback: Invoked once per decision event from a background thread,
+            or once per list of events when ``batch_size`` is set.
         agent_id: Optional client-side filter. The daemon does not filter
             by agent_id; the wrapper drops events whose ``agent_id`` field
             does not match.
@@ -56,12 +85,36 @@ def subscribe(
             ``$FARAMESH_SOCKET`` then ``/tmp/faramesh.sock``.
         connect_timeout: Seconds to wait for connect and the
             subscription confirmation.
+        queue_size: Events buffered between the socket reader and the
+            callback (default: 1024).
+        overflow: What to do when that buffer is full: ``"block"`` the
+            reader (default), ``"drop_oldest"``, or ``"spill"`` to a
+            temporary file and deliver in order once the callback catches up.
+        workers: Threads invoking the callback. More than one delivers
+            concurrently and does not preserve event order.
+        loop: Run the callback on this asyncio event loop instead of a
+            worker thread. Coroutine callbacks are awaited there; when
+            ``subscribe`` is called from a coroutine, the running loop is
+            used by default.
+        spill_dir: Directory for the ``"spill"`` file (default: system temp).
+        reconnect: Re-establish a dropped stream with jittered backoff and
+            resume from the last ``seq`` received, so events the daemon
+            still holds in its replay window are not lost. Gaps that
+            cannot be replayed are counted in ``stats.missed``.
+        reconnect_delay: Base delay before the first reconnect attempt.
+        max_reconnect_delay: Cap on the delay between attempts.
+        batch_size: Deliver lists of up to this many events per callback
+            call instead of one event per call (default: unbatched).
+        max_latency_ms: With ``batch_size``, the longest an event waits
+            for its batch to fill before a partial batch is delivered.
 
     Returns:
         A ``Subscription`` handle. Use as a context manager or call
         ``.close()`` to stop.
 
     Raises:
+        ValueError: Unknown ``overflow`` policy, or a coroutine callback
+            without an event loop.
         ConnectionError: The socket could not be opened or the request
             could not be sent.
         TimeoutError: The daemon did not return the subscription
@@ -73,6 +126,16 @@ def subscribe(
         agent_id=agent_id,
         socket_path=socket_path,
         connect_timeout=connect_timeout,
+        queue_size=queue_size,
+        overflow=overflow,
+        workers=workers,
+        loop=loop,
+        spill_dir=spill_dir,
+        reconnect=reconnect,
+        reconnect_delay=reconnect_delay,
+        max_reconnect_delay=max_reconnect_delay,
+        batch_size=batch_size,
+        max_latency_ms=max_latency_ms,
     )
     sub.start()
     return sub
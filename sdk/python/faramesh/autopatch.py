@@ -19,6 +19,17 @@ Supported frameworks and their patch points:
   - AWS Strands Agents:       tool decorator via agent.tool.run
   - Haystack:                 Pipeline.run
 
+Frameworks are patched lazily: install() registers a sys.meta_path finder
+that instruments each framework the first time the application imports its
+dispatch module, so frameworks that are installed but never used add nothing
+to interpreter startup. Set FARAMESH_AUTOPATCH_EAGER=1 (or pass eager=True)
+to import and patch every installed framework up front instead.
+
+DEFER decisions block the tool call until approved by default. Set
+FARAMESH_DEFER_MODE=raise to fail fast, or FARAMESH_DEFER_MODE=pending to
+return a faramesh.pending.PendingToolCall at once and run the call when
+approval arrives.
+
 Usage:
   # Automatic (set by faramesh run):
   FARAMESH_AUTOLOAD=1 python agent.py
@@ -31,16 +42,31 @@ from __future__ import annotations
 
 import functools
 import importlib
+import importlib.abc
+import inspect
 import logging
 import os
 import sys
-import time
-from typing import Any, Callable
+import threading
+import weakref
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import TYPE_CHECKING, Any, Callable
+
+if TYPE_CHECKING:
+    from faramesh import _governance_scope
+    from faramesh.pending import PendingToolCall
+
+# faramesh._defer, faramesh.pending and faramesh._governance_scope are imported
+# where they are first needed (DEFER handling and patch time), so a failure in
+# one of them cannot stop sitecustomize from installing governance at all.
 
 logger = logging.getLogger("faramesh.autopatch")
 
 _installed = False
 _patched_frameworks: list[str] = []
+_patch_lock = threading.Lock()
+_import_hook: _FrameworkImportHook | None = None
 
 
 def _normalize_effect(effect: Any) -> str:
@@ -58,25 +84,114 @@ def _normalize_effect(effect: Any) -> str:
     raise RuntimeError(f"Faramesh governance returned unknown effect: {effect!r}")
 
 
-def install() -> list[str]:
-    """Install governance patches on all detected frameworks. Idempotent."""
+def install(*, eager: bool | None = None) -> list[str]:
+    """Install governance patches on supported frameworks. Idempotent.
+
+    By default only frameworks that are already imported are patched now; the
+    rest are patched by an import hook when the application first imports
+    them. With ``eager=True`` (or FARAMESH_AUTOPATCH_EAGER=1) every installed
+    framework is imported and patched immediately.
+
+    Returns the frameworks patched so far.
+    """
     global _installed
     if _installed:
         return _patched_frameworks
 
     _installed = True
-    patched: list[str] = []
+    if eager is None:
+        eager = os.environ.get("FARAMESH_AUTOPATCH_EAGER") == "1"
 
-    for name, patcher in _PATCHERS.items():
-        try:
-            if patcher():
-                patched.append(name)
-                logger.info("faramesh: patched %s dispatch point", name)
-        except Exception as exc:
-            logger.debug("faramesh: %s not available (%s)", name, exc)
+    if eager:
+        for name, patcher in _PATCHERS.items():
+            _run_patcher(name, patcher)
+        return _patched_frameworks
+
+    _install_import_hook()
+    return _patched_frameworks
+
+
+def _run_patcher(name: str, patcher: Callable[[], bool]) -> bool:
+    """Run one framework patcher, recording it in _patched_frameworks on success."""
+    try:
+        ok = patcher()
+    except Exception as exc:
+        logger.debug("faramesh: %s not available (%s)", name, exc)
+        return False
+    if ok:
+        with _patch_lock:
+            if name not in _patched_frameworks:
+                _patched_frameworks.append(name)
+        logger.info("faramesh: patched %s dispatch point", name)
+    return bool(ok)
+
+
+def _install_import_hook() -> None:
+    """Register the lazy import hook and patch frameworks that are already loaded."""
+    global _import_hook
+    if _import_hook is None:
+        _import_hook = _FrameworkImportHook(_IMPORT_HOOKS)
+        sys.meta_path.insert(0, _import_hook)
 
-    _patched_frameworks.extend(patched)
-    return patched
+    for module_name, (name, patcher) in _IMPORT_HOOKS.items():
+        if module_name in sys.modules:
+            _run_patcher(name, patcher)
+
+
+class _FrameworkImportHook(importlib.abc.MetaPathFinder):
+    """Meta path finder that patches a framework when its dispatch module loads.
+
+    Only the module names in ``hooks`` are intercepted. For those, the spec is
+    resolved by the remaining finders and its loader is wrapped so that the
+    framework patcher runs right after the module body has executed.
+    """
+
+    def __init__(self, hooks: dict[str, tuple[str, Callable[[], bool]]]):
+        self._hooks = hooks
+
+    def find_spec(self, fullname: str, path: Any = None, target: Any = None) -> Any:
+        if fullname not in self._hooks:
+            return None
+
+        spec = None
+        for finder in sys.meta_path:
+            if finder is self:
+                continue
+            find_spec = getattr(finder, "find_spec", None)
+            if find_spec is None:
+                continue
+            spec = find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        if spec is None or spec.loader is None or not hasattr(spec.loader, "exec_module"):
+            return spec
+
+        name, patcher = self._hooks[fullname]
+        spec.loader = _PatchingLoader(spec.loader, lambda: _run_patcher(name, patcher))
+        return spec
+
+
+class _PatchingLoader(importlib.abc.Loader):
+    """Loader proxy that runs a patch callback after the real loader executes the module."""
+
+    def __init__(self, loader: Any, on_loaded: Callable[[], Any]):
+        self._loader = loader
+        self._on_loaded = on_loaded
+
+    def create_module(self, spec: Any) -> Any:
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module: Any) -> None:
+        # Hand the module its real loader so resource readers and reloads
+        # behave exactly as without the hook.
+        module.__loader__ = self._loader
+        if getattr(module, "__spec__", None) is not None:
+            module.__spec__.loader = self._loader
+        self._loader.exec_module(module)
+        self._on_loaded()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._loader, name)
 
 
 def _govern_call(tool_id: str, args: dict[str, Any]) -> dict[str, Any]:
@@ -85,6 +200,8 @@ def _govern_call(tool_id: str, args: dict[str, Any]) -> dict[str, Any]:
     Uses FARAMESH_REMOTE_URL, FARAMESH_SOCKET, or FARAMESH_BASE_URL (see transport.py),
     then falls back to the legacy gate HTTP client.
     """
+    from faramesh._retry import CircuitOpenError
+
     try:
         from faramesh.transport import detect_transport, govern_via_transport
 
@@ -97,6 +214,11 @@ def _govern_call(tool_id: str, args: dict[str, Any]) -> dict[str, Any]:
         if effect == "DEFER":
             out["defer_token"] = result.get("defer_token", "")
         return out
+    except CircuitOpenError as exc:
+        # The daemon is known to be down: fail closed now rather than
+        # trying the legacy paths against it.
+        logger.error("faramesh govern unavailable (fail-closed): %s", exc)
+        raise RuntimeError(f"Faramesh governance denied: {exc}") from exc
     except RuntimeError:
         pass
 
@@ -223,29 +345,13 @@ def _read_float_env(name: str, fallback: float) -> float:
     return value
 
 
-def _poll_defer_status(socket_path: str, agent_id: str, defer_token: str) -> str:
-    """Poll current DEFER status from daemon."""
-    response = _socket_json_request(
-        socket_path,
-        {
-            "type": "poll_defer",
-            "agent_id": agent_id,
-            "defer_token": defer_token,
-        },
-        timeout_seconds=5.0,
-    )
-    err = str(response.get("error") or "").strip()
-    if err:
-        raise RuntimeError(err)
+def _defer_wait_params(tool_id: str, result: dict[str, Any]) -> tuple[str, str, str, float]:
+    """Validate a DEFER result and resolve how to wait for it.
 
-    status = str(response.get("status") or "pending").strip().lower()
-    if status not in {"pending", "approved", "denied", "expired"}:
-        raise RuntimeError(f"unexpected defer status: {status}")
-    return status
-
-
-def _require_defer_approval(tool_id: str, result: dict[str, Any]) -> None:
-    """Block on DEFER until approved/denied/expired, then enforce final outcome."""
+    Returns (defer_token, socket_path, agent_id, timeout_seconds).
+    Raises immediately when FARAMESH_DEFER_MODE asks for fail-fast behavior or
+    the daemon socket cannot be polled.
+    """
     defer_token = str(result.get("defer_token") or "").strip()
     if not defer_token:
         raise RuntimeError(f"Faramesh DEFER missing token (tool={tool_id})")
@@ -262,49 +368,308 @@ def _require_defer_approval(tool_id: str, result: dict[str, Any]) -> None:
 
     agent_id = os.environ.get("FARAMESH_AGENT_ID", "auto-patched")
     timeout_seconds = _read_float_env("FARAMESH_DEFER_WAIT_TIMEOUT_SECONDS", 900.0)
-    poll_interval_seconds = _read_float_env("FARAMESH_DEFER_POLL_INTERVAL_SECONDS", 1.0)
-    deadline = time.monotonic() + timeout_seconds
+    return defer_token, socket_path, agent_id, timeout_seconds
+
+
+def _defer_approved(tool_id: str, defer_token: str, status: str) -> bool:
+    """True once a DEFER is approved; raises when it was denied or expired."""
+    if status == "approved":
+        return True
+    if status == "denied":
+        raise RuntimeError(f"Faramesh DENY: deferred request denied (token={defer_token}, tool={tool_id})")
+    if status == "expired":
+        raise RuntimeError(f"Faramesh DENY: deferred request expired (token={defer_token}, tool={tool_id})")
+    return False
+
+
+def _watch_defer(tool_id: str, result: dict[str, Any]) -> tuple[str, float, Future]:
+    """Register a DEFER with the shared waiter registry.
+
+    Returns (defer_token, timeout_seconds, future of the final status). The
+    registry resolves tokens from the daemon's callback_subscribe stream and
+    batch-polls the rest over one connection (see :mod:`faramesh._defer`).
+    """
+    from faramesh import _defer
+
+    defer_token, socket_path, agent_id, timeout_seconds = _defer_wait_params(tool_id, result)
+    future = _defer.watch(
+        defer_token,
+        agent_id=agent_id,
+        socket_path=socket_path,
+        poll_interval=_read_float_env("FARAMESH_DEFER_POLL_INTERVAL_SECONDS", 1.0),
+        max_poll_interval=_read_float_env("FARAMESH_DEFER_POLL_MAX_INTERVAL_SECONDS", 30.0),
+        recheck_interval=_read_float_env("FARAMESH_DEFER_RECHECK_SECONDS", 2.0),
+    )
+    return defer_token, timeout_seconds, future
+
+
+def _require_defer_approval(tool_id: str, result: dict[str, Any]) -> None:
+    """Block on DEFER until approved/denied/expired, then enforce final outcome."""
+    defer_token, timeout_seconds, future = _watch_defer(tool_id, result)
+    try:
+        status = future.result(timeout_seconds)
+    except FutureTimeoutError:
+        future.cancel()
+        status = "pending"
+    if not _defer_approved(tool_id, defer_token, status):
+        raise RuntimeError(f"Faramesh DEFER timeout: pending approval (token={defer_token}, tool={tool_id})")
 
-    while True:
-        status = _poll_defer_status(socket_path, agent_id, defer_token)
-        if status == "approved":
-            return
-        if status == "denied":
-            raise RuntimeError(f"Faramesh DENY: deferred request denied (token={defer_token}, tool={tool_id})")
-        if status == "expired":
-            raise RuntimeError(f"Faramesh DENY: deferred request expired (token={defer_token}, tool={tool_id})")
 
-        if time.monotonic() >= deadline:
-            raise RuntimeError(f"Faramesh DEFER timeout: pending approval (token={defer_token}, tool={tool_id})")
-        time.sleep(poll_interval_seconds)
+async def _agovern_call(tool_id: str, args: dict[str, Any]) -> dict[str, Any]:
+    """Async _govern_call: runs the blocking transport off the event loop."""
+    import asyncio
+
+    return await asyncio.to_thread(_govern_call, tool_id, args)
+
+
+async def _arequire_defer_approval(tool_id: str, result: dict[str, Any]) -> None:
+    """Async _require_defer_approval: awaits the shared registry's future."""
+    import asyncio
+
+    defer_token, timeout_seconds, future = _watch_defer(tool_id, result)
+    try:
+        status = await asyncio.wait_for(asyncio.wrap_future(future), timeout_seconds)
+    except asyncio.TimeoutError:
+        status = "pending"
+    if not _defer_approved(tool_id, defer_token, status):
+        raise RuntimeError(f"Faramesh DEFER timeout: pending approval (token={defer_token}, tool={tool_id})")
+
+
+def _defer_pending_call(
+    tool_id: str,
+    result: dict[str, Any],
+    resume: Callable[[], Any],
+    *,
+    tool_call_id: str | None = None,
+    scope: _governance_scope.ToolIdentity | None = None,
+) -> PendingToolCall | None:
+    """With FARAMESH_DEFER_MODE=pending, park a DEFER as a PendingToolCall.
+
+    Returns None in the blocking modes. ``resume`` re-runs the original
+    call once the daemon reports the approval.
+    """
+    from faramesh.pending import defer_mode_pending, start_pending_call
+
+    if not defer_mode_pending():
+        return None
+    _, socket_path, agent_id, _ = _defer_wait_params(tool_id, result)
+    return start_pending_call(
+        tool_id,
+        result,
+        resume,
+        socket_path=socket_path,
+        agent_id=agent_id,
+        tool_call_id=tool_call_id,
+        scope=scope,
+    )
+
+
+def _enforce_result(tool_id: Any, result: dict[str, Any]) -> bool:
+    """Raise on DENY. Returns True when the caller must wait for DEFER approval."""
+    effect = result.get("effect")
+    if effect == "PERMIT":
+        return False
+    effect = _normalize_effect(effect)
+    if effect == "DENY":
+        reason = result.get("reason_code") or "POLICY_DENY"
+        raise RuntimeError(f"Faramesh DENY: {reason} (tool={tool_id})")
+    return effect == "DEFER"
 
 
 def _wrap_method(cls: type, method_name: str, framework: str, tool_id_fn: Callable) -> bool:
-    """Wrap a class method with Faramesh governance. Returns True if patched."""
+    """Wrap a class method with Faramesh governance. Returns True if patched.
+
+    Coroutine methods get an async wrapper that evaluates governance and
+    waits for DEFER approval without blocking the event loop.
+
+    The wrapper is specialized once per patched method: tool ids and scope
+    identities built with :func:`_instance_tool_id` are resolved once per
+    tool instance and cached, and :func:`_constant_tool_id` ids are bound
+    directly, so the per-call path only extracts arguments and consults the
+    governance scope.
+    """
     original = getattr(cls, method_name, None)
     if original is None:
         return False
     if getattr(original, "_faramesh_patched", False):
         return False
 
-    @functools.wraps(original)
-    def wrapper(self, *args, **kwargs):
-        tid = tool_id_fn(self, args, kwargs)
-        call_args = _json_safe(_extract_args(args, kwargs))
-        result = _govern_call(tid, call_args)
-        effect = _normalize_effect(result.get("effect", ""))
-        if effect == "DENY":
-            reason = result.get("reason_code") or "POLICY_DENY"
-            raise RuntimeError(f"Faramesh DENY: {reason} (tool={tid})")
-        if effect == "DEFER":
-            _require_defer_approval(tid, result)
-        return original(self, *args, **kwargs)
+    from faramesh import _governance_scope
+
+    resolve_tool = _specialize_tool_id(tool_id_fn)
+    is_governed = _governance_scope.is_governed
+
+    if inspect.iscoroutinefunction(original):
+
+        @functools.wraps(original)
+        async def wrapper(self, *args, **kwargs):
+            tid, ident = resolve_tool(self, args, kwargs)
+            if is_governed(ident):
+                return await original(self, *args, **kwargs)
+            result = await _agovern_call(tid, _json_safe(_extract_args(args, kwargs)))
+            if _enforce_result(tid, result):
+                pending = _defer_pending_call(
+                    tid, result, functools.partial(original, self, *args, **kwargs), scope=ident
+                )
+                if pending is not None:
+                    return pending
+                await _arequire_defer_approval(tid, result)
+            token = _governance_scope.enter(ident)
+            try:
+                return await original(self, *args, **kwargs)
+            finally:
+                _governance_scope.leave(token)
+
+    else:
+
+        @functools.wraps(original)
+        def wrapper(self, *args, **kwargs):
+            tid, ident = resolve_tool(self, args, kwargs)
+            if is_governed(ident):
+                return original(self, *args, **kwargs)
+            result = _govern_call(tid, _json_safe(_extract_args(args, kwargs)))
+            if _enforce_result(tid, result):
+                pending = _defer_pending_call(
+                    tid, result, functools.partial(original, self, *args, **kwargs), scope=ident
+                )
+                if pending is not None:
+                    return pending
+                _require_defer_approval(tid, result)
+            token = _governance_scope.enter(ident)
+            try:
+                return original(self, *args, **kwargs)
+            finally:
+                _governance_scope.leave(token)
 
     wrapper._faramesh_patched = True
     setattr(cls, method_name, wrapper)
     return True
 
 
+_MISSING = object()
+
+
+def _instance_tool_id(*paths: str) -> Callable[[Any, tuple, dict], Any]:
+    """Build a tool_id_fn that reads the first present attribute path on the tool.
+
+    Paths are dotted (``"metadata.name"``). Falls back to the class name. The
+    id depends only on the instance, so _wrap_method caches it per tool.
+    """
+    attr_paths = tuple(tuple(path.split(".")) for path in paths)
+
+    def tool_id(self: Any, args: tuple, kwargs: dict) -> Any:
+        for attrs in attr_paths:
+            value = self
+            for attr in attrs:
+                value = getattr(value, attr, _MISSING)
+                if value is _MISSING:
+                    break
+            else:
+                return value
+        return type(self).__name__
+
+    tool_id._faramesh_per_instance = True
+    return tool_id
+
+
+def _constant_tool_id(value: str) -> Callable[[Any, tuple, dict], str]:
+    """Build a tool_id_fn that always returns ``value``."""
+
+    def tool_id(self: Any, args: tuple, kwargs: dict) -> str:
+        return value
+
+    tool_id._faramesh_constant = value
+    return tool_id
+
+
+def _call_arg_tool_id(key: str, default: str) -> Callable[[Any, tuple, dict], Any]:
+    """Build a tool_id_fn that reads the tool name from the call's arguments."""
+
+    def tool_id(self: Any, args: tuple, kwargs: dict) -> Any:
+        if key in kwargs:
+            return kwargs[key]
+        return args[0] if args else default
+
+    tool_id._faramesh_dispatcher = True
+    return tool_id
+
+
+def _specialize_tool_id(tool_id_fn: Callable) -> Callable[[Any, tuple, dict], tuple]:
+    """Return the cheapest ``(tool_id, scope identity)`` resolver for ``tool_id_fn``.
+
+    Dispatcher-level ids (constant or read from the call's arguments) only
+    know the tool name; every other id describes ``self`` as the tool, so
+    its identity also carries the tool's underlying function.
+    """
+    from faramesh import _governance_scope
+
+    tool_identity = _governance_scope.tool_identity
+    if hasattr(tool_id_fn, "_faramesh_constant"):
+        resolved = (tool_id_fn._faramesh_constant, tool_identity(tool_id_fn._faramesh_constant))
+
+        def constant_tool(self: Any, args: tuple, kwargs: dict) -> tuple:
+            return resolved
+
+        return constant_tool
+    if getattr(tool_id_fn, "_faramesh_dispatcher", False):
+
+        def dispatched_tool(self: Any, args: tuple, kwargs: dict) -> tuple:
+            tid = tool_id_fn(self, args, kwargs)
+            return tid, tool_identity(tid)
+
+        return dispatched_tool
+
+    def instance_tool(self: Any, args: tuple, kwargs: dict) -> tuple:
+        tid = tool_id_fn(self, args, kwargs)
+        return tid, tool_identity(tid, self)
+
+    if not getattr(tool_id_fn, "_faramesh_per_instance", False):
+        return instance_tool
+
+    cache = _InstanceCache()
+
+    def cached_tool(self: Any, args: tuple, kwargs: dict) -> tuple:
+        return cache.get(self, instance_tool)
+
+    return cached_tool
+
+
+class _InstanceCache:
+    """Per-instance memo that never keeps instances alive.
+
+    Hashable instances are keyed weakly; unhashable ones (pydantic models,
+    which many framework tools are) are keyed by id() with a finalizer that
+    drops the entry when the instance is collected. Instances that support
+    neither are recomputed on every call.
+    """
+
+    def __init__(self) -> None:
+        self._by_ref: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._by_id: dict[int, Any] = {}
+
+    def get(self, obj: Any, compute: Callable[[Any, tuple, dict], Any]) -> Any:
+        try:
+            return self._by_ref[obj]
+        except KeyError:
+            value = compute(obj, (), {})
+            self._by_ref[obj] = value
+            return value
+        except TypeError:
+            pass
+
+        key = id(obj)
+        value = self._by_id.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        value = compute(obj, (), {})
+        try:
+            weakref.finalize(obj, self._by_id.pop, key, None)
+        except TypeError:
+            return value
+        self._by_id[key] = value
+        return value
+
+
 def _extract_args(args: tuple, kwargs: dict) -> dict[str, Any]:
     """Build a flat dict from positional and keyword arguments."""
     result = dict(kwargs)
@@ -316,8 +681,39 @@ def _extract_args(args: tuple, kwargs: dict) -> dict[str, Any]:
     return result
 
 
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+
+def _is_json_safe(value: Any) -> bool:
+    """True if ``value`` is already made of JSON primitives (str-keyed dicts, lists)."""
+    kind = type(value)
+    if kind in _JSON_SCALARS:
+        return True
+    if kind is dict:
+        for key, item in value.items():
+            if type(key) is not str or not _is_json_safe(item):
+                return False
+        return True
+    if kind is list:
+        for item in value:
+            if not _is_json_safe(item):
+                return False
+        return True
+    return False
+
+
 def _json_safe(value: Any) -> Any:
-    """Best-effort conversion to JSON-safe primitives for governance payloads."""
+    """Best-effort conversion to JSON-safe primitives for governance payloads.
+
+    Values that are already JSON-safe are returned as-is without copying.
+    """
+    if _is_json_safe(value):
+        return value
+    return _to_json_safe(value)
+
+
+def _to_json_safe(value: Any) -> Any:
+    """Recursive conversion behind :func:`_json_safe`."""
     if value is None or isinstance(value, (str, int, float, bool)):
         return value
 
@@ -328,20 +724,20 @@ def _json_safe(value: Any) -> Any:
             return str(value)
 
     if isinstance(value, dict):
-        return {str(k): _json_safe(v) for k, v in value.items()}
+        return {str(k): _to_json_safe(v) for k, v in value.items()}
 
     if isinstance(value, (list, tuple, set)):
-        return [_json_safe(v) for v in value]
+        return [_to_json_safe(v) for v in value]
 
     if hasattr(value, "model_dump") and callable(getattr(value, "model_dump")):
         try:
-            return _json_safe(value.model_dump())
+            return _to_json_safe(value.model_dump())
         except Exception:
             return str(value)
 
     if hasattr(value, "dict") and callable(getattr(value, "dict")):
         try:
-            return _json_safe(value.dict())
+            return _to_json_safe(value.dict())
         except Exception:
             return str(value)
 
@@ -350,6 +746,18 @@ def _json_safe(value: Any) -> Any:
 
 # --- Framework-specific patchers ---
 
+# Tool id resolvers, built once so each patched method gets a specialized wrapper.
+_NAME_TOOL_ID = _instance_tool_id("name")
+_AUTOGEN_TOOL_ID = _call_arg_tool_id("name", "unknown")
+_PYDANTIC_AI_TOOL_ID = _instance_tool_id("name", "function_name")
+_PYDANTIC_AI_AGENT_TOOL_ID = _call_arg_tool_id("tool_name", "pydantic-ai/agent")
+_GOOGLE_ADK_TOOL_ID = _instance_tool_id("name", "_name")
+_LLAMAINDEX_TOOL_ID = _instance_tool_id("name", "metadata.name")
+_STRANDS_AGENT_TOOL_ID = _call_arg_tool_id("tool_name", "strands/agent")
+_STRANDS_TOOL_ID = _instance_tool_id("tool_name", "name")
+_HAYSTACK_TOOL_ID = _constant_tool_id("haystack/pipeline")
+
+
 def _patch_langchain() -> bool:
     """Patch LangChain/LangGraph dispatch using the dedicated adapter.
 
@@ -362,6 +770,14 @@ def _patch_langchain() -> bool:
     return bool(patched.get("langchain") or patched.get("langgraph"))
 
 
+def _patch_langchain_core() -> bool:
+    """Patch LangChain BaseTool only, leaving LangGraph to its own import hook."""
+    from faramesh.adapters.langchain import install_langchain_interceptor
+
+    patched = install_langchain_interceptor(include_langgraph=False, fail_open=False)
+    return bool(patched.get("langchain"))
+
+
 def _patch_deepagents() -> bool:
     """Patch DeepAgents entrypoint and align with LangChain/LangGraph hooks."""
     from faramesh.adapters.deepagents import install_deepagents_interceptor
@@ -374,24 +790,21 @@ def _patch_crewai() -> bool:
     """Patch CrewAI BaseTool._run."""
     mod = importlib.import_module("crewai.tools")
     cls = getattr(mod, "BaseTool")
-    tool_id = lambda self, a, kw: getattr(self, "name", type(self).__name__)
-    return _wrap_method(cls, "_run", "crewai", tool_id)
+    return _wrap_method(cls, "_run", "crewai", _NAME_TOOL_ID)
 
 
 def _patch_autogen() -> bool:
     """Patch AutoGen/AG2 ConversableAgent tool execution."""
     mod = importlib.import_module("autogen")
     cls = getattr(mod, "ConversableAgent")
-    tool_id = lambda self, a, kw: kw.get("name", a[0] if a else "unknown")
-    return _wrap_method(cls, "_execute_tool_call", "autogen", tool_id)
+    return _wrap_method(cls, "_execute_tool_call", "autogen", _AUTOGEN_TOOL_ID)
 
 
 def _patch_openai_agents() -> bool:
     """Patch OpenAI Agents SDK FunctionTool."""
     mod = importlib.import_module("agents")
     cls = getattr(mod, "FunctionTool")
-    tool_id = lambda self, a, kw: getattr(self, "name", type(self).__name__)
-    return _wrap_method(cls, "on_invoke_tool", "openai-agents", tool_id)
+    return _wrap_method(cls, "on_invoke_tool", "openai-agents", _NAME_TOOL_ID)
 
 
 def _patch_pydantic_ai() -> bool:
@@ -404,15 +817,13 @@ def _patch_pydantic_ai() -> bool:
     """
     mod = importlib.import_module("pydantic_ai.tools")
     cls = getattr(mod, "Tool")
-    tool_id = lambda self, a, kw: getattr(self, "name", getattr(self, "function_name", type(self).__name__))
-    ok1 = _wrap_method(cls, "run", "pydantic-ai", tool_id)
+    ok1 = _wrap_method(cls, "run", "pydantic-ai", _PYDANTIC_AI_TOOL_ID)
 
     try:
         agent_mod = importlib.import_module("pydantic_ai.agent")
         agent_cls = getattr(agent_mod, "Agent", None)
         if agent_cls:
-            agent_tool_id = lambda self, a, kw: kw.get("tool_name", a[0] if a else "pydantic-ai/agent")
-            ok2 = _wrap_method(agent_cls, "_call_tool", "pydantic-ai", agent_tool_id)
+            ok2 = _wrap_method(agent_cls, "_call_tool", "pydantic-ai", _PYDANTIC_AI_AGENT_TOOL_ID)
             return ok1 or ok2
     except (ImportError, AttributeError):
         pass
@@ -435,8 +846,7 @@ def _patch_google_adk() -> bool:
         try:
             mod = importlib.import_module(mod_path)
             cls = getattr(mod, cls_name)
-            tool_id = lambda self, a, kw: getattr(self, "name", getattr(self, "_name", type(self).__name__))
-            if _wrap_method(cls, method, "google-adk", tool_id):
+            if _wrap_method(cls, method, "google-adk", _GOOGLE_ADK_TOOL_ID):
                 ok = True
         except (ImportError, AttributeError):
             continue
@@ -459,13 +869,9 @@ def _patch_llamaindex() -> bool:
                 cls = getattr(mod, cls_name, None)
                 if cls is None:
                     continue
-                tool_id = lambda self, a, kw: getattr(
-                    self, "name",
-                    getattr(getattr(self, "metadata", None), "name", type(self).__name__)
-                )
                 for method in ["call", "acall"]:
                     if hasattr(cls, method):
-                        if _wrap_method(cls, method, "llamaindex", tool_id):
+                        if _wrap_method(cls, method, "llamaindex", _LLAMAINDEX_TOOL_ID):
                             ok = True
         except (ImportError, AttributeError):
             continue
@@ -485,10 +891,9 @@ def _patch_strands_agents() -> bool:
         mod = importlib.import_module("strands.agent")
         cls = getattr(mod, "Agent", None)
         if cls:
-            tool_id = lambda self, a, kw: kw.get("tool_name", a[0] if a else "strands/agent")
             for method in ["_run_tool", "tool_handler"]:
                 if hasattr(cls, method):
-                    if _wrap_method(cls, method, "strands-agents", tool_id):
+                    if _wrap_method(cls, method, "strands-agents", _STRANDS_AGENT_TOOL_ID):
                         ok = True
     except (ImportError, AttributeError):
         pass
@@ -497,8 +902,7 @@ def _patch_strands_agents() -> bool:
         tools_mod = importlib.import_module("strands.tools")
         tool_cls = getattr(tools_mod, "FunctionTool", None) or getattr(tools_mod, "Tool", None)
         if tool_cls:
-            tool_id = lambda self, a, kw: getattr(self, "tool_name", getattr(self, "name", type(self).__name__))
-            if _wrap_method(tool_cls, "__call__", "strands-agents", tool_id):
+            if _wrap_method(tool_cls, "__call__", "strands-agents", _STRANDS_TOOL_ID):
                 ok = True
     except (ImportError, AttributeError):
         pass
@@ -509,8 +913,7 @@ def _patch_smolagents() -> bool:
     """Patch HuggingFace Smolagents Tool.__call__."""
     mod = importlib.import_module("smolagents")
     cls = getattr(mod, "Tool")
-    tool_id = lambda self, a, kw: getattr(self, "name", type(self).__name__)
-    return _wrap_method(cls, "__call__", "smolagents", tool_id)
+    return _wrap_method(cls, "__call__", "smolagents", _NAME_TOOL_ID)
 
 
 def _patch_haystack() -> bool:
@@ -519,8 +922,7 @@ def _patch_haystack() -> bool:
     cls = getattr(mod, "Pipeline", None)
     if cls is None:
         return False
-    tool_id = lambda self, a, kw: "haystack/pipeline"
-    return _wrap_method(cls, "run", "haystack", tool_id)
+    return _wrap_method(cls, "run", "haystack", _HAYSTACK_TOOL_ID)
 
 
 _PATCHERS: dict[str, Callable[[], bool]] = {
@@ -538,6 +940,26 @@ _PATCHERS: dict[str, Callable[[], bool]] = {
 }
 
 
+# Module whose first import signals that a framework is in use, mapped to the
+# framework name and its patcher. Each patcher only imports modules that the
+# trigger module has already pulled in (or that belong to the same framework).
+_IMPORT_HOOKS: dict[str, tuple[str, Callable[[], bool]]] = {
+    "langchain_core.tools": ("langchain", _patch_langchain_core),
+    "langchain.tools": ("langchain", _patch_langchain_core),
+    "langgraph.prebuilt.tool_node": ("langchain", _patch_langchain),
+    "deepagents": ("deepagents", _patch_deepagents),
+    "crewai.tools": ("crewai", _patch_crewai),
+    "autogen": ("autogen", _patch_autogen),
+    "agents": ("openai-agents", _patch_openai_agents),
+    "pydantic_ai": ("pydantic-ai", _patch_pydantic_ai),
+    "google.adk": ("google-adk", _patch_google_adk),
+    "llama_index.core.tools": ("llamaindex", _patch_llamaindex),
+    "strands": ("strands-agents", _patch_strands_agents),
+    "smolagents": ("smolagents", _patch_smolagents),
+    "haystack": ("haystack", _patch_haystack),
+}
+
+
 # Auto-install when FARAMESH_AUTOLOAD=1
 if os.environ.get("FARAMESH_AUTOLOAD") == "1":
     install()
@@ -31,26 +31,39 @@ Example:
     >>> with callbacks.subscribe(on_event):
     ...     run_my_agent()
 
-The callback runs on a background daemon thread. The daemon buffers ~64
-events per subscriber and silently drops further events if the consumer
-falls behind.
+The callback runs on a worker thread fed by a bounded in-process queue
+(see :mod:`faramesh.audit` for the ``queue_size`` / ``overflow`` /
+``workers`` / ``loop`` options, which behave the same here). The daemon
+buffers ~64 events per subscriber and silently drops further events if
+the socket is not read fast enough.
 """
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import Callable
 from typing import Any
 
-from ._subscription import CALLBACK_SUBSCRIBE, Subscription
+from ._subscription import CALLBACK_SUBSCRIBE, OVERFLOW_BLOCK, Subscription, SubscriptionStats
 
-__all__ = ["Subscription", "subscribe"]
+__all__ = ["Subscription", "SubscriptionStats", "subscribe"]
 
 
 def subscribe(
-    callback: Callable[[dict[str, Any]], None],
+    callback: Callable[[Any], Any],
     *,
     socket_path: str | None = None,
     connect_timeout: float = 5.0,
+    queue_size: int = 1024,
+    overflow: str = OVERFLOW_BLOCK,
+    workers: int = 1,
+    loop: asyncio.AbstractEventLoop | None = None,
+    spill_dir: str | None = None,
+    reconnect: bool = False,
+    reconnect_delay: float = 0.5,
+    max_reconnect_delay: float = 30.0,
+    batch_size: int | None = None,
+    max_latency_ms: float = 100.0,
 ) -> Subscription:
     """Subscribe to the daemon's lifecycle stream (``callback_subscribe``).
 
@@ -66,16 +79,41 @@ def subscribe(
     Filter inside your callback if needed.
 
     Args:
-        callback: Invoked once per lifecycle event from a background thread.
+        callback: Invoked once per lifecycle event from a background thread,
+            or once per list of events when ``batch_size`` is set.
         socket_path: Path to the daemon's Unix socket. Defaults to
             ``$FARAMESH_SOCKET`` then ``/tmp/faramesh.sock``.
         connect_timeout: Seconds to wait for connect and the
             subscription confirmation.
+        queue_size: Events buffered between the socket reader and the
+            callback (default: 1024).
+        overflow: What to do when that buffer is full: ``"block"`` the
+            reader (default), ``"drop_oldest"``, or ``"spill"`` to a
+            temporary file and deliver in order once the callback catches up.
+        workers: Threads invoking the callback. More than one delivers
+            concurrently and does not preserve event order.
+        loop: Run the callback on this asyncio event loop instead of a
+            worker thread. Coroutine callbacks are awaited there; when
+            ``subscribe`` is called from a coroutine, the running loop is
+            used by default.
+        spill_dir: Directory for the ``"spill"`` file (default: system temp).
+        reconnect: Re-establish a dropped stream with jittered backoff and
+            resume from the last ``seq`` received, so events the daemon
+            still holds in its replay window are not lost. Gaps that
+            cannot be replayed are counted in ``stats.missed``.
+        reconnect_delay: Base delay before the first reconnect attempt.
+        max_reconnect_delay: Cap on the delay between attempts.
+        batch_size: Deliver lists of up to this many events per callback
+            call instead of one event per call (default: unbatched).
+        max_latency_ms: With ``batch_size``, the longest an event waits
+            for its batch to fill before a partial batch is delivered.
 
     Returns:
         A ``Subscription`` handle.
 
     Raises:
+        ValueError: Unknown ``overflow`` policy, or a coroutine callback
+            without an event loop.
         ConnectionError: The socket could not be opened or the request
             could not be sent.
         TimeoutError: The daemon did not return the subscription
@@ -86,6 +124,16 @@ def subscribe(
         request_type=CALLBACK_SUBSCRIBE,
         socket_path=socket_path,
         connect_timeout=connect_timeout,
+        queue_size=queue_size,
+        overflow=overflow,
+        workers=workers,
+        loop=loop,
+        spill_dir=spill_dir,
+        reconnect=reconnect,
+        reconnect_delay=reconnect_delay,
+        max_reconnect_delay=max_reconnect_delay,
+        batch_size=batch_size,
+        max_latency_ms=max_latency_ms,
     )
     sub.start()
     return sub
@@ -30,17 +30,27 @@ Example usage:
 
 from __future__ import annotations
 
+import atexit
 import os
 import json
+import logging
+import threading
 import time
 import warnings
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor
+from concurrent.futures import wait as futures_wait
 from dataclasses import dataclass
-from typing import Any, Dict, Optional, List, Union, Callable
+from typing import Any, Dict, Iterable, Iterator, Optional, List, Tuple, Union, Callable
 from pathlib import Path
 from urllib.parse import urlparse
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException, Timeout, ConnectionError as RequestsConnectionError
 
+from . import _retry
+from ._waiters import WaiterRegistry
+
 try:
     import yaml
 except ImportError:
@@ -49,6 +59,8 @@ except ImportError:
 
 __version__ = "0.3.2"
 
+logger = logging.getLogger("faramesh.client")
+
 
 # Global configuration
 _config: Optional[ClientConfig] = None
@@ -63,6 +75,9 @@ class ClientConfig:
     timeout: float = 30.0
     max_retries: int = 3
     retry_backoff_factor: float = 0.5
+    # HTTP connection pool (per base_url, shared by all threads)
+    pool_connections: int = 10
+    pool_maxsize: int = 10
     # Telemetry callbacks
     on_request_start: Optional[Callable[[str, str], None]] = None  # (method, url)
     on_request_end: Optional[Callable[[str, str, int, float], None]] = None  # (method, url, status_code, duration_ms)
@@ -101,11 +116,28 @@ class ClientConfig:
                     self.retry_backoff_factor = float(backoff_env)
                 except ValueError:
                     pass
+        # Load connection pool sizes from env
+        if self.pool_connections == 10:
+            pool_env = os.getenv("FARAMESH_HTTP_POOL_CONNECTIONS")
+            if pool_env:
+                try:
+                    self.pool_connections = max(1, int(pool_env))
+                except ValueError:
+                    pass
+        if self.pool_maxsize == 10:
+            pool_env = os.getenv("FARAMESH_HTTP_POOL_MAXSIZE")
+            if pool_env:
+                try:
+                    self.pool_maxsize = max(1, int(pool_env))
+                except ValueError:
+                    pass
 
 
 class FarameshError(Exception):
     """Base exception for all Faramesh SDK errors."""
-    pass
+
+    # HTTP status of the failed response, when the error came from one.
+    status_code: Optional[int] = None
 
 
 class FarameshAuthError(FarameshError):
@@ -133,6 +165,14 @@ class FarameshConnectionError(FarameshError):
     pass
 
 
+class FarameshCircuitOpenError(FarameshConnectionError):
+    """Raised without contacting the server while its circuit breaker is open."""
+
+    def __init__(self, message: str, retry_in: float = 0.0):
+        super().__init__(message)
+        self.retry_in = retry_in
+
+
 class FarameshValidationError(FarameshError):
     """Raised when request validation fails (422)."""
     pass
@@ -199,6 +239,8 @@ def configure(
     on_request_start: Optional[Callable[[str, str], None]] = None,
     on_request_end: Optional[Callable[[str, str, int, float], None]] = None,
     on_error: Optional[Callable[[Exception], None]] = None,
+    pool_connections: Optional[int] = None,
+    pool_maxsize: Optional[int] = None,
 ) -> None:
     """Configure the global SDK client.
 
@@ -211,6 +253,9 @@ def configure(
         on_request_start: Callback called before each request (method, url)
         on_request_end: Callback called after each request (method, url, status_code, duration_ms)
         on_error: Callback called on errors (error)
+        pool_connections: Number of host pools kept by the HTTP adapter (default: 10)
+        pool_maxsize: Keep-alive connections per host, i.e. how many threads can
+            talk to the server concurrently without opening new sockets (default: 10)
 
     Example:
         >>> configure(base_url="http://localhost:8000", token="my-token")
@@ -226,8 +271,10 @@ def configure(
         base_url=base_url or os.getenv("FARAMESH_BASE_URL") or os.getenv("FARA_API_BASE") or "http://127.0.0.1:8000",
         token=token,
         timeout=timeout or 30.0,
-        max_retries=max_retries or 3,
-        retry_backoff_factor=retry_backoff_factor or 0.5,
+        max_retries=3 if max_retries is None else max_retries,
+        retry_backoff_factor=0.5 if retry_backoff_factor is None else retry_backoff_factor,
+        pool_connections=pool_connections or 10,
+        pool_maxsize=pool_maxsize or 10,
         on_request_start=on_request_start or (existing_config.on_request_start if existing_config else None),
         on_request_end=on_request_end or (existing_config.on_request_end if existing_config else None),
         on_error=on_error or (existing_config.on_error if existing_config else None),
@@ -242,6 +289,117 @@ def _get_config() -> ClientConfig:
     return _config
 
 
+# Pooled HTTP sessions, one per (base_url, pool sizes). A requests.Session
+# keeps connections alive between calls; sharing it across threads is safe
+# for plain request/response use because the urllib3 pool hands each thread
+# its own connection.
+_sessions: Dict[Tuple[str, int, int], requests.Session] = {}
+_sessions_lock = threading.Lock()
+# ExecutionGovernorClient instances holding each pooled session; a client's
+# close() only closes the pool once no other client still holds it.
+_session_refs: Dict[Tuple[str, int, int], int] = {}
+
+
+def _session_key(config: ClientConfig) -> Tuple[str, int, int]:
+    return (config.base_url, config.pool_connections, config.pool_maxsize)
+
+
+def _get_session(config: Optional[ClientConfig] = None) -> requests.Session:
+    """Return the shared keep-alive session for ``config`` (default: global config)."""
+    config = config or _get_config()
+    key = _session_key(config)
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=config.pool_connections,
+                pool_maxsize=config.pool_maxsize,
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _sessions[key] = session
+        return session
+
+
+def _acquire_session(key: Tuple[str, int, int]) -> None:
+    with _sessions_lock:
+        _session_refs[key] = _session_refs.get(key, 0) + 1
+
+
+def _release_session(key: Tuple[str, int, int]) -> None:
+    with _sessions_lock:
+        refs = _session_refs.get(key, 0) - 1
+        if refs > 0:
+            _session_refs[key] = refs
+            return
+        _session_refs.pop(key, None)
+        session = _sessions.pop(key, None)
+    if session is not None:
+        session.close()
+
+
+def close_sessions() -> None:
+    """Close every pooled HTTP connection held by the SDK.
+
+    Called automatically at interpreter exit. Safe to call at any time:
+    the next request simply opens a fresh pool.
+    """
+    with _sessions_lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+    for session in sessions:
+        try:
+            session.close()
+        except Exception:
+            pass
+
+
+def _forget_sessions_after_fork() -> None:
+    # A forked child must not reuse sockets owned by its parent.
+    global _sessions_lock
+    _sessions.clear()
+    _sessions_lock = threading.Lock()
+
+
+atexit.register(close_sessions)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_sessions_after_fork)
+
+
+# Callables notified with every action dict the client receives, e.g. the
+# provenance index (see gate.enable_provenance_index). Empty by default.
+_action_observers: List[Callable[[Dict[str, Any]], None]] = []
+
+
+def _observe_actions(actions: Any) -> None:
+    if not _action_observers:
+        return
+    for action in actions if isinstance(actions, list) else [actions]:
+        if not isinstance(action, dict):
+            continue
+        for observer in list(_action_observers):
+            try:
+                observer(action)
+            except Exception as e:
+                logger.debug("faramesh: action observer failed: %s", e)
+
+
+def _retry_allowed(config: ClientConfig, attempt: int, budget: _retry.RetryBudget) -> bool:
+    """Whether another attempt may be sent: attempts left and budget not drained."""
+    return attempt < config.max_retries and budget.try_acquire()
+
+
+def _retry_sleep(backoff: _retry.Backoff, response: Optional[requests.Response] = None) -> None:
+    """Sleep a jittered backoff, or longer if the server sent ``Retry-After``."""
+    delay = backoff.next()
+    if response is not None:
+        retry_after = _retry.parse_retry_after(response.headers.get("Retry-After"))
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+    time.sleep(delay)
+
+
 def _make_request(
     method: str,
     path: str,
@@ -250,6 +408,13 @@ def _make_request(
 ) -> Dict[str, Any]:
     """Make an HTTP request to the Faramesh API with retry logic.
 
+    Connection errors, timeouts, 429 and 5xx responses are retried up to
+    ``config.max_retries`` times with decorrelated-jitter backoff (or the
+    server's ``Retry-After``), as long as the process-wide retry budget for
+    the server allows it. Repeated failures open a circuit breaker, after
+    which calls fail fast with :class:`FarameshCircuitOpenError` until a
+    probe request succeeds (see :mod:`faramesh._retry`).
+
     Args:
         method: HTTP method (GET, POST, etc.)
         path: API path (e.g., "/v1/actions")
@@ -266,6 +431,7 @@ def _make_request(
         FarameshValidationError: On 422 validation error
         FarameshTimeoutError: On timeout
         FarameshConnectionError: On connection failure
+        FarameshCircuitOpenError: While the server's circuit breaker is open
         FarameshServerError: On 5xx server errors
     """
     config = _get_config()
@@ -275,7 +441,10 @@ def _make_request(
     if config.token:
         headers["Authorization"] = f"Bearer {config.token}"
 
-    session = requests.Session()
+    session = _get_session(config)
+    breaker = _retry.get_breaker(config.base_url)
+    budget = _retry.get_budget(config.base_url)
+    backoff = _retry.Backoff(config.retry_backoff_factor)
     last_exception = None
 
     # Call telemetry callback
@@ -288,6 +457,23 @@ def _make_request(
     start_time = time.time()
 
     for attempt in range(config.max_retries + 1):
+        try:
+            breaker.before_call()
+        except _retry.CircuitOpenError as e:
+            error = FarameshCircuitOpenError(
+                f"Faramesh server {config.base_url} unavailable ({e})", retry_in=e.retry_in
+            )
+            if config.on_error:
+                try:
+                    config.on_error(error)
+                except Exception:
+                    pass
+            if config.on_request_end:
+                try:
+                    config.on_request_end(method, url, 0, (time.time() - start_time) * 1000)
+                except Exception:
+                    pass
+            raise error
         try:
             response = session.request(
                 method=method,
@@ -299,6 +485,10 @@ def _make_request(
             )
 
             duration_ms = (time.time() - start_time) * 1000
+            if response.status_code >= 500:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
 
             # Handle specific status codes
             if response.status_code == 401:
@@ -348,17 +538,20 @@ def _make_request(
                     except Exception:
                         pass
                 raise error
+            elif response.status_code == 429 and _retry_allowed(config, attempt, budget):
+                _retry_sleep(backoff, response)
+                continue
             elif response.status_code >= 500:
                 error_msg = f"Server error ({response.status_code}) on {path}: {response.text}"
                 error = FarameshServerError(error_msg)
                 # Retry on 5xx errors
-                if attempt < config.max_retries:
+                if _retry_allowed(config, attempt, budget):
                     if config.on_error:
                         try:
                             config.on_error(error)
                         except Exception:
                             pass
-                    time.sleep(config.retry_backoff_factor * (2 ** attempt))
+                    _retry_sleep(backoff, response)
                     continue
                 if config.on_request_end:
                     try:
@@ -416,13 +609,14 @@ def _make_request(
             raise
         except Timeout as e:
             last_exception = FarameshTimeoutError(f"Request timed out after {config.timeout}s: {url}")
-            if attempt < config.max_retries:
+            breaker.record_failure()
+            if _retry_allowed(config, attempt, budget):
                 if config.on_error:
                     try:
                         config.on_error(last_exception)
                     except Exception:
                         pass
-                time.sleep(config.retry_backoff_factor * (2 ** attempt))
+                _retry_sleep(backoff)
                 continue
             if config.on_error:
                 try:
@@ -438,13 +632,14 @@ def _make_request(
             raise last_exception
         except RequestsConnectionError as e:
             last_exception = FarameshConnectionError(f"Failed to connect to {config.base_url}: {str(e)}")
-            if attempt < config.max_retries:
+            breaker.record_failure()
+            if _retry_allowed(config, attempt, budget):
                 if config.on_error:
                     try:
                         config.on_error(last_exception)
                     except Exception:
                         pass
-                time.sleep(config.retry_backoff_factor * (2 ** attempt))
+                _retry_sleep(backoff)
                 continue
             if config.on_error:
                 try:
@@ -463,13 +658,14 @@ def _make_request(
             error_str = str(e).lower()
             if "connection" in error_str or "failed to resolve" in error_str or "name or service not known" in error_str:
                 last_exception = FarameshConnectionError(f"Failed to connect to {config.base_url}: {str(e)}")
-                if attempt < config.max_retries:
+                breaker.record_failure()
+                if _retry_allowed(config, attempt, budget):
                     if config.on_error:
                         try:
                             config.on_error(last_exception)
                         except Exception:
                             pass
-                    time.sleep(config.retry_backoff_factor * (2 ** attempt))
+                    _retry_sleep(backoff)
                     continue
                 if config.on_error:
                     try:
@@ -484,28 +680,33 @@ def _make_request(
                         pass
                 raise last_exception
             # Retry on 5xx errors
-            if attempt < config.max_retries and hasattr(e, 'response') and e.response is not None and e.response.status_code >= 500:
+            if (
+                hasattr(e, 'response') and e.response is not None and e.response.status_code >= 500
+                and _retry_allowed(config, attempt, budget)
+            ):
                 if config.on_error:
                     try:
                         config.on_error(FarameshServerError(f"Server error: {str(e)}"))
                     except Exception:
                         pass
-                time.sleep(config.retry_backoff_factor * (2 ** attempt))
+                _retry_sleep(backoff)
                 continue
+            # Anything else (4xx, malformed responses) won't improve on retry.
             last_exception = FarameshError(f"Request failed on {path}: {str(e)}")
-            if attempt == config.max_retries:
-                if config.on_error:
-                    try:
-                        config.on_error(last_exception)
-                    except Exception:
-                        pass
-                if config.on_request_end:
-                    try:
-                        duration_ms = (time.time() - start_time) * 1000
-                        config.on_request_end(method, url, 0, duration_ms)
-                    except Exception:
-                        pass
-                raise last_exception
+            if getattr(e, "response", None) is not None:
+                last_exception.status_code = e.response.status_code
+            if config.on_error:
+                try:
+                    config.on_error(last_exception)
+                except Exception:
+                    pass
+            if config.on_request_end:
+                try:
+                    duration_ms = (time.time() - start_time) * 1000
+                    config.on_request_end(method, url, 0, duration_ms)
+                except Exception:
+                    pass
+            raise last_exception
 
     if last_exception:
         if config.on_error:
@@ -563,11 +764,276 @@ def submit_action(
         "params": params or {},
         "context": context or {},
     }
-    return _make_request("POST", "/v1/actions", json_data=payload)
+    action = _make_request("POST", "/v1/actions", json_data=payload)
+    _observe_actions(action)
+    return action
+
+
+def _submit_spec(action_spec: Dict[str, Any]) -> Dict[str, Any]:
+    return submit_action(
+        agent_id=action_spec["agent_id"],
+        tool=action_spec["tool"],
+        operation=action_spec["operation"],
+        params=action_spec.get("params", {}),
+        context=action_spec.get("context", {}),
+    )
+
+
+# Outcome placeholder for actions never sent because stop_on_error tripped.
+_SKIPPED = object()
+
+
+def _run_bounded(
+    items: List[Any],
+    fn: Callable[[Any], Any],
+    concurrency: int,
+    stop_on_error: bool,
+    failed: Callable[[Any], bool],
+) -> List[Any]:
+    """Apply ``fn`` to every item, keeping at most ``concurrency`` calls in flight.
+
+    Returns one outcome per item, in input order: ``fn``'s return value, the
+    exception it raised, or ``_SKIPPED``. New calls are only started as
+    earlier ones finish, so once an outcome is ``failed`` and
+    ``stop_on_error`` is set, nothing new starts after the in-flight calls
+    complete.
+    """
+    outcomes: List[Any] = [_SKIPPED] * len(items)
+    if concurrency <= 1 or len(items) <= 1:
+        for i, item in enumerate(items):
+            try:
+                outcomes[i] = fn(item)
+            except Exception as e:
+                outcomes[i] = e
+            if stop_on_error and failed(outcomes[i]):
+                break
+        return outcomes
+
+    workers = min(concurrency, len(items))
+    queue = iter(enumerate(items))
+    in_flight: Dict[Future, int] = {}
+    stopped = False
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="faramesh-submit") as pool:
+        while True:
+            while not stopped and len(in_flight) < workers:
+                item = next(queue, None)
+                if item is None:
+                    break
+                in_flight[pool.submit(fn, item[1])] = item[0]
+            if not in_flight:
+                break
+            done, _ = futures_wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                i = in_flight.pop(future)
+                error = future.exception()
+                outcomes[i] = future.result() if error is None else error
+                if stop_on_error and failed(outcomes[i]):
+                    stopped = True
+    return outcomes
+
+
+def _submit_all(
+    actions: List[Dict[str, Any]],
+    concurrency: int,
+    stop_on_error: bool,
+) -> List[Any]:
+    """Submit ``actions`` one request each; one outcome per action, in order."""
+    return _run_bounded(actions, _submit_spec, concurrency, stop_on_error, _is_failure)
+
+
+_BATCH_PATH = "/v1/actions:batch"
+DEFAULT_BATCH_SIZE = 500
+DEFAULT_BATCH_MAX_BYTES = 1_000_000
+
+# base_url -> False once the server answered 404 for the batch endpoint.
+_batch_unsupported: Dict[str, bool] = {}
+
+
+class _BatchUnsupported(Exception):
+    """The server has no batch endpoint; fall back to one request per action."""
+
+
+def _chunk_bounds(
+    actions: List[Dict[str, Any]], max_items: int, max_bytes: int
+) -> List[Tuple[int, int]]:
+    """Split ``actions`` into ``[start, end)`` ranges bounded by count and JSON size.
+
+    An action larger than ``max_bytes`` on its own still gets a chunk.
+    """
+    bounds: List[Tuple[int, int]] = []
+    start = 0
+    size = 0
+    for i, action_spec in enumerate(actions):
+        item_size = len(json.dumps(action_spec, default=str)) + 2
+        if i > start and (i - start >= max_items or size + item_size > max_bytes):
+            bounds.append((start, i))
+            start, size = i, 0
+        size += item_size
+    if start < len(actions):
+        bounds.append((start, len(actions)))
+    return bounds
+
+
+def _batch_item_outcome(item: Any) -> Any:
+    """Turn one entry of a batch response into a response dict or an exception."""
+    if not isinstance(item, dict):
+        return FarameshError(f"Malformed batch result: {item!r}")
+    if item.get("error") and "id" not in item:
+        error = item["error"]
+        if isinstance(error, dict):
+            error = error.get("message") or error.get("detail") or json.dumps(error)
+        return FarameshError(str(error))
+    # Same denial rules as a single POST /v1/actions.
+    if item.get("status") == "denied" or (
+        item.get("decision") == "deny" and item.get("status") != "pending_approval"
+    ):
+        reason = item.get("reason", "Action denied by policy")
+        return FarameshPolicyError(f"Action denied by policy: {reason}")
+    return item
+
+
+def _submit_batch(actions: List[Dict[str, Any]]) -> List[Any]:
+    """POST one chunk to the batch endpoint; one outcome per action, in order.
+
+    Request body: ``{"actions": [{agent_id, tool, operation, params, context}, ...]}``.
+    Response: ``{"results": [...]}`` (or a bare list) with one entry per
+    action, either the created action or ``{"error": ...}``.
+
+    Any other rejection of the request (say a 400/422 for the whole body)
+    becomes the outcome of every action in the chunk: resubmitting them one
+    by one could duplicate actions the server already accepted.
+
+    Raises:
+        _BatchUnsupported: If the server does not expose the batch endpoint
+            (404 or 405). The answer is remembered per base URL.
+    """
+    outcomes: List[Any] = [_SKIPPED] * len(actions)
+    sent: List[int] = []
+    payload: List[Dict[str, Any]] = []
+    for i, action_spec in enumerate(actions):
+        try:
+            payload.append({
+                "agent_id": action_spec["agent_id"],
+                "tool": action_spec["tool"],
+                "operation": action_spec["operation"],
+                "params": action_spec.get("params", {}),
+                "context": action_spec.get("context", {}),
+            })
+        except (KeyError, TypeError) as e:
+            outcomes[i] = FarameshValidationError(f"Invalid action spec: missing {e}")
+            continue
+        sent.append(i)
+    if not payload:
+        return outcomes
+
+    config = _get_config()
+    try:
+        data = _make_request("POST", _BATCH_PATH, json_data={"actions": payload})
+    except FarameshNotFoundError:
+        _batch_unsupported[config.base_url] = True
+        raise _BatchUnsupported()
+    except (FarameshAuthError, FarameshConnectionError, FarameshTimeoutError, FarameshServerError):
+        raise
+    except FarameshError as e:
+        if e.status_code != 405:
+            for i in sent:
+                outcomes[i] = e
+            return outcomes
+        # A server that routes the path but not the method.
+        logger.debug("faramesh: batch endpoint not allowed (%s); submitting singly", e)
+        _batch_unsupported[config.base_url] = True
+        raise _BatchUnsupported()
+
+    results = data.get("results") if isinstance(data, dict) else data
+    if not isinstance(results, list) or len(results) != len(payload):
+        count = len(results) if isinstance(results, list) else 0
+        error = FarameshError(
+            f"Batch response has {count} results for {len(payload)} actions"
+        )
+        for i in sent:
+            outcomes[i] = error
+        return outcomes
+    for i, item in zip(sent, results):
+        outcomes[i] = _batch_item_outcome(item)
+    _observe_actions(results)
+    return outcomes
+
+
+def _chunk_failed(outcome: Any) -> bool:
+    if isinstance(outcome, BaseException):
+        return True
+    return any(_is_failure(o) for o in outcome)
+
+
+def _submit_chunked(
+    actions: List[Dict[str, Any]],
+    concurrency: int,
+    stop_on_error: bool,
+    batch_size: int,
+    batch_max_bytes: int,
+) -> List[Any]:
+    """Submit through the batch endpoint in bounded chunks, falling back to
+    one request per action when the server doesn't support it."""
+    config = _get_config()
+    if len(actions) <= 1 or _batch_unsupported.get(config.base_url):
+        return _submit_all(actions, concurrency, stop_on_error)
+
+    bounds = _chunk_bounds(actions, max(1, batch_size), max(1, batch_max_bytes))
+    outcomes: List[Any] = [_SKIPPED] * len(actions)
+
+    def place(bound: Tuple[int, int], chunk_outcome: Any) -> None:
+        start, end = bound
+        if chunk_outcome is _SKIPPED:
+            return
+        if isinstance(chunk_outcome, BaseException):
+            chunk_outcome = [chunk_outcome] * (end - start)
+        outcomes[start:end] = chunk_outcome
+
+    # The first chunk goes alone: it tells us whether the endpoint exists
+    # before the rest are pipelined.
+    first = bounds[0]
+    try:
+        first_outcome: Any = _submit_batch(actions[first[0]:first[1]])
+    except _BatchUnsupported:
+        return _submit_all(actions, concurrency, stop_on_error)
+    except Exception as e:
+        first_outcome = e
+    place(first, first_outcome)
+    if stop_on_error and _chunk_failed(first_outcome):
+        return outcomes
+
+    rest = bounds[1:]
+    chunk_outcomes = _run_bounded(
+        rest,
+        lambda bound: _submit_batch(actions[bound[0]:bound[1]]),
+        concurrency,
+        stop_on_error,
+        _chunk_failed,
+    )
+    for bound, chunk_outcome in zip(rest, chunk_outcomes):
+        place(bound, chunk_outcome)
+    return outcomes
+
+
+def _is_failure(outcome: Any) -> bool:
+    return outcome is _SKIPPED or isinstance(outcome, BaseException)
+
+
+def _error_entry(outcome: Any, action_spec: Dict[str, Any]) -> Dict[str, Any]:
+    if outcome is _SKIPPED:
+        return {
+            "error": "skipped: an earlier action in the batch failed",
+            "skipped": True,
+            "action_spec": action_spec,
+        }
+    return {"error": str(outcome), "action_spec": action_spec}
 
 
 def submit_actions(
     actions: List[Dict[str, Any]],
+    *,
+    concurrency: int = 1,
+    stop_on_error: bool = False,
 ) -> List[Dict[str, Any]]:
     """Submit multiple actions in batch.
 
@@ -578,9 +1044,16 @@ def submit_actions(
             - operation (required)
             - params (optional, default: {})
             - context (optional, default: {})
+        concurrency: Maximum number of submissions in flight at once
+            (default: 1, i.e. one after another). Values above the client's
+            ``pool_maxsize`` open extra, non-pooled connections.
+        stop_on_error: Stop starting new submissions after the first failure.
+            Actions that were never sent get a placeholder with
+            ``"skipped": True``.
 
     Returns:
-        List of action response dicts
+        List of action response dicts, in the same order as ``actions``.
+        Failed actions are represented by ``{"error": ..., "action_spec": ...}``.
 
     Raises:
         FarameshError: On errors
@@ -589,27 +1062,18 @@ def submit_actions(
         >>> actions = submit_actions([
         ...     {"agent_id": "agent1", "tool": "http", "operation": "get", "params": {"url": "https://example.com"}},
         ...     {"agent_id": "agent2", "tool": "http", "operation": "get", "params": {"url": "https://example.org"}},
-        ... ])
+        ... ], concurrency=8)
         >>> for action in actions:
         ...     print(f"Action {action['id']}: {action['status']}")
     """
+    outcomes = _submit_all(actions, concurrency, stop_on_error)
     results = []
-    for action_spec in actions:
-        try:
-            result = submit_action(
-                agent_id=action_spec["agent_id"],
-                tool=action_spec["tool"],
-                operation=action_spec["operation"],
-                params=action_spec.get("params", {}),
-                context=action_spec.get("context", {}),
-            )
-            results.append(result)
-        except Exception as e:
+    for action_spec, outcome in zip(actions, outcomes):
+        if _is_failure(outcome):
             # Include error in results for failed actions
-            results.append({
-                "error": str(e),
-                "action_spec": action_spec,
-            })
+            results.append(_error_entry(outcome, action_spec))
+        else:
+            results.append(outcome)
     return results
 
 
@@ -617,9 +1081,20 @@ def submit_actions_bulk(
     actions: List[Dict[str, Any]],
     *,
     raise_on_error: bool = False,
+    concurrency: int = 1,
+    stop_on_error: bool = False,
+    use_batch_endpoint: bool = True,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    batch_max_bytes: int = DEFAULT_BATCH_MAX_BYTES,
 ) -> List[Dict[str, Any]]:
     """Submit multiple actions in batch with error handling control.
 
+    Actions are sent to ``POST /v1/actions:batch`` in chunks of at most
+    ``batch_size`` actions and roughly ``batch_max_bytes`` of JSON, with up to
+    ``concurrency`` chunks in flight. Servers without the batch endpoint are
+    detected on the first chunk (and remembered per base_url); the call then
+    falls back to one ``POST /v1/actions`` per action.
+
     Args:
         actions: List of action specifications. Each dict should have:
             - agent_id (required)
@@ -629,9 +1104,20 @@ def submit_actions_bulk(
             - context (optional, default: {})
         raise_on_error: If True, raise FarameshBatchError on any failure.
                         If False, return list with error placeholders.
+        concurrency: Maximum number of requests (chunks, or single actions
+                     without the batch endpoint) in flight at once (default: 1).
+        stop_on_error: Stop starting new requests after the first failure.
+                       Unsent actions are neither successes nor errors; with
+                       raise_on_error=False they get a ``"skipped": True``
+                       placeholder so results stay aligned with ``actions``.
+        use_batch_endpoint: Set False to always submit one action per request.
+        batch_size: Maximum actions per batch request (default: 500).
+        batch_max_bytes: Approximate maximum JSON size per batch request
+                         (default: 1 MB).
 
     Returns:
-        List of action response dicts (or error dicts if raise_on_error=False)
+        List of action response dicts (or error dicts if raise_on_error=False),
+        in the same order as ``actions``
 
     Raises:
         FarameshBatchError: If raise_on_error=True and any action fails
@@ -640,30 +1126,25 @@ def submit_actions_bulk(
         >>> actions = submit_actions_bulk([
         ...     {"agent_id": "agent1", "tool": "http", "operation": "get", "params": {"url": "https://example.com"}},
         ...     {"agent_id": "agent2", "tool": "http", "operation": "get", "params": {"url": "https://example.org"}},
-        ... ], raise_on_error=True)
+        ... ], raise_on_error=True, concurrency=8)
     """
     successes = []
     errors = []
 
-    for i, action_spec in enumerate(actions):
-        try:
-            result = submit_action(
-                agent_id=action_spec["agent_id"],
-                tool=action_spec["tool"],
-                operation=action_spec["operation"],
-                params=action_spec.get("params", {}),
-                context=action_spec.get("context", {}),
-            )
-            successes.append(result)
-        except Exception as e:
-            error_entry = {
-                "error": str(e),
-                "index": i,
-                "action_spec": action_spec,
-            }
+    if use_batch_endpoint:
+        outcomes = _submit_chunked(actions, concurrency, stop_on_error, batch_size, batch_max_bytes)
+    else:
+        outcomes = _submit_all(actions, concurrency, stop_on_error)
+    for i, (action_spec, outcome) in enumerate(zip(actions, outcomes)):
+        if not _is_failure(outcome):
+            successes.append(outcome)
+            continue
+        error_entry = _error_entry(outcome, action_spec)
+        error_entry["index"] = i
+        if outcome is not _SKIPPED:
             errors.append(error_entry)
-            if not raise_on_error:
-                successes.append(error_entry)
+        if not raise_on_error:
+            successes.append(error_entry)
 
     if raise_on_error and errors:
         raise FarameshBatchError(
@@ -675,6 +1156,293 @@ def submit_actions_bulk(
     return successes
 
 
+def _iter_bounded(
+    items: Iterable[Any],
+    fn: Callable[[Any], Any],
+    concurrency: int,
+    *,
+    ordered: bool = True,
+    stop: Callable[[], bool] = lambda: False,
+    thread_name_prefix: str = "faramesh-submit",
+) -> Iterator[Tuple[int, Any, Future]]:
+    """Lazily apply ``fn`` to ``items`` on a thread pool, yielding finished futures.
+
+    Yields ``(index, item, future)`` in input order or as completed. At most
+    ``concurrency`` items are pending (running, or done and waiting for an
+    earlier one when ``ordered``); the next item is only read from ``items``
+    when a slot frees up, and none are read once ``stop()`` returns True.
+    Closing the generator cancels work that has not started.
+    """
+    concurrency = max(1, concurrency)
+    source = enumerate(items)
+    pending: "OrderedDict[Future, Tuple[int, Any]]" = OrderedDict()
+    exhausted = False
+    pool = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix=thread_name_prefix)
+    try:
+        while True:
+            while not exhausted and len(pending) < concurrency and not stop():
+                entry = next(source, None)
+                if entry is None:
+                    exhausted = True
+                    break
+                pending[pool.submit(fn, entry[1])] = entry
+            if not pending:
+                return
+            if ordered:
+                done = [next(iter(pending))]
+                futures_wait(done)
+            else:
+                done, _ = futures_wait(pending, return_when=FIRST_COMPLETED)
+                done = sorted(done, key=lambda f: pending[f][0])
+            for future in done:
+                i, item = pending.pop(future)
+                yield i, item, future
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _iter_jsonl(file_path: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    """Lazily read one action spec per non-blank line of a JSONL file."""
+    with open(file_path, "r") as f:
+        for line_no, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                raise FarameshValidationError(f"Invalid JSON on line {line_no} of {file_path}: {e}")
+
+
+def submit_stream(
+    actions: Union[Iterable[Dict[str, Any]], str, Path],
+    *,
+    concurrency: int = 8,
+    ordered: bool = True,
+    stop_on_error: bool = False,
+) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """Submit actions from any iterable, yielding results as they finish.
+
+    The input is consumed lazily and at most ``concurrency`` actions are
+    pending at once (in flight, or finished and waiting for an earlier one
+    when ``ordered`` is True), so memory stays constant however long the
+    input is. The next action is only read once a slot frees up, which
+    gives natural backpressure on the reader.
+
+    Args:
+        actions: Iterable of action specifications (same shape as for
+            submit_actions), or the path of a JSONL file with one per line.
+        concurrency: Maximum number of pending submissions (default: 8).
+        ordered: Yield results in input order (default) or as they complete.
+        stop_on_error: Stop reading input after the first failure; actions
+            already in flight are still yielded.
+
+    Yields:
+        ``(index, result)`` pairs, where ``index`` is the action's position in
+        the input and ``result`` is the action response dict or an error
+        placeholder ``{"error": ..., "index": ..., "action_spec": ...}``.
+
+    Example:
+        >>> for i, result in submit_stream("actions.jsonl", concurrency=16):
+        ...     if "error" in result:
+        ...         print(f"line {i + 1} failed: {result['error']}")
+    """
+    source = _iter_jsonl(actions) if isinstance(actions, (str, Path)) else actions
+    stopped = False
+
+    for i, action_spec, future in _iter_bounded(
+        source, _submit_spec, concurrency, ordered=ordered, stop=lambda: stopped
+    ):
+        error = future.exception()
+        if error is None:
+            yield i, future.result()
+            continue
+        if stop_on_error:
+            stopped = True
+        entry = _error_entry(error, action_spec)
+        entry["index"] = i
+        yield i, entry
+
+
+_APPROVAL_SETTLED = ("approved", "denied", "allowed", "succeeded", "failed")
+_COMPLETION_SETTLED = ("succeeded", "failed", "denied")
+
+_action_waiters: Optional[WaiterRegistry] = None
+_action_waiters_lock = threading.Lock()
+
+
+def _check_actions(due: Dict[Tuple[str, str], Any]) -> Dict[Tuple[str, str], Any]:
+    """Batch check for the action waiter registry.
+
+    Keys are ``(kind, action_id)`` with kind ``"approval"`` or
+    ``"completion"``; each distinct action is fetched once per round.
+    """
+    fetched: Dict[str, Any] = {}
+    resolved: Dict[Tuple[str, str], Any] = {}
+    for key in due:
+        kind, action_id = key
+        if action_id not in fetched:
+            try:
+                fetched[action_id] = get_action(action_id)
+            except FarameshError as e:
+                fetched[action_id] = e
+        action = fetched[action_id]
+        if isinstance(action, FarameshError):
+            resolved[key] = action
+            continue
+        settled = _APPROVAL_SETTLED if kind == "approval" else _COMPLETION_SETTLED
+        if action.get("status") in settled:
+            resolved[key] = action
+    return resolved
+
+
+def _iter_stream_chunks(response: requests.Response):
+    """Yield response bytes as soon as they arrive.
+
+    ``iter_content``/``iter_lines`` block until a full chunk is buffered,
+    which would hold back small SSE frames. urllib3 2 exposes ``read1``,
+    which returns whatever is available; older versions fall back to
+    byte-sized reads.
+    """
+    read1 = getattr(response.raw, "read1", None)
+    if read1 is None:
+        yield from response.iter_content(chunk_size=1)
+        return
+    while True:
+        chunk = read1(65536)
+        if not chunk:
+            return
+        yield chunk
+
+
+def _iter_sse_data(response: requests.Response):
+    """Yield the ``data`` payload of each Server-Sent Event on ``response``."""
+    buf = b""
+    data: List[str] = []
+    for chunk in _iter_stream_chunks(response):
+        buf += chunk
+        while b"\n" in buf:
+            raw, buf = buf.split(b"\n", 1)
+            line = raw.rstrip(b"\r").decode("utf-8", "replace")
+            if line == "":
+                if data:
+                    yield "\n".join(data)
+                    data = []
+                continue
+            if line.startswith(":"):
+                continue
+            field, _, value = line.partition(":")
+            if field == "data":
+                data.append(value[1:] if value.startswith(" ") else value)
+    if data:
+        yield "\n".join(data)
+
+
+class _ActionEventStream:
+    """One shared ``/v1/events`` connection that wakes action waiters.
+
+    Any event naming an action that somebody is waiting on triggers an
+    immediate get_action check for it, so approvals and completions are
+    seen within one round trip instead of one poll interval.
+    """
+
+    _RETRY_SECONDS = 30.0
+    _CONNECT_TIMEOUT = 5.0
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._connected = threading.Event()
+        self._finished = threading.Event()
+        self._retry_at = 0.0
+
+    def ensure_started(self) -> bool:
+        """Connect if needed. Returns True while the stream is connected."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return self._connected.is_set()
+            if time.monotonic() < self._retry_at:
+                return False
+            self._connected.clear()
+            self._finished.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="faramesh-action-events", daemon=True
+            )
+            self._thread.start()
+        # Wait for the response headers (or a failure) before reporting.
+        deadline = time.monotonic() + self._CONNECT_TIMEOUT
+        while time.monotonic() < deadline:
+            if self._connected.wait(0.05):
+                return True
+            if self._finished.is_set():
+                return False
+        return self._connected.is_set()
+
+    def _run(self) -> None:
+        try:
+            config = _get_config()
+            headers = {"Accept": "text/event-stream"}
+            if config.token:
+                headers["Authorization"] = f"Bearer {config.token}"
+            with _get_session(config).get(
+                f"{config.base_url}/v1/events",
+                headers=headers,
+                stream=True,
+                timeout=(self._CONNECT_TIMEOUT, None),
+            ) as response:
+                response.raise_for_status()
+                self._connected.set()
+                for payload in _iter_sse_data(response):
+                    self._on_event(payload)
+        except Exception as e:
+            logger.debug(
+                "faramesh: action event stream unavailable (%s); polling instead", e
+            )
+        finally:
+            self._connected.clear()
+            self._retry_at = time.monotonic() + self._RETRY_SECONDS
+            self._finished.set()
+
+    def _on_event(self, payload: str) -> None:
+        try:
+            data = json.loads(payload)
+        except json.JSONDecodeError:
+            return
+        if not isinstance(data, dict):
+            return
+        _observe_actions(data)
+        action_id = data.get("action_id")
+        if not action_id and isinstance(data.get("action"), dict):
+            action_id = data["action"].get("id")
+        if action_id:
+            _get_action_waiters().check_soon(
+                [("approval", action_id), ("completion", action_id)]
+            )
+
+
+_action_events = _ActionEventStream()
+
+
+def _get_action_waiters() -> WaiterRegistry:
+    """Process-wide registry serving block_until_approved and wait_for_completion.
+
+    One background thread serves every outstanding action id. Waiters are
+    woken by the shared ``/v1/events`` stream and confirmed with get_action.
+    They are checked once on registration, which closes the race with an
+    event sent before the wait began, and re-checked every couple of
+    seconds in case an event was missed. When the stream is unavailable
+    they fall back to polling with exponential backoff.
+    """
+    global _action_waiters
+    with _action_waiters_lock:
+        if _action_waiters is None:
+            _action_waiters = WaiterRegistry(
+                "actions",
+                _check_actions,
+                push_active=_action_events.ensure_started,
+            )
+        return _action_waiters
+
+
 def block_until_approved(
     action_id: str,
     *,
@@ -683,12 +1451,13 @@ def block_until_approved(
 ) -> Dict[str, Any]:
     """Block until an action is approved or denied.
 
-    Repeatedly polls get_action until status is "approved" or "denied",
-    or timeout is exceeded.
+    Waits until status is "approved" or "denied", or timeout is exceeded.
+    The wait is driven by the shared ``/v1/events`` stream; if the stream
+    is unavailable, get_action is polled with exponential backoff.
 
     Args:
         action_id: Action ID to wait for
-        poll_interval: Seconds between polls (default: 2)
+        poll_interval: Initial seconds between fallback polls (default: 2)
         timeout: Maximum seconds to wait (default: 300)
 
     Returns:
@@ -704,27 +1473,20 @@ def block_until_approved(
         >>> if action["status"] == "pending_approval":
         ...     approved = block_until_approved(action["id"])
     """
-    start_time = time.time()
-
-    while True:
-        elapsed = time.time() - start_time
-        if elapsed > timeout:
-            raise FarameshTimeoutError(f"Timeout waiting for approval after {timeout}s")
-
-        action = get_action(action_id)
-        status = action.get("status")
-
-        if status == "approved":
-            return action
-        elif status == "denied":
-            reason = action.get("reason", "Action denied")
-            raise FarameshDeniedError(f"Action denied: {reason}")
-        elif status in ("allowed", "succeeded", "failed"):
-            # Already processed, return as-is
-            return action
+    try:
+        action = _get_action_waiters().wait(
+            ("approval", action_id),
+            timeout,
+            poll_interval=poll_interval,
+        )
+    except TimeoutError:
+        raise FarameshTimeoutError(f"Timeout waiting for approval after {timeout}s") from None
 
-        # Still pending, wait and poll again
-        time.sleep(poll_interval)
+    if action.get("status") == "denied":
+        reason = action.get("reason", "Action denied")
+        raise FarameshDeniedError(f"Action denied: {reason}")
+    # approved, or already processed (allowed/succeeded/failed): return as-is
+    return action
 
 
 def submit_and_wait(
@@ -841,7 +1603,9 @@ def get_action(action_id: str) -> Dict[str, Any]:
     Example:
         >>> action = get_action("12345678-1234-1234-1234-123456789abc")
     """
-    return _make_request("GET", f"/v1/actions/{action_id}")
+    action = _make_request("GET", f"/v1/actions/{action_id}")
+    _observe_actions(action)
+    return action
 
 
 def list_actions(
@@ -876,10 +1640,91 @@ def list_actions(
     if status:
         params["status"] = status
 
+    response = _make_request("GET", "/v1/actions", params=params)
+    actions = response if isinstance(response, list) else response.get("actions", [])
+    _observe_actions(actions)
+    return actions
+
+
+def _fetch_action_page(params: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], Optional[str], bool]:
+    """GET one page of actions. Returns (actions, next_cursor, server_uses_cursors)."""
     response = _make_request("GET", "/v1/actions", params=params)
     if isinstance(response, list):
-        return response
-    return response.get("actions", [])
+        _observe_actions(response)
+        return response, None, False
+    actions = response.get("actions") or response.get("items") or []
+    _observe_actions(actions)
+    if "next_cursor" in response:
+        return actions, response.get("next_cursor") or None, True
+    return actions, None, False
+
+
+def iter_actions(
+    page_size: int = 100,
+    *,
+    prefetch: bool = True,
+    **filters: Any,
+) -> Iterator[Dict[str, Any]]:
+    """Iterate over every action matching ``filters``, one page at a time.
+
+    Pages are fetched lazily. When the server returns a ``next_cursor``
+    (keyset pagination) it is passed back as ``cursor`` for the next page;
+    otherwise pages are walked by ``offset`` until a short page. With
+    ``prefetch`` the next page is requested in the background while the
+    current one is being consumed, so only about two pages are held in
+    memory at a time.
+
+    Args:
+        page_size: Actions requested per page (default: 100)
+        prefetch: Fetch the next page concurrently (default: True)
+        **filters: Query filters, e.g. agent_id, tool, status. None values
+            are ignored.
+
+    Yields:
+        Action dicts, in the order the server returns them
+
+    Example:
+        >>> for action in iter_actions(status="denied", page_size=500):
+        ...     print(action["id"])
+    """
+    page_size = max(1, page_size)
+    base_params = {k: v for k, v in filters.items() if v is not None}
+    base_params["limit"] = page_size
+
+    def page_params(offset: int, cursor: Optional[str]) -> Dict[str, Any]:
+        params = dict(base_params)
+        if cursor is not None:
+            params["cursor"] = cursor
+        else:
+            params["offset"] = offset
+        return params
+
+    executor = (
+        ThreadPoolExecutor(max_workers=1, thread_name_prefix="faramesh-pages") if prefetch else None
+    )
+    next_page: Optional[Future] = None
+    offset = 0
+    try:
+        params: Optional[Dict[str, Any]] = page_params(0, None)
+        while params is not None:
+            if next_page is not None:
+                actions, cursor, keyset = next_page.result()
+                next_page = None
+            else:
+                actions, cursor, keyset = _fetch_action_page(params)
+            offset += len(actions)
+            if keyset:
+                params = page_params(offset, cursor) if cursor else None
+            else:
+                params = page_params(offset, None) if len(actions) >= page_size else None
+            if params is not None and executor is not None:
+                next_page = executor.submit(_fetch_action_page, params)
+            yield from actions
+    finally:
+        if next_page is not None:
+            next_page.cancel()
+        if executor is not None:
+            executor.shutdown(wait=False)
 
 
 def approve_action(
@@ -1044,9 +1889,11 @@ def wait_for_completion(
 ) -> Dict[str, Any]:
     """Wait for an action to complete (succeeded or failed).
 
+    Driven by the same shared event stream as block_until_approved.
+
     Args:
         action_id: Action ID to wait for
-        poll_interval: Seconds between polls (default: 1.0)
+        poll_interval: Initial seconds between fallback polls (default: 1.0)
         timeout: Maximum seconds to wait (default: 60.0)
 
     Returns:
@@ -1061,22 +1908,21 @@ def wait_for_completion(
         >>> final = wait_for_completion(action["id"], timeout=120)
         >>> print(f"Final status: {final['status']}")
     """
-    start_time = time.time()
-
-    while True:
-        action = get_action(action_id)
-        status = action.get("status")
-
-        if status in ("succeeded", "failed", "denied"):
-            return action
-
-        if time.time() - start_time > timeout:
-            raise FarameshTimeoutError(
-                f"Action {action_id} did not complete within {timeout}s. "
-                f"Current status: {status}"
-            )
-
-        time.sleep(poll_interval)
+    try:
+        return _get_action_waiters().wait(
+            ("completion", action_id),
+            timeout,
+            poll_interval=poll_interval,
+        )
+    except TimeoutError:
+        try:
+            status = get_action(action_id).get("status")
+        except FarameshError:
+            status = "unknown"
+        raise FarameshTimeoutError(
+            f"Action {action_id} did not complete within {timeout}s. "
+            f"Current status: {status}"
+        ) from None
 
 
 def apply(file_path: Union[str, Path]) -> Dict[str, Any]:
@@ -1207,8 +2053,9 @@ def stream_events(
     if config.token:
         headers["Authorization"] = f"Bearer {config.token}"
 
+    response = None
     try:
-        response = requests.get(url, headers=headers, stream=True, timeout=timeout)
+        response = _get_session(config).get(url, headers=headers, stream=True, timeout=timeout)
         response.raise_for_status()
 
         client = sseclient.SSEClient(response)
@@ -1248,6 +2095,10 @@ def stream_events(
         raise FarameshTimeoutError(f"SSE stream timeout after {timeout or 'default'}s")
     except requests.exceptions.RequestException as e:
         raise FarameshConnectionError(f"Failed to connect to SSE stream: {str(e)}")
+    finally:
+        # Hand the connection back to the shared pool (or drop it if unread).
+        if response is not None:
+            response.close()
 
 
 # Convenience aliases
@@ -1296,7 +2147,32 @@ class ExecutionGovernorClient:
             token=config.token,
             timeout=config.timeout,
             max_retries=config.max_retries,
+            pool_connections=config.pool_connections,
+            pool_maxsize=config.pool_maxsize,
         )
+        self._session_key: Optional[Tuple[str, int, int]] = _session_key(config)
+        _acquire_session(self._session_key)
+
+    @property
+    def session(self) -> requests.Session:
+        """Pooled keep-alive session used for this client's base_url."""
+        return _get_session(self.config)
+
+    def close(self) -> None:
+        """Release this client's hold on its pooled connections.
+
+        The pool is shared with other clients for the same base_url and is
+        only closed once the last of them is closed.
+        """
+        key, self._session_key = self._session_key, None
+        if key is not None:
+            _release_session(key)
+
+    def __enter__(self) -> "ExecutionGovernorClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
 
     def submit_action(
         self,
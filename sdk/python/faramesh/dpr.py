@@ -0,0 +1,865 @@
+"""Offline readers for the daemon's Decision Provenance Records (DPR).
+
+The daemon writes every decision to two places: an append-only framed WAL
+(``faramesh.wal``, fsynced before the decision is returned) and a SQLite
+store (table ``dpr_records``) used for queries. This module reads both
+directly from disk, so replay engines and analytics can walk millions of
+records without going through the HTTP API.
+
+WAL frames are parsed from an ``mmap`` of the segment: headers are
+unpacked in place and the CRC32 is computed over a ``memoryview`` of the
+payload, so framing never copies the file. Only payloads that are
+decoded into records are materialized.
+
+Example:
+
+    >>> from faramesh import dpr
+    >>> for rec in dpr.iter_records("/var/lib/faramesh/faramesh.wal"):
+    ...     print(rec.agent_id, rec.effect, rec.record_id)
+
+:func:`verify_chain` re-derives every ``record_hash`` with the SDK
+canonicalizer and checks the per-agent ``prev_record_hash`` links on a
+process pool; :func:`verify_inclusion_proofs` checks Merkle inclusion
+proofs from compliance exports in bulk.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import re
+import sqlite3
+import struct
+import zlib
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, NamedTuple, Union
+
+from .canonicalization import canonicalize
+
+__all__ = [
+    "ChainBreak",
+    "ChainVerification",
+    "DPRFormatError",
+    "DPRRecord",
+    "WALFrame",
+    "canonical_record_bytes",
+    "compute_merkle_root",
+    "compute_record_hash",
+    "genesis_prev_hash",
+    "iter_records",
+    "iter_sqlite",
+    "iter_wal",
+    "iter_wal_frames",
+    "verify_chain",
+    "verify_inclusion_proof",
+    "verify_inclusion_proofs",
+    "wal_segments",
+]
+
+logger = logging.getLogger("faramesh.dpr")
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+# Frame layout from internal/core/dpr/wal.go: little-endian magic "FWAL",
+# version byte, payload length, CRC32 (IEEE) of the payload.
+WAL_FRAME_MAGIC = 0x4657414C
+WAL_VERSION_RECORD = 1
+WAL_VERSION_CONTROL = 2
+WAL_HEADER_SIZE = 13
+WAL_MAX_PAYLOAD = 8 * 1024 * 1024
+
+_HEADER = struct.Struct("<IBII")
+_SQLITE_MAGIC = b"SQLite format 3\x00"
+
+# SQLite columns whose JSON name differs from the column name.
+_COLUMN_TO_FIELD = {
+    "invoked_by_dpr_id": "invoked_by_dpr_record_id",
+    "inner_governance_dpr_id": "inner_governance_dpr_record_id",
+}
+_JSON_COLUMNS = frozenset({
+    "arg_provenance", "selector_snapshot", "custom_operators_evaluated", "operator_results",
+    "callbacks_fired", "callback_errors", "batch_dpr_ids", "cascade_path",
+})
+_BOOL_COLUMNS = frozenset({
+    "network_audit_bypass", "inference_model_rewrite_applied", "phase_transition_record",
+    "credential_brokered", "batch_approval", "resolved_by_batch",
+})
+_INT_COLUMNS = frozenset({
+    "execution_timeout_ms", "network_port", "batch_size", "cascade_depth",
+})
+
+
+class DPRFormatError(ValueError):
+    """A WAL segment or SQLite store could not be parsed."""
+
+    def __init__(self, message: str, *, path: str = "", offset: int = -1):
+        where = f" at offset {offset}" if offset >= 0 else ""
+        super().__init__(f"{path or 'DPR source'}{where}: {message}")
+        self.path = path
+        self.offset = offset
+
+
+@dataclass
+class DPRRecord:
+    """One decision provenance record.
+
+    The commonly used fields are typed attributes; every field the daemon
+    stored (including signatures, selector snapshots and cascade metadata)
+    is kept in ``raw`` under its JSON name.
+    """
+
+    record_id: str
+    agent_id: str
+    prev_record_hash: str
+    record_hash: str
+    effect: str = ""
+    tool_id: str = ""
+    session_id: str = ""
+    reason_code: str = ""
+    matched_rule_id: str = ""
+    policy_version: str = ""
+    schema_version: str = ""
+    created_at: str = ""
+    raw: dict[str, Any] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> DPRRecord:
+        def text(name: str) -> str:
+            value = data.get(name)
+            return "" if value is None else str(value)
+
+        return cls(
+            record_id=text("record_id"),
+            agent_id=text("agent_id"),
+            prev_record_hash=text("prev_record_hash"),
+            record_hash=text("record_hash"),
+            effect=text("effect"),
+            tool_id=text("tool_id"),
+            session_id=text("session_id"),
+            reason_code=text("reason_code"),
+            matched_rule_id=text("matched_rule_id"),
+            policy_version=text("policy_version"),
+            schema_version=text("schema_version"),
+            created_at=text("created_at"),
+            raw=data,
+        )
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """Any stored field by its JSON name."""
+        return self.raw.get(name, default)
+
+    def to_dict(self) -> dict[str, Any]:
+        return dict(self.raw)
+
+
+class WALFrame(NamedTuple):
+    """A validated WAL frame. ``payload`` is a view into the mapped segment."""
+
+    offset: int
+    version: int
+    payload: memoryview
+
+
+def _scan_frames(
+    buf: memoryview, *, strict: bool, path: str, start: int = 0, end: int | None = None
+) -> Iterator[tuple[int, int, int, int]]:
+    """Yield ``(offset, version, payload_start, payload_end)`` for each valid frame.
+
+    A bad frame (torn tail, bad magic, CRC mismatch) ends the scan, matching
+    the daemon's tail recovery; with ``strict`` it raises instead.
+    """
+    end = len(buf) if end is None else end
+    offset = start
+    while offset < end:
+        problem = ""
+        if end - offset < WAL_HEADER_SIZE:
+            problem = "truncated frame header"
+        else:
+            magic, version, size, crc = _HEADER.unpack_from(buf, offset)
+            payload_start = offset + WAL_HEADER_SIZE
+            payload_end = payload_start + size
+            if magic != WAL_FRAME_MAGIC:
+                problem = "invalid frame magic"
+            elif version not in (WAL_VERSION_RECORD, WAL_VERSION_CONTROL):
+                problem = f"unknown frame version {version}"
+            elif size == 0 or size > WAL_MAX_PAYLOAD:
+                problem = f"invalid frame size {size}"
+            elif payload_end > end:
+                problem = "truncated frame payload"
+            elif zlib.crc32(buf[payload_start:payload_end]) != crc:
+                problem = "CRC mismatch"
+        if problem:
+            if strict:
+                raise DPRFormatError(problem, path=path, offset=offset)
+            logger.warning("%s: %s at offset %d; ignoring the rest of the segment",
+                           path, problem, offset)
+            return
+        yield offset, version, payload_start, payload_end
+        offset = payload_end
+
+
+def iter_wal_frames(path: PathLike, *, strict: bool = False) -> Iterator[WALFrame]:
+    """Scan one WAL segment and yield its valid frames, control frames included.
+
+    Args:
+        path: WAL segment (the active ``faramesh.wal`` or a rotated ``.bak``).
+        strict: Raise :class:`DPRFormatError` on a corrupt or torn frame
+            instead of stopping quietly at the last good one.
+
+    Payload views stay valid for as long as they are referenced; the
+    mapping is released once the generator is finished and no views remain.
+    """
+    return _map_frames(os.fspath(path), strict=strict)
+
+
+def _map_frames(
+    name: str, *, strict: bool, start: int = 0, end: int | None = None
+) -> Iterator[WALFrame]:
+    with open(name, "rb") as fh:
+        if os.fstat(fh.fileno()).st_size == 0:
+            return
+        mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(mm)
+    try:
+        for offset, version, payload_start, payload_end in _scan_frames(
+            view, strict=strict, path=name, start=start, end=end
+        ):
+            yield WALFrame(offset, version, view[payload_start:payload_end])
+    finally:
+        view.release()
+        try:
+            mm.close()
+        except BufferError:
+            # A caller still holds a payload view; the mapping goes with it.
+            pass
+
+
+def _decode_record(payload: memoryview | bytes, *, path: str, offset: int) -> DPRRecord:
+    try:
+        data = json.loads(bytes(payload))
+    except ValueError as exc:
+        raise DPRFormatError(f"undecodable record: {exc}", path=path, offset=offset) from exc
+    return DPRRecord.from_dict(data)
+
+
+def _wal_records(
+    name: str, *, strict: bool, start: int = 0, end: int | None = None
+) -> Iterator[DPRRecord]:
+    for frame in _map_frames(name, strict=strict, start=start, end=end):
+        if frame.version == WAL_VERSION_RECORD:
+            yield _decode_record(frame.payload, path=name, offset=frame.offset)
+
+
+def iter_wal(
+    path: PathLike, *, agent_id: str | None = None, strict: bool = False
+) -> Iterator[DPRRecord]:
+    """Yield the DPR records of one WAL segment in write order.
+
+    Control frames (budget and rate updates) are skipped.
+    """
+    for record in _wal_records(os.fspath(path), strict=strict):
+        if agent_id is None or record.agent_id == agent_id:
+            yield record
+
+
+def wal_segments(path: PathLike) -> list[Path]:
+    """The active WAL at ``path`` plus its rotated archives, oldest first.
+
+    Compaction renames the active file to ``<path>.<unix-nanos>.bak`` and
+    rewrites the retained tail (re-chained) into a fresh WAL, so archives
+    and the active segment may repeat records.
+    """
+    active = Path(path)
+    archives = []
+    for candidate in active.parent.glob(active.name + ".*.bak"):
+        stamp = candidate.name[len(active.name) + 1:-len(".bak")]
+        if stamp.isdigit():
+            archives.append((int(stamp), candidate))
+    segments = [p for _, p in sorted(archives)]
+    if active.exists():
+        segments.append(active)
+    return segments
+
+
+def _row_to_dict(columns: list[str], row: tuple) -> dict[str, Any]:
+    data: dict[str, Any] = {}
+    for column, value in zip(columns, row):
+        if column == "id":
+            continue
+        if column in _JSON_COLUMNS:
+            if not value:
+                continue
+            try:
+                value = json.loads(value)
+            except ValueError:
+                pass
+        elif column in _BOOL_COLUMNS:
+            value = str(value).strip().lower() in ("1", "true")
+        elif column in _INT_COLUMNS:
+            try:
+                value = int(value or 0)
+            except (TypeError, ValueError):
+                value = 0
+        elif value is None:
+            value = ""
+        data[_COLUMN_TO_FIELD.get(column, column)] = value
+    return data
+
+
+def _query_sqlite(
+    path: PathLike, where: str, args: tuple, batch_size: int
+) -> Iterator[DPRRecord]:
+    uri = Path(path).resolve().as_uri() + "?mode=ro"
+    conn = sqlite3.connect(uri, uri=True)
+    try:
+        query = "SELECT * FROM dpr_records"
+        if where:
+            query += " WHERE " + where
+        try:
+            cursor = conn.execute(query + " ORDER BY id", args)
+        except sqlite3.DatabaseError as exc:
+            raise DPRFormatError(str(exc), path=os.fspath(path)) from exc
+        columns = [d[0] for d in cursor.description]
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            for row in rows:
+                yield DPRRecord.from_dict(_row_to_dict(columns, row))
+    finally:
+        conn.close()
+
+
+def iter_sqlite(
+    path: PathLike, *, agent_id: str | None = None, batch_size: int = 1000
+) -> Iterator[DPRRecord]:
+    """Stream records from the daemon's SQLite store in insertion order.
+
+    The database is opened read-only, so this is safe against a running
+    daemon. Rows are fetched ``batch_size`` at a time rather than loaded
+    up front.
+    """
+    if agent_id is None:
+        return _query_sqlite(path, "", (), batch_size)
+    return _query_sqlite(path, "agent_id = ?", (agent_id,), batch_size)
+
+
+def _is_sqlite(path: str) -> bool:
+    with open(path, "rb") as fh:
+        return fh.read(len(_SQLITE_MAGIC)) == _SQLITE_MAGIC
+
+
+def iter_records(
+    source: PathLike | Iterable[PathLike],
+    *,
+    agent_id: str | None = None,
+    strict: bool = False,
+) -> Iterator[DPRRecord]:
+    """Yield records from a SQLite store, a WAL segment, or several of them.
+
+    Each path is sniffed: SQLite databases are streamed with
+    :func:`iter_sqlite`, anything else is scanned as a WAL segment. Pass
+    ``wal_segments(path)`` to read a WAL together with its archives.
+    """
+    paths = [source] if isinstance(source, (str, os.PathLike)) else list(source)
+    for path in paths:
+        name = os.fspath(path)
+        if _is_sqlite(name):
+            yield from iter_sqlite(name, agent_id=agent_id)
+        else:
+            yield from iter_wal(name, agent_id=agent_id, strict=strict)
+
+
+# ── Hash-chain verification ────────────────────────────────────────────────
+
+CANONICALIZATION_LEGACY_JSON = "legacy-json-v1"
+CANONICALIZATION_JCS = "jcs-rfc8785-v1"
+
+_GENESIS_DOMAIN = "faramesh/dpr/genesis/v1"
+
+# Fields hashed by Record.CanonicalBytes (internal/core/dpr/record.go), in
+# declaration order, with their Go kind and whether they are omitempty.
+_CANONICAL_FIELDS: tuple[tuple[str, type, bool], ...] = (
+    ("schema_version", str, False),
+    ("fpl_version", str, True),
+    ("car_version", str, True),
+    ("canonicalization_algorithm", str, True),
+    ("record_id", str, False),
+    ("prev_record_hash", str, False),
+    ("agent_id", str, False),
+    ("session_id", str, False),
+    ("tool_id", str, False),
+    ("intercept_adapter", str, False),
+    ("execution_timeout_ms", int, True),
+    ("principal_id_hash", str, True),
+    ("effect", str, False),
+    ("matched_rule_id", str, False),
+    ("reason_code", str, False),
+    ("denial_token", str, True),
+    ("incident_category", str, True),
+    ("incident_severity", str, True),
+    ("policy_version", str, False),
+    ("args_structural_sig", str, False),
+    ("hardening_mode", str, True),
+    ("network_host_hash", str, True),
+    ("network_port", int, True),
+    ("network_resolved_ip_hash", str, True),
+    ("network_audit_bypass", bool, True),
+    ("inference_model_rewrite_applied", bool, True),
+    ("workflow_phase", str, True),
+    ("credential_brokered", bool, True),
+    ("approval_envelope", str, True),
+    ("defer_token", str, True),
+    ("parent_defer_token", str, True),
+    ("cascade_reason", str, True),
+    ("cascade_depth", int, True),
+    ("cascade_path", list, True),
+    ("degraded_mode", str, True),
+    ("created_at", str, False),
+)
+
+# Go's encoding/json escapes these even inside otherwise canonical output.
+_GO_HTML_ESCAPES = str.maketrans({
+    "<": "\\u003c", ">": "\\u003e", "&": "\\u0026",
+    "\u2028": "\\u2028", "\u2029": "\\u2029",
+})
+
+_RFC3339 = re.compile(
+    r"^(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})(?:\.(\d+))?(Z|[+-]\d{2}:\d{2})$"
+)
+
+
+def genesis_prev_hash(agent_id: str) -> str:
+    """The ``prev_record_hash`` that starts ``agent_id``'s chain."""
+    return hashlib.sha256(f"{_GENESIS_DOMAIN}:{agent_id}".encode()).hexdigest()
+
+
+def _utc_timestamp(value: str) -> str:
+    """Re-render an RFC 3339 timestamp the way Go's ``t.UTC()`` marshals it."""
+    match = _RFC3339.match(value)
+    if match is None:
+        return value
+    base, fraction, zone = match.groups()
+    fraction = (fraction or "")[:9].rstrip("0")
+    if zone != "Z":
+        try:
+            when = datetime.fromisoformat(base + zone).astimezone(timezone.utc)
+        except (ValueError, OverflowError):
+            return value
+        base = when.replace(tzinfo=None).isoformat()
+    return f"{base}.{fraction}Z" if fraction else f"{base}Z"
+
+
+def _canonical_value(data: dict[str, Any], name: str, kind: type) -> Any:
+    value = data.get(name)
+    if name == "created_at":
+        return _utc_timestamp(str(value or ""))
+    if kind is str:
+        return "" if value is None else str(value)
+    if kind is int:
+        try:
+            return int(value or 0)
+        except (TypeError, ValueError):
+            return 0
+    if kind is bool:
+        return bool(value)
+    return list(value or ())
+
+
+def canonical_record_bytes(record: DPRRecord | dict[str, Any]) -> bytes:
+    """The bytes the daemon hashes into ``record_hash``.
+
+    Mirrors ``Record.CanonicalBytes``: the hashed field subset, with empty
+    omitempty fields dropped, serialized with the SDK canonicalizer in
+    sorted-key (JCS) form for ``jcs-rfc8785-v1`` records and in
+    declaration order for legacy records.
+    """
+    data = record.raw if isinstance(record, DPRRecord) else record
+    fields = {}
+    for name, kind, omitempty in _CANONICAL_FIELDS:
+        value = _canonical_value(data, name, kind)
+        if omitempty and not value:
+            continue
+        fields[name] = value
+    algorithm = str(data.get("canonicalization_algorithm") or "").strip()
+    if algorithm == CANONICALIZATION_JCS:
+        text = canonicalize(fields)
+    else:
+        text = "{" + ",".join(
+            f'"{name}":{canonicalize(value)}' for name, value in fields.items()
+        ) + "}"
+    return text.translate(_GO_HTML_ESCAPES).encode("utf-8")
+
+
+def compute_record_hash(record: DPRRecord | dict[str, Any]) -> str:
+    """SHA-256 hex digest of :func:`canonical_record_bytes`."""
+    return hashlib.sha256(canonical_record_bytes(record)).hexdigest()
+
+
+@dataclass
+class ChainBreak:
+    """The first place a DPR chain fails verification.
+
+    ``position`` counts records (not frames) from the start of the source.
+    """
+
+    position: int
+    record_id: str
+    agent_id: str
+    reason: str
+    expected_hash: str = ""
+    actual_hash: str = ""
+    prev_record_hash: str = ""
+
+
+@dataclass
+class ChainVerification:
+    """Outcome of :func:`verify_chain`."""
+
+    records: int = 0
+    agents: int = 0
+    segments: int = 0
+    first_break: ChainBreak | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.first_break is None
+
+
+class _SegmentResult(NamedTuple):
+    count: int
+    # agent_id -> (local position, record_id, prev_record_hash) of its first record
+    heads: dict[str, tuple[int, str, str]]
+    # agent_id -> record_hash of its last record
+    tails: dict[str, str]
+    # (local position, record_id, agent_id, reason, expected, actual, prev)
+    broken: tuple | None
+
+
+def _segment_records(task: tuple) -> Iterator[DPRRecord]:
+    kind = task[0]
+    if kind == "wal":
+        _, name, start, end = task
+        return _wal_records(name, strict=True, start=start, end=end)
+    if kind == "sqlite":
+        _, name, low, high, agent_id = task
+        where, args = "id BETWEEN ? AND ?", (low, high)
+        if agent_id is not None:
+            where, args = where + " AND agent_id = ?", args + (agent_id,)
+        return _query_sqlite(name, where, args, 1000)
+    return (DPRRecord.from_dict(data) for data in task[1])
+
+
+def _verify_segment(task: tuple) -> _SegmentResult:
+    """Check hashes and the links inside one segment (runs in a worker)."""
+    heads: dict[str, tuple[int, str, str]] = {}
+    tails: dict[str, str] = {}
+    position = 0
+    records = _segment_records(task)
+    while True:
+        try:
+            rec = next(records)
+        except StopIteration:
+            return _SegmentResult(position, heads, tails, None)
+        except DPRFormatError as exc:
+            broken = (position, "", "", f"corrupt segment: {exc}", "", "", "")
+            return _SegmentResult(position, heads, tails, broken)
+        broken = None
+        if not rec.agent_id:
+            broken = (position, rec.record_id, "", "missing agent_id", "", "", "")
+        elif not rec.record_hash:
+            broken = (position, rec.record_id, rec.agent_id, "missing record_hash", "", "", "")
+        else:
+            want = compute_record_hash(rec)
+            if rec.record_hash != want:
+                broken = (position, rec.record_id, rec.agent_id, "record_hash mismatch",
+                          want, rec.record_hash, rec.prev_record_hash)
+            elif rec.agent_id in tails:
+                prev = tails[rec.agent_id]
+                if rec.prev_record_hash != prev:
+                    broken = (position, rec.record_id, rec.agent_id, "broken chain",
+                              prev, "", rec.prev_record_hash)
+            else:
+                heads[rec.agent_id] = (position, rec.record_id, rec.prev_record_hash)
+        if broken is not None:
+            return _SegmentResult(position, heads, tails, broken)
+        tails[rec.agent_id] = rec.record_hash
+        position += 1
+
+
+def _wal_tasks(name: str, parts: int) -> Iterator[tuple]:
+    """Split a WAL into byte ranges on frame boundaries by walking the headers.
+
+    A torn tail is left out, as the daemon's recovery would truncate it;
+    other damage falls inside a range and is reported by the worker.
+    """
+    size = os.path.getsize(name)
+    if size == 0:
+        return
+    target = max(size // parts, 1 << 20)
+    with open(name, "rb") as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        start = offset = 0
+        while offset + WAL_HEADER_SIZE <= size:
+            magic, _, length, _ = _HEADER.unpack_from(mm, offset)
+            if magic != WAL_FRAME_MAGIC or offset + WAL_HEADER_SIZE + length > size:
+                if magic != WAL_FRAME_MAGIC:
+                    # Let a worker hit (and report) the damaged frame.
+                    offset = size
+                break
+            offset += WAL_HEADER_SIZE + length
+            if offset - start >= target:
+                yield ("wal", name, start, offset)
+                start = offset
+    if offset > start:
+        yield ("wal", name, start, offset)
+
+
+def _sqlite_tasks(name: str, parts: int, agent_id: str | None) -> Iterator[tuple]:
+    uri = Path(name).resolve().as_uri() + "?mode=ro"
+    conn = sqlite3.connect(uri, uri=True)
+    try:
+        low, high = conn.execute("SELECT min(id), max(id) FROM dpr_records").fetchone()
+    finally:
+        conn.close()
+    if low is None:
+        return
+    step = max((high - low + 1 + parts - 1) // parts, 10_000)
+    for start in range(low, high + 1, step):
+        yield ("sqlite", name, start, min(start + step - 1, high), agent_id)
+
+
+def _chain_tasks(
+    source: Any, *, parts: int, agent_id: str | None, segment_size: int
+) -> Iterator[tuple]:
+    if isinstance(source, (str, os.PathLike)):
+        source = [source]
+    items = iter(source)
+    chunk: list[dict[str, Any]] = []
+    for item in items:
+        if isinstance(item, (str, os.PathLike)):
+            name = os.fspath(item)
+            if _is_sqlite(name):
+                yield from _sqlite_tasks(name, parts, agent_id)
+            elif agent_id is None:
+                yield from _wal_tasks(name, parts)
+            else:
+                # One agent's records are scattered through the WAL; filter here.
+                records = (r.raw for r in iter_wal(name, agent_id=agent_id, strict=True))
+                yield from _chain_tasks(
+                    records, parts=parts, agent_id=None, segment_size=segment_size
+                )
+            continue
+        data = item.raw if isinstance(item, DPRRecord) else item
+        if agent_id is not None and data.get("agent_id") != agent_id:
+            continue
+        chunk.append(data)
+        if len(chunk) >= segment_size:
+            yield ("records", chunk)
+            chunk = []
+    if chunk:
+        yield ("records", chunk)
+
+
+def _run_segments(tasks: Iterator[tuple], workers: int) -> Iterator[_SegmentResult]:
+    """Verify segments on a process pool, yielding results in source order."""
+    if workers <= 1:
+        yield from map(_verify_segment, tasks)
+        return
+    pool = ProcessPoolExecutor(max_workers=workers)
+    window: deque = deque()
+    try:
+        for task in tasks:
+            window.append(pool.submit(_verify_segment, task))
+            if len(window) >= workers * 2:
+                yield window.popleft().result()
+        while window:
+            yield window.popleft().result()
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def verify_chain(
+    source: PathLike | Iterable[Any],
+    *,
+    agent_id: str | None = None,
+    workers: int | None = None,
+    require_genesis: bool = True,
+    segment_size: int = 50_000,
+) -> ChainVerification:
+    """Recompute and check every ``record_hash`` / ``prev_record_hash`` link.
+
+    The source is split into segments — byte ranges of a WAL, id ranges of
+    the SQLite store, or ``segment_size`` chunks of in-memory records —
+    that are verified in parallel on a process pool. Each worker checks
+    record hashes and the links inside its segment; the segment boundaries
+    are then stitched together per agent in source order, and the first
+    break is reported, matching the daemon's ``ReplayValidated`` rules.
+
+    Args:
+        source: A WAL segment or SQLite path, a list of paths forming one
+            continuous chain, or an iterable of :class:`DPRRecord` / dicts.
+        agent_id: Only verify this agent's chain.
+        workers: Worker processes (default: CPU count). ``1`` verifies in
+            this process.
+        require_genesis: Require each agent's first record to carry the
+            genesis marker. Turn off when verifying a window of a chain.
+        segment_size: Records per segment for in-memory sources.
+
+    Compaction restarts the chain of each retained agent in the new WAL,
+    so verify rotated segments one at a time rather than as one list.
+    """
+    workers = workers or os.cpu_count() or 1
+    tasks = _chain_tasks(source, parts=workers * 4, agent_id=agent_id,
+                         segment_size=segment_size)
+    result = ChainVerification()
+    last_hash: dict[str, str] = {}
+    base = 0
+    segments = _run_segments(tasks, workers)
+    try:
+        for segment in segments:
+            result.segments += 1
+            breaks = []
+            if segment.broken is not None:
+                breaks.append(ChainBreak(base + segment.broken[0], *segment.broken[1:]))
+            for agent, (position, record_id, prev) in segment.heads.items():
+                if agent in last_hash:
+                    want, reason = last_hash[agent], "broken chain"
+                elif require_genesis:
+                    want, reason = genesis_prev_hash(agent), "invalid genesis marker"
+                else:
+                    continue
+                if prev != want:
+                    breaks.append(ChainBreak(base + position, record_id, agent, reason,
+                                             expected_hash=want, prev_record_hash=prev))
+            base += segment.count
+            last_hash.update(segment.tails)
+            if breaks:
+                result.first_break = min(breaks, key=lambda b: b.position)
+                break
+    finally:
+        segments.close()
+    result.records = result.first_break.position if result.first_break else base
+    result.agents = len(last_hash)
+    return result
+
+
+# ── Merkle inclusion proofs ────────────────────────────────────────────────
+
+MERKLE_PROOF_VERSION = "v1"
+MERKLE_HASH_ALGORITHM = "sha256"
+
+
+def _hash_children(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(b"\x01" + left + right).digest()
+
+
+def _hash_bytes(value: bytes | str, what: str) -> bytes:
+    raw = bytes.fromhex(value) if isinstance(value, str) else bytes(value)
+    if len(raw) != 32:
+        raise ValueError(f"invalid {what} length {len(raw)}")
+    return raw
+
+
+def compute_merkle_root(leaf_hashes: Iterable[bytes | str]) -> bytes | None:
+    """Merkle root over ordered leaf hashes (``record_hash`` values).
+
+    Same tree as ``ComputeMerkleRoot``: interior nodes are
+    ``sha256(0x01 || left || right)`` and an odd node is promoted as is.
+    Returns None for an empty tree.
+    """
+    level = [_hash_bytes(h, "leaf hash") for h in leaf_hashes]
+    if not level:
+        return None
+    while len(level) > 1:
+        paired = [_hash_children(level[i], level[i + 1]) for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            paired.append(level[-1])
+        level = paired
+    return level[0]
+
+
+def verify_inclusion_proof(proof: dict[str, Any], root_hash: bytes | str) -> bool:
+    """Check one inclusion proof (the ``InclusionProof`` JSON) against a root.
+
+    Raises ValueError for a malformed proof, as ``VerifyInclusionProof``
+    returns an error; a well-formed proof for another root returns False.
+    """
+    if proof.get("version") != MERKLE_PROOF_VERSION:
+        raise ValueError(f"unsupported proof version {proof.get('version')!r}")
+    if proof.get("hash_algo") != MERKLE_HASH_ALGORITHM:
+        raise ValueError(f"unsupported hash algorithm {proof.get('hash_algo')!r}")
+    root = _hash_bytes(root_hash, "root hash")
+    width, index = int(proof.get("tree_size", 0)), int(proof.get("leaf_index", 0))
+    if width == 0 or index >= width:
+        raise ValueError("leaf index out of range")
+    current = _hash_bytes(proof.get("leaf_hash", ""), "leaf hash")
+    siblings = iter(proof.get("hashes") or ())
+    while width > 1:
+        if index % 2 == 1 or index + 1 < width:
+            sibling = next(siblings, None)
+            if sibling is None:
+                raise ValueError("proof has fewer sibling hashes than required")
+            sibling = _hash_bytes(sibling, "sibling hash")
+            if index % 2 == 0:
+                current = _hash_children(current, sibling)
+            else:
+                current = _hash_children(sibling, current)
+        index //= 2
+        width = (width + 1) // 2
+    if next(siblings, None) is not None:
+        raise ValueError("proof has extra sibling hashes")
+    return current == root
+
+
+def _verify_proof_chunk(task: tuple) -> list[bool | str]:
+    proofs, root = task
+    results: list[bool | str] = []
+    for proof in proofs:
+        try:
+            results.append(verify_inclusion_proof(proof, root))
+        except ValueError as exc:
+            results.append(str(exc))
+    return results
+
+
+def verify_inclusion_proofs(
+    proofs: Iterable[dict[str, Any]],
+    root_hash: bytes | str,
+    *,
+    workers: int = 1,
+    chunk_size: int = 10_000,
+) -> list[bool]:
+    """Verify many inclusion proofs against one root, in parallel if asked.
+
+    Proofs are checked in ``chunk_size`` batches on ``workers`` processes.
+    Returns one bool per proof, in order; malformed proofs count as failed
+    (use :func:`verify_inclusion_proof` to see why).
+    """
+    root = _hash_bytes(root_hash, "root hash")
+    chunks = _chunked(proofs, chunk_size)
+    tasks = ((chunk, root) for chunk in chunks)
+    if workers <= 1:
+        batches = map(_verify_proof_chunk, tasks)
+        return [r is True for batch in batches for r in batch]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        batches = pool.map(_verify_proof_chunk, tasks)
+        return [r is True for batch in batches for r in batch]
+
+
+def _chunked(items: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    chunk: list[Any] = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
@@ -22,14 +22,22 @@ Usage:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Dict, Optional
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, TextIO, Tuple, Union
 
+from . import client as _client
 from .client import (
+    _iter_bounded,
     _make_request,
     _get_config,
     get_action,
+    iter_actions,
     FarameshError,
+    FarameshNotFoundError,
 )
 from .canonicalization import compute_request_hash
 
@@ -110,6 +118,112 @@ class ReplayResult:
         }
 
 
+class ProvenanceIndex:
+    """Bounded, thread-safe provenance_id -> action_id map.
+
+    Fed with action dicts (REST responses) and ``/v1/events`` payloads;
+    anything carrying both a provenance_id and an action id is recorded.
+    The least recently used entries are evicted beyond ``max_entries``.
+    """
+
+    def __init__(self, max_entries: int = 100_000):
+        self.max_entries = max(1, max_entries)
+        self._entries: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def observe(self, item: Dict[str, Any]) -> None:
+        """Record ``item`` if it links a provenance_id to an action id."""
+        if isinstance(item.get("action"), dict):
+            item = item["action"]
+        provenance_id = item.get("provenance_id")
+        action_id = item.get("action_id") or item.get("id")
+        if provenance_id and action_id:
+            self.add(str(provenance_id), str(action_id))
+
+    def add(self, provenance_id: str, action_id: str) -> None:
+        with self._lock:
+            self._entries[provenance_id] = action_id
+            self._entries.move_to_end(provenance_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get(self, provenance_id: str) -> Optional[str]:
+        with self._lock:
+            action_id = self._entries.get(provenance_id)
+            if action_id is not None:
+                self._entries.move_to_end(provenance_id)
+            return action_id
+
+    def discard(self, provenance_id: str) -> None:
+        with self._lock:
+            self._entries.pop(provenance_id, None)
+
+
+_provenance_index: Optional[ProvenanceIndex] = None
+_provenance_index_lock = threading.Lock()
+
+
+def enable_provenance_index(max_entries: int = 100_000) -> ProvenanceIndex:
+    """Start indexing provenance ids seen by this process.
+
+    Every action the client receives (submissions, get/list results, pages
+    from iter_actions, ``/v1/events`` payloads) is recorded, so later
+    lookups by provenance_id are a dict hit plus one get_action.
+
+    Returns the process-wide index (created on first call).
+    """
+    global _provenance_index
+    with _provenance_index_lock:
+        if _provenance_index is None:
+            _provenance_index = ProvenanceIndex(max_entries)
+            _client._action_observers.append(_provenance_index.observe)
+        return _provenance_index
+
+
+def disable_provenance_index() -> None:
+    """Stop indexing and drop the index."""
+    global _provenance_index
+    with _provenance_index_lock:
+        if _provenance_index is not None:
+            try:
+                _client._action_observers.remove(_provenance_index.observe)
+            except ValueError:
+                pass
+        _provenance_index = None
+
+
+def find_action_by_provenance(provenance_id: str, *, page_size: int = 500) -> Dict[str, Any]:
+    """Return the action that carries ``provenance_id``.
+
+    Tries the provenance index first (see :func:`enable_provenance_index`),
+    then asks the server with a ``provenance_id`` filter on ``/v1/actions``;
+    a server that honors the filter answers in a single request. Servers
+    that ignore it are scanned page by page until the action is found.
+
+    Raises:
+        FarameshError: If no action has this provenance_id
+    """
+    index = _provenance_index
+    if index is not None:
+        action_id = index.get(provenance_id)
+        if action_id is not None:
+            try:
+                action = get_action(action_id)
+            except FarameshNotFoundError:
+                action = {}
+            if action.get("provenance_id") == provenance_id:
+                return action
+            index.discard(provenance_id)
+
+    for action in iter_actions(page_size=page_size, provenance_id=provenance_id):
+        if action.get("provenance_id") == provenance_id:
+            return action
+    raise FarameshError(f"No action found with provenance_id '{provenance_id}'")
+
+
 def gate_decide(
     agent_id: str,
     tool: str,
@@ -198,7 +312,8 @@ def replay_decision(
     Replay a decision to verify determinism.
     
     Given an existing action (by ID or provenance_id), re-runs the gate/decide
-    endpoint and compares the results. This verifies that:
+    endpoint and compares the results. Provenance ids are resolved with
+    :func:`find_action_by_provenance`. This verifies that:
     - The decision outcome matches
     - Policy/profile/runtime versions match
     - Hashes are consistent
@@ -227,17 +342,17 @@ def replay_decision(
     
     # Find the action
     if provenance_id:
-        # Search for action by provenance_id
-        from .client import list_actions
-        actions = list_actions(limit=1000)
-        matches = [a for a in actions if a.get("provenance_id") == provenance_id]
-        if not matches:
-            raise FarameshError(f"No action found with provenance_id '{provenance_id}'")
-        original = matches[0]
+        original = find_action_by_provenance(provenance_id)
         action_id = original["id"]
     else:
         original = get_action(action_id)
     
+    result, _ = _replay_action(original)
+    return result
+
+
+def _replay_action(original: Dict[str, Any]) -> Tuple[ReplayResult, Dict[str, Any]]:
+    """Re-run gate/decide for a stored action; returns the comparison and the new decision."""
     # Extract payload for replay
     payload = {
         "agent_id": original["agent_id"],
@@ -279,7 +394,7 @@ def replay_decision(
     if not runtime_version_match:
         mismatches.append(f"runtime_version: {original.get('runtime_version')} != {replayed.get('runtime_version')}")
     
-    return ReplayResult(
+    result = ReplayResult(
         success=len(mismatches) == 0,
         original_outcome=original_outcome,
         replayed_outcome=replayed_outcome,
@@ -291,6 +406,158 @@ def replay_decision(
         runtime_version_match=runtime_version_match,
         mismatches=mismatches,
     )
+    return result, replayed
+
+
+@dataclass
+class ReplayReport:
+    """Aggregate of a bulk replay run (see :func:`replay_decisions`)."""
+    total: int = 0
+    matched: int = 0
+    mismatched: int = 0
+    errors: int = 0
+    # "EXECUTE -> HALT": count, for actions whose outcome changed
+    outcome_transitions: Dict[str, int] = field(default_factory=dict)
+    # "RULE_A -> RULE_B": count, for actions whose reason_code changed
+    reason_code_transitions: Dict[str, int] = field(default_factory=dict)
+    # "old_hash -> new_hash": count, for actions evaluated under another policy
+    policy_hash_drift: Dict[str, int] = field(default_factory=dict)
+    # agent_id -> {"total", "mismatched", "errors"}
+    per_agent: Dict[str, Dict[str, int]] = field(default_factory=dict)
+
+    def add(self, record: Dict[str, Any]) -> None:
+        """Fold one JSONL record (as written by replay_decisions) into the report."""
+        self.total += 1
+        agent = self.per_agent.setdefault(
+            record.get("agent_id") or "unknown", {"total": 0, "mismatched": 0, "errors": 0}
+        )
+        agent["total"] += 1
+        if "error" in record:
+            self.errors += 1
+            agent["errors"] += 1
+            return
+        if record["success"]:
+            self.matched += 1
+            return
+        self.mismatched += 1
+        agent["mismatched"] += 1
+        if record["original_outcome"] != record["replayed_outcome"]:
+            _bump(self.outcome_transitions, record["original_outcome"], record["replayed_outcome"])
+        if record["original_reason_code"] != record["replayed_reason_code"]:
+            _bump(
+                self.reason_code_transitions,
+                record["original_reason_code"],
+                record["replayed_reason_code"],
+            )
+        if not record["policy_hash_match"]:
+            _bump(
+                self.policy_hash_drift,
+                record.get("original_policy_hash"),
+                record.get("replayed_policy_hash"),
+            )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "total": self.total,
+            "matched": self.matched,
+            "mismatched": self.mismatched,
+            "errors": self.errors,
+            "outcome_transitions": self.outcome_transitions,
+            "reason_code_transitions": self.reason_code_transitions,
+            "policy_hash_drift": self.policy_hash_drift,
+            "per_agent": self.per_agent,
+        }
+
+
+def _bump(counts: Dict[str, int], before: Any, after: Any) -> None:
+    key = f"{before or '-'} -> {after or '-'}"
+    counts[key] = counts.get(key, 0) + 1
+
+
+def _replay_record(item: Union[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Replay one action (id or stored action dict) into a JSONL record."""
+    action_id = item if isinstance(item, str) else item.get("id")
+    record: Dict[str, Any] = {"action_id": action_id}
+    try:
+        original = get_action(item) if isinstance(item, str) else item
+        record["agent_id"] = original.get("agent_id")
+        record["tool"] = original.get("tool")
+        record["operation"] = original.get("operation")
+        result, replayed = _replay_action(original)
+    except Exception as e:
+        record["error"] = str(e)
+        return record
+    record.update(result.to_dict())
+    record["original_policy_hash"] = original.get("policy_hash")
+    record["replayed_policy_hash"] = replayed.get("policy_hash")
+    return record
+
+
+def replay_decisions(
+    action_ids: Optional[Iterable[str]] = None,
+    *,
+    workers: int = 8,
+    output: Optional[Union[str, Path, TextIO]] = None,
+    summary_path: Optional[Union[str, Path]] = None,
+    page_size: int = 500,
+    **filters: Any,
+) -> ReplayReport:
+    """
+    Replay many decisions concurrently and aggregate the differences.
+
+    Actions come either from ``action_ids`` (each is fetched, then replayed)
+    or, when no ids are given, from the action history matching ``filters``
+    via :func:`~faramesh.client.iter_actions` (one gate/decide round trip per
+    action). Both sources are consumed lazily with at most ``workers``
+    replays in flight, so memory does not grow with the number of actions.
+
+    Args:
+        action_ids: Action ids to replay (any iterable, read lazily)
+        workers: Maximum concurrent replays (default: 8)
+        output: JSONL destination (path or text file) for one record per
+            action: the ReplayResult fields plus action_id, agent_id, tool,
+            operation and both policy hashes, or ``{"action_id", "error"}``
+        summary_path: Where to write the report as JSON
+        page_size: Page size when streaming history by ``filters``
+        **filters: iter_actions filters (agent_id, tool, status, ...)
+
+    Returns:
+        ReplayReport with mismatch counts, outcome and reason_code
+        transitions, policy_hash drift and a per-agent breakdown
+
+    Example:
+        >>> report = replay_decisions(status="allowed", workers=32, output="replay.jsonl")
+        >>> print(report.mismatched, report.outcome_transitions)
+    """
+    if action_ids is not None:
+        source: Iterable[Any] = action_ids
+    else:
+        source = iter_actions(page_size=page_size, **filters)
+
+    report = ReplayReport()
+    out: Optional[TextIO] = None
+    close_out = False
+    if isinstance(output, (str, Path)):
+        out = open(output, "w")
+        close_out = True
+    elif output is not None:
+        out = output
+    try:
+        for _, _, future in _iter_bounded(
+            source, _replay_record, workers, ordered=False, thread_name_prefix="faramesh-replay"
+        ):
+            record = future.result()
+            report.add(record)
+            if out is not None:
+                out.write(json.dumps(record) + "\n")
+    finally:
+        if close_out:
+            out.close()
+
+    if summary_path is not None:
+        with open(summary_path, "w") as f:
+            json.dump(report.to_dict(), f, indent=2)
+    return report
 
 
 def verify_request_hash(payload: Dict[str, Any], expected_hash: str) -> bool:
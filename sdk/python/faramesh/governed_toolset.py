@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
 import functools
+import inspect
 import os
 from typing import Any, Callable, Iterable, List, Optional, Sequence, Union
 
+from . import _governance_scope
 from .exceptions import ToolDeniedException
+from .pending import PendingToolCall, defer_mode_pending, start_pending_call
 from .transport import detect_transport, govern_via_transport
 
 ToolLike = Union[Callable[..., Any], Any]
@@ -38,20 +42,100 @@ def _govern_call(agent_id: str, tool_name: str, args: dict[str, Any]) -> dict[st
     return govern_via_transport(transport, tool_id, args, agent_id=agent_id)
 
 
+def _pending_call(
+    agent_id: str,
+    tool_name: str,
+    result: dict[str, Any],
+    resume: Callable[[], Any],
+    scope: Optional[_governance_scope.ToolIdentity] = None,
+) -> Optional[PendingToolCall]:
+    """With FARAMESH_DEFER_MODE=pending, park a DEFER as a PendingToolCall.
+
+    Only socket transports can report the approval; remote deployments
+    keep raising ToolDeniedException for DEFER.
+    """
+    if not defer_mode_pending():
+        return None
+    if str(result.get("effect", "")).upper() != "DEFER" or not result.get("defer_token"):
+        return None
+    transport = detect_transport()
+    if transport.mode != "socket":
+        return None
+    return start_pending_call(
+        tool_name,
+        result,
+        resume,
+        socket_path=transport.socket_path,
+        agent_id=agent_id,
+        scope=scope,
+    )
+
+
+def _call_governed(
+    agent_id: str,
+    tool_name: str,
+    tool: ToolLike,
+    payload: dict[str, Any],
+    fn: Callable[..., Any],
+    *args: Any,
+    **kwargs: Any,
+) -> Any:
+    """Govern one call unless an enclosing layer already did, then run ``fn``."""
+    ident = _governance_scope.tool_identity(tool_name, tool)
+    if _governance_scope.is_governed(ident):
+        return fn(*args, **kwargs)
+    result = _govern_call(agent_id, tool_name, payload)
+    pending = _pending_call(
+        agent_id, tool_name, result, functools.partial(fn, *args, **kwargs), ident
+    )
+    if pending is not None:
+        return pending
+    _parse_govern_result(result)
+    token = _governance_scope.enter(ident)
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        _governance_scope.leave(token)
+
+
+async def _acall_governed(
+    agent_id: str,
+    tool_name: str,
+    tool: ToolLike,
+    payload: dict[str, Any],
+    fn: Callable[..., Any],
+    *args: Any,
+    **kwargs: Any,
+) -> Any:
+    ident = _governance_scope.tool_identity(tool_name, tool)
+    if _governance_scope.is_governed(ident):
+        return await fn(*args, **kwargs)
+    result = await asyncio.to_thread(_govern_call, agent_id, tool_name, payload)
+    pending = _pending_call(
+        agent_id, tool_name, result, functools.partial(fn, *args, **kwargs), ident
+    )
+    if pending is not None:
+        return pending
+    _parse_govern_result(result)
+    token = _governance_scope.enter(ident)
+    try:
+        return await fn(*args, **kwargs)
+    finally:
+        _governance_scope.leave(token)
+
+
 def _wrap_callable(agent_id: str, fn: Callable[..., Any], tool_name: str) -> Callable[..., Any]:
     @functools.wraps(fn)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
         payload = {"args": list(args), "kwargs": kwargs}
-        _parse_govern_result(_govern_call(agent_id, tool_name, payload))
-        return fn(*args, **kwargs)
+        return _call_governed(agent_id, tool_name, fn, payload, fn, *args, **kwargs)
 
     @functools.wraps(fn)
     async def awrapper(*args: Any, **kwargs: Any) -> Any:
         payload = {"args": list(args), "kwargs": kwargs}
-        _parse_govern_result(_govern_call(agent_id, tool_name, payload))
-        return await fn(*args, **kwargs)
+        return await _acall_governed(agent_id, tool_name, fn, payload, fn, *args, **kwargs)
 
-    if functools.iscoroutinefunction(fn):
+    if inspect.iscoroutinefunction(fn):
         return awrapper
     return wrapper
 
@@ -70,16 +154,20 @@ def _wrap_langchain_tool(agent_id: str, tool: Any) -> Any:
         if callable(original_run):
 
             def _run(*args: Any, **kwargs: Any) -> Any:
-                _parse_govern_result(_govern_call(agent_id, name, dict(kwargs) if kwargs else {"args": list(args)}))
-                return original_run(*args, **kwargs)
+                payload = dict(kwargs) if kwargs else {"args": list(args)}
+                return _call_governed(
+                    agent_id, name, tool, payload, original_run, *args, **kwargs
+                )
 
             object.__setattr__(tool, "_run", _run)
 
         if callable(original_arun):
 
             async def _arun(*args: Any, **kwargs: Any) -> Any:
-                _parse_govern_result(_govern_call(agent_id, name, dict(kwargs) if kwargs else {"args": list(args)}))
-                return await original_arun(*args, **kwargs)
+                payload = dict(kwargs) if kwargs else {"args": list(args)}
+                return await _acall_governed(
+                    agent_id, name, tool, payload, original_arun, *args, **kwargs
+                )
 
             object.__setattr__(tool, "_arun", _arun)
         return tool
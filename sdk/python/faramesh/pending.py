@@ -0,0 +1,287 @@
+"""Non-blocking DEFER handling: pending tool calls that resume on approval.
+
+By default a deferred tool call blocks its caller until a human approves
+or denies it (or raises at once with ``FARAMESH_DEFER_MODE=raise``). With
+``FARAMESH_DEFER_MODE=pending`` the auto-patched frameworks, the LangChain
+adapter and :class:`~faramesh.GovernedToolSet` instead return a
+:class:`PendingToolCall` immediately. The agent sees a structured
+"pending approval" result carrying the defer token and can keep running
+independent tool calls.
+
+The deferred call is registered as a continuation on the shared defer
+registry (see :mod:`faramesh._defer`): when ``defer_resolved`` arrives on
+the callbacks stream, an approved call runs on a small resume pool (or
+back on its event loop for coroutine tools) and its result lands on the
+handle. Denied or expired calls fail the handle with
+:class:`~faramesh.ToolDeniedException`.
+
+Example:
+
+    >>> pending = search_tool.invoke({"query": "payroll"})
+    >>> if isinstance(pending, PendingToolCall):
+    ...     print(pending.to_dict())          # shown to the model
+    ...     later = pending.result(timeout=600)
+    >>> get_pending_call(pending.defer_token).done()
+    True
+"""
+
+from __future__ import annotations
+
+import inspect
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+
+from . import _defer, _governance_scope
+from .exceptions import ToolDeniedException
+
+if TYPE_CHECKING:
+    import asyncio
+
+logger = logging.getLogger("faramesh.pending")
+
+__all__ = ["PendingToolCall", "get_pending_call", "pending_calls"]
+
+_PENDING_MODES = frozenset({"pending", "nonblocking", "non-blocking", "handle"})
+
+# Handles stay addressable by defer token after they finish so that an
+# agent can look up the outcome on a later turn; only the newest are kept.
+_MAX_TRACKED = 1024
+
+_calls: "OrderedDict[str, PendingToolCall]" = OrderedDict()
+_calls_lock = threading.Lock()
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def defer_mode_pending() -> bool:
+    """True when ``FARAMESH_DEFER_MODE`` asks for pending handles."""
+    return os.environ.get("FARAMESH_DEFER_MODE", "").strip().lower() in _PENDING_MODES
+
+
+def _resume_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            try:
+                workers = int(os.environ.get("FARAMESH_RESUME_WORKERS", "4"))
+            except ValueError:
+                workers = 4
+            _executor = ThreadPoolExecutor(
+                max_workers=max(1, workers), thread_name_prefix="faramesh-resume"
+            )
+        return _executor
+
+
+class PendingToolCall:
+    """Handle for a deferred tool call that resumes once approved.
+
+    Behaves like a future for the tool's eventual result: ``result()``,
+    ``done()``, ``add_done_callback()`` and ``await``. ``str()`` renders
+    the JSON pending payload so frameworks that stringify tool output
+    hand the model a structured message.
+    """
+
+    def __init__(
+        self,
+        tool_name: str,
+        defer_token: str,
+        approval: Future,
+        resume: Callable[[], Any],
+        *,
+        tool_call_id: Optional[str] = None,
+        scope: Optional[_governance_scope.ToolIdentity] = None,
+    ):
+        self.tool_name = tool_name
+        self.tool_call_id = tool_call_id
+        self._scope = scope or _governance_scope.tool_identity(tool_name)
+        self.defer_token = defer_token
+        self._resume = resume
+        self._is_async = inspect.iscoroutinefunction(resume)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        if self._is_async:
+            # Only coroutine resumes go back to the caller's loop; sync
+            # callers never pay for importing asyncio.
+            import asyncio
+
+            try:
+                self._loop = asyncio.get_running_loop()
+            except RuntimeError:
+                pass
+        self._status = "pending_approval"
+        self._future: Future = Future()
+        approval.add_done_callback(self._on_approval)
+
+    @property
+    def status(self) -> str:
+        """``pending_approval``, ``running``, ``completed``, ``failed`` or ``denied``."""
+        return self._status
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "status": self._status,
+            "tool": self.tool_name,
+            "tool_call_id": self.tool_call_id,
+            "defer_token": self.defer_token,
+            "message": (
+                f"Tool call '{self.tool_name}' is awaiting human approval "
+                f"(defer token {self.defer_token}). It will run automatically "
+                "once approved; continue with other work meanwhile."
+            ),
+        }
+
+    def __str__(self) -> str:
+        return json.dumps(self.to_dict())
+
+    def __repr__(self) -> str:
+        return (
+            f"PendingToolCall(tool={self.tool_name!r}, "
+            f"defer_token={self.defer_token!r}, status={self._status!r})"
+        )
+
+    def done(self) -> bool:
+        return self._future.done()
+
+    def result(self, timeout: Optional[float] = None) -> Any:
+        """Block until the resumed call finishes and return its result."""
+        return self._future.result(timeout)
+
+    def exception(self, timeout: Optional[float] = None) -> Optional[BaseException]:
+        return self._future.exception(timeout)
+
+    def add_done_callback(self, fn: Callable[["PendingToolCall"], Any]) -> None:
+        self._future.add_done_callback(lambda _: fn(self))
+
+    def cancel(self) -> bool:
+        """Stop waiting; the tool will not run if it hasn't started yet."""
+        if self._status != "pending_approval":
+            return False
+        return self._future.cancel()
+
+    def __await__(self):
+        import asyncio
+
+        return asyncio.wrap_future(self._future).__await__()
+
+    def _on_approval(self, approval: Future) -> None:
+        # Runs on the defer registry thread: never run the tool here.
+        if self._future.cancelled():
+            return
+        if approval.cancelled():
+            self._future.cancel()
+            return
+        exc = approval.exception()
+        if exc is not None:
+            self._fail("failed", exc)
+            return
+        status = approval.result()
+        if status != "approved":
+            self._fail(
+                "denied",
+                ToolDeniedException(
+                    human_message=f"deferred tool call {status} (token={self.defer_token})",
+                    code=f"DEFER_{str(status).upper()}",
+                    effect="DENY",
+                    defer_token=self.defer_token,
+                ),
+            )
+            return
+        if not self._future.set_running_or_notify_cancel():
+            return
+        self._status = "running"
+        if self._is_async:
+            import asyncio
+
+            loop = self._loop
+            if loop is not None and loop.is_running():
+                inner = asyncio.run_coroutine_threadsafe(self._arun(), loop)
+            else:
+                inner = _resume_executor().submit(asyncio.run, self._arun())
+        else:
+            inner = _resume_executor().submit(self._run)
+        inner.add_done_callback(self._on_finished)
+
+    def _run(self) -> Any:
+        scope = _governance_scope.enter(self._scope, self.tool_call_id)
+        try:
+            return self._resume()
+        finally:
+            _governance_scope.leave(scope)
+
+    async def _arun(self) -> Any:
+        scope = _governance_scope.enter(self._scope, self.tool_call_id)
+        try:
+            return await self._resume()
+        finally:
+            _governance_scope.leave(scope)
+
+    def _on_finished(self, inner: Future) -> None:
+        exc = None if inner.cancelled() else inner.exception()
+        if inner.cancelled():
+            import asyncio
+
+            exc = asyncio.CancelledError()
+        if exc is not None:
+            self._status = "failed"
+            self._future.set_exception(exc)
+        else:
+            self._status = "completed"
+            self._future.set_result(inner.result())
+
+    def _fail(self, status: str, exc: BaseException) -> None:
+        if self._future.set_running_or_notify_cancel():
+            self._status = status
+            self._future.set_exception(exc)
+
+
+def start_pending_call(
+    tool_name: str,
+    result: Dict[str, Any],
+    resume: Callable[[], Any],
+    *,
+    socket_path: str,
+    agent_id: str,
+    tool_call_id: Optional[str] = None,
+    scope: Optional[_governance_scope.ToolIdentity] = None,
+) -> PendingToolCall:
+    """Turn a DEFER result into a :class:`PendingToolCall`.
+
+    ``resume`` is a zero-argument callable (or coroutine function) that
+    performs the original tool call; it runs inside the governance scope
+    so inner patched layers don't evaluate the call a second time.
+    ``scope`` is the caller's :func:`~faramesh._governance_scope.tool_identity`
+    for the call; it defaults to one built from ``tool_name``.
+    """
+    defer_token = str(result.get("defer_token") or "").strip()
+    if not defer_token:
+        raise RuntimeError(f"Faramesh DEFER missing token (tool={tool_name})")
+    approval = _defer.watch(defer_token, agent_id=agent_id, socket_path=socket_path)
+    call = PendingToolCall(
+        tool_name, defer_token, approval, resume, tool_call_id=tool_call_id, scope=scope
+    )
+    with _calls_lock:
+        _calls[defer_token] = call
+        _calls.move_to_end(defer_token)
+        while len(_calls) > _MAX_TRACKED:
+            oldest = next(iter(_calls))
+            if not _calls[oldest].done():
+                break
+            del _calls[oldest]
+    return call
+
+
+def get_pending_call(defer_token: str) -> Optional[PendingToolCall]:
+    """Look up a pending (or recently finished) call by its defer token."""
+    with _calls_lock:
+        return _calls.get(defer_token)
+
+
+def pending_calls() -> List[PendingToolCall]:
+    """Calls that are still waiting for approval or running."""
+    with _calls_lock:
+        return [call for call in _calls.values() if not call.done()]
@@ -1,86 +1,991 @@
-"""In-memory action snapshot store for convenience.
+"""Action snapshot stores for convenience.
 
-This module provides a simple in-memory store for tracking actions locally.
-It's an optional utility and not required for SDK usage.
+This module provides a bounded in-memory store for tracking actions locally,
+a SQLite-backed store with the same interface for history that has to
+survive restarts, and a live view that keeps a store current from the
+daemon's decision and lifecycle streams. All are optional utilities and not
+required for SDK usage.
 """
 
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Any
-from collections import deque
+import atexit
+import json
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from itertools import islice
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+logger = logging.getLogger("faramesh.snapshot")
+
+# Action fields with a secondary index, in the order ``find`` accepts them.
+INDEXED_FIELDS = ("agent_id", "tool", "status", "provenance_id")
+
+
+def _index_key(value: Any) -> Optional[str]:
+    return value if isinstance(value, str) and value else None
+
+
+class _Snapshot:
+    """A stored action plus the index keys it was filed under.
+
+    The keys are captured at insert time so the action can be unindexed
+    even if the caller has since mutated the dict.
+    """
+
+    __slots__ = ("action", "keys")
+
+    def __init__(self, action: Dict[str, Any]):
+        self.action = action
+        self.keys = tuple(_index_key(action.get(name)) for name in INDEXED_FIELDS)
 
 
 class ActionSnapshotStore:
-    """In-memory store for action snapshots.
-    
+    """Bounded, thread-safe in-memory store for action snapshots.
+
     This is a convenience helper for tracking actions locally.
     It's not required for SDK usage and is provided as an optional utility.
-    
+
+    Holds at most ``max_size`` actions. Adding, updating or reading an
+    action by id makes it the most recently used; once the store is full,
+    the least recently used action is evicted in O(1), together with its
+    index entries. Actions can
+    be looked up by id or filtered by ``agent_id``, ``tool``, ``status``
+    and ``provenance_id`` through secondary indexes.
+
     Example:
         >>> store = ActionSnapshotStore()
         >>> store.add_action(action_dict)
         >>> recent = store.list_recent(limit=10)
         >>> action = store.get_action(action_id)
+        >>> denied = store.find(agent_id="agent-1", status="denied")
     """
-    
+
     def __init__(self, max_size: int = 1000):
         """Initialize the store.
-        
+
         Args:
             max_size: Maximum number of actions to store (default: 1000)
         """
-        self._actions: Dict[str, Dict[str, Any]] = {}
-        self._recent: deque = deque(maxlen=max_size)
-    
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size = max_size
+        self._actions: "OrderedDict[str, _Snapshot]" = OrderedDict()
+        self._indexes: Dict[str, Dict[Any, Dict[str, None]]] = {
+            name: {} for name in INDEXED_FIELDS
+        }
+        self._lock = threading.RLock()
+
     def add_action(self, action: Dict[str, Any]) -> None:
-        """Add an action to the store.
-        
+        """Add or update an action in the store.
+
         Args:
             action: Action dict (must have 'id' field)
         """
         action_id = action.get("id")
         if not action_id:
             raise ValueError("Action must have 'id' field")
-        
-        self._actions[action_id] = action
-        self._recent.append(action_id)
-    
+
+        snapshot = _Snapshot(action)
+        with self._lock:
+            previous = self._actions.pop(action_id, None)
+            if previous is not None:
+                self._unindex(action_id, previous)
+            self._actions[action_id] = snapshot
+            self._index(action_id, snapshot)
+            while len(self._actions) > self.max_size:
+                evicted_id, evicted = self._actions.popitem(last=False)
+                self._unindex(evicted_id, evicted)
+
+    def add_actions(self, actions: Iterable[Dict[str, Any]]) -> None:
+        """Add several actions, oldest first.
+
+        Args:
+            actions: Action dicts (each must have an 'id' field)
+        """
+        for action in actions:
+            self.add_action(action)
+
     def get_action(self, action_id: str) -> Optional[Dict[str, Any]]:
         """Get an action by ID.
-        
+
         Args:
             action_id: Action ID
-        
+
         Returns:
             Action dict or None if not found
         """
-        return self._actions.get(action_id)
-    
+        with self._lock:
+            snapshot = self._actions.get(action_id)
+            if snapshot is None:
+                return None
+            self._actions.move_to_end(action_id)
+            return snapshot.action
+
+    def remove_action(self, action_id: str) -> Optional[Dict[str, Any]]:
+        """Remove an action from the store.
+
+        Args:
+            action_id: Action ID
+
+        Returns:
+            The removed action dict, or None if it was not stored
+        """
+        with self._lock:
+            snapshot = self._actions.pop(action_id, None)
+            if snapshot is None:
+                return None
+            self._unindex(action_id, snapshot)
+            return snapshot.action
+
     def list_recent(self, limit: int = 50) -> List[Dict[str, Any]]:
         """List recent actions.
-        
+
         Args:
             limit: Maximum number of actions to return (default: 50)
-        
+
+        Returns:
+            List of action dicts, most recently used first
+        """
+        with self._lock:
+            return [s.action for s in islice(reversed(self._actions.values()), max(limit, 0))]
+
+    def find(
+        self,
+        *,
+        agent_id: Optional[str] = None,
+        tool: Optional[str] = None,
+        status: Optional[str] = None,
+        provenance_id: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Find actions by indexed fields.
+
+        Filters combine with AND; at least one is required. The smallest
+        matching index is scanned and the others are checked per action.
+
+        Args:
+            agent_id: Match this agent
+            tool: Match this tool
+            status: Match this status
+            provenance_id: Match this provenance id
+            limit: Maximum number of actions to return (default: all)
+
         Returns:
             List of action dicts, most recent first
         """
-        recent_ids = list(self._recent)[-limit:]
-        return [self._actions[aid] for aid in reversed(recent_ids) if aid in self._actions]
-    
+        wanted = [
+            (position, value)
+            for position, value in enumerate((agent_id, tool, status, provenance_id))
+            if value is not None
+        ]
+        if not wanted:
+            raise ValueError("find() needs at least one of agent_id, tool, status, provenance_id")
+        with self._lock:
+            candidates = [
+                (position, self._indexes[INDEXED_FIELDS[position]].get(value, {}))
+                for position, value in wanted
+            ]
+            _, ids = min(candidates, key=lambda item: len(item[1]))
+            results = []
+            for action_id in reversed(ids):
+                keys = self._actions[action_id].keys
+                if all(keys[position] == value for position, value in wanted):
+                    results.append(self._actions[action_id].action)
+                    if limit is not None and len(results) >= limit:
+                        break
+            return results
+
+    def get_by_provenance(self, provenance_id: str) -> Optional[Dict[str, Any]]:
+        """Get the most recent action with this provenance id, or None."""
+        found = self.find(provenance_id=provenance_id, limit=1)
+        return found[0] if found else None
+
+    def __len__(self) -> int:
+        return len(self._actions)
+
+    def __contains__(self, action_id: object) -> bool:
+        return action_id in self._actions
+
+    def clear(self) -> None:
+        """Clear all stored actions."""
+        with self._lock:
+            self._actions.clear()
+            for index in self._indexes.values():
+                index.clear()
+
+    def _index(self, action_id: str, snapshot: _Snapshot) -> None:
+        for name, key in zip(INDEXED_FIELDS, snapshot.keys):
+            if key is not None:
+                self._indexes[name].setdefault(key, {})[action_id] = None
+
+    def _unindex(self, action_id: str, snapshot: _Snapshot) -> None:
+        for name, key in zip(INDEXED_FIELDS, snapshot.keys):
+            if key is None:
+                continue
+            index = self._indexes[name]
+            ids = index.get(key)
+            if ids is not None:
+                ids.pop(action_id, None)
+                if not ids:
+                    del index[key]
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS actions (
+    id            TEXT PRIMARY KEY,
+    seq           INTEGER NOT NULL,
+    agent_id      TEXT,
+    tool          TEXT,
+    status        TEXT,
+    provenance_id TEXT,
+    ts            REAL NOT NULL,
+    data          TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_actions_seq ON actions(seq);
+CREATE INDEX IF NOT EXISTS idx_actions_agent ON actions(agent_id, seq);
+CREATE INDEX IF NOT EXISTS idx_actions_tool ON actions(tool, seq);
+CREATE INDEX IF NOT EXISTS idx_actions_status ON actions(status, seq);
+CREATE INDEX IF NOT EXISTS idx_actions_provenance ON actions(provenance_id, seq);
+CREATE INDEX IF NOT EXISTS idx_actions_ts ON actions(ts);
+"""
+
+_UPSERT = (
+    "INSERT OR REPLACE INTO actions"
+    " (id, seq, agent_id, tool, status, provenance_id, ts, data)"
+    " VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+# Writer queue markers, sent as (marker, arg) like the write ops.
+_FLUSH = object()
+_STOP = object()
+
+
+def _timestamp(action: Dict[str, Any]) -> float:
+    """Epoch seconds of the action's ``created_at``, or now."""
+    value = action.get("created_at")
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    if isinstance(value, str) and value:
+        try:
+            return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+        except ValueError:
+            pass
+    return time.time()
+
+
+class SQLiteActionSnapshotStore:
+    """Disk-backed action snapshot store on stdlib ``sqlite3``.
+
+    Same interface as :class:`ActionSnapshotStore`, persisted to ``path`` so
+    history survives restarts while memory use stays constant. Writes are
+    queued and committed by a background thread in batches of up to
+    ``batch_size`` actions, at most ``flush_interval`` seconds apart; reads
+    see queued writes immediately. The database runs in WAL journal mode,
+    so readers never block the writer.
+
+    ``max_size`` bounds the number of stored actions (oldest writes are
+    pruned after each batch); by default the store is unbounded.
+
+    Example:
+        >>> with SQLiteActionSnapshotStore("~/.faramesh/actions.db") as store:
+        ...     store.add_action(action_dict)
+        ...     for action in store.iter_recent(agent_id="agent-1"):
+        ...         print(action["id"])
+    """
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        *,
+        max_size: Optional[int] = None,
+        batch_size: int = 500,
+        flush_interval: float = 0.2,
+    ):
+        """Open (or create) the store.
+
+        Args:
+            path: SQLite database file
+            max_size: Maximum number of actions to keep (default: unbounded)
+            batch_size: Most writes committed in one transaction (default: 500)
+            flush_interval: Seconds a queued write may wait for its batch (default: 0.2)
+        """
+        if max_size is not None and max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.path = os.path.expanduser(os.fspath(path))
+        self.max_size = max_size
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = max(0.0, flush_interval)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # Queued but uncommitted writes: id -> (seq, action), action None for a delete.
+        self._pending: Dict[str, Tuple[int, Optional[Dict[str, Any]]]] = {}
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._closed = False
+
+        conn = self._connect()
+        conn.executescript(_SCHEMA)
+        self._seq = conn.execute("SELECT COALESCE(MAX(seq), 0) FROM actions").fetchone()[0]
+        self._writer_conn = conn
+        self._writer = threading.Thread(
+            target=self._run_writer, name="faramesh-snapshot-writer", daemon=True
+        )
+        self._writer.start()
+        atexit.register(self.close)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _reader(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+        return conn
+
+    # -- writes ---------------------------------------------------------
+
+    def add_action(self, action: Dict[str, Any]) -> None:
+        """Add or update an action in the store.
+
+        Args:
+            action: Action dict (must have 'id' field)
+        """
+        action_id = action.get("id")
+        if not action_id:
+            raise ValueError("Action must have 'id' field")
+        keys = tuple(_index_key(action.get(name)) for name in INDEXED_FIELDS)
+        data = json.dumps(action, default=str)
+        with self._lock:
+            self._check_open()
+            self._seq += 1
+            self._pending[action_id] = (self._seq, action)
+            self._queue.put(("put", (action_id, self._seq, *keys, _timestamp(action), data)))
+
+    def add_actions(self, actions: Iterable[Dict[str, Any]]) -> None:
+        """Add several actions, oldest first.
+
+        Args:
+            actions: Action dicts (each must have an 'id' field)
+        """
+        for action in actions:
+            self.add_action(action)
+
+    def remove_action(self, action_id: str) -> Optional[Dict[str, Any]]:
+        """Remove an action from the store.
+
+        Args:
+            action_id: Action ID
+
+        Returns:
+            The removed action dict, or None if it was not stored
+        """
+        action = self.get_action(action_id)
+        if action is None:
+            return None
+        with self._lock:
+            self._check_open()
+            self._seq += 1
+            self._pending[action_id] = (self._seq, None)
+            self._queue.put(("delete", (action_id, self._seq)))
+        return action
+
     def clear(self) -> None:
         """Clear all stored actions."""
-        self._actions.clear()
-        self._recent.clear()
+        with self._lock:
+            self._check_open()
+            self._queue.put(("clear", None))
+            self._pending.clear()
+        self.flush()
+
+    def flush(self) -> None:
+        """Block until every write queued so far is committed."""
+        done = threading.Event()
+        self._queue.put((_FLUSH, done))
+        while not done.wait(0.5):
+            if not self._writer.is_alive():
+                return
+
+    def close(self) -> None:
+        """Commit queued writes and stop the background writer."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._queue.put((_STOP, None))
+        self._writer.join()
+        atexit.unregister(self.close)
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def __enter__(self) -> "SQLiteActionSnapshotStore":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _check_open(self) -> None:
+        if self._closed:
+            raise RuntimeError("snapshot store is closed")
+
+    def _run_writer(self) -> None:
+        conn = self._writer_conn
+        try:
+            while True:
+                batch = [self._queue.get()]
+                deadline = time.monotonic() + self.flush_interval
+                # Collect until the batch is full, the interval ends, or
+                # someone is waiting on a flush or close.
+                while batch[-1][0] not in (_FLUSH, _STOP) and len(batch) < self.batch_size:
+                    try:
+                        batch.append(self._queue.get(timeout=max(0.0, deadline - time.monotonic())))
+                    except queue.Empty:
+                        break
+                writes = [op for op in batch if op[0] not in (_FLUSH, _STOP)]
+                try:
+                    self._commit(conn, writes)
+                except sqlite3.Error:
+                    logger.exception("snapshot store: failed to commit %d writes", len(writes))
+                for kind, arg in batch:
+                    if kind is _FLUSH:
+                        arg.set()
+                if batch[-1][0] is _STOP:
+                    return
+        finally:
+            conn.close()
+
+    def _commit(self, conn: sqlite3.Connection, ops: List[Tuple[str, Any]]) -> None:
+        if not ops:
+            return
+        with conn:
+            rows: List[tuple] = []
+            for kind, arg in ops:
+                if kind == "put":
+                    rows.append(arg)
+                    continue
+                if rows:
+                    conn.executemany(_UPSERT, rows)
+                    rows = []
+                if kind == "delete":
+                    conn.execute("DELETE FROM actions WHERE id = ?", (arg[0],))
+                else:
+                    conn.execute("DELETE FROM actions")
+            if rows:
+                conn.executemany(_UPSERT, rows)
+            if self.max_size is not None:
+                conn.execute(
+                    "DELETE FROM actions WHERE seq <= "
+                    "(SELECT seq FROM actions ORDER BY seq DESC LIMIT 1 OFFSET ?)",
+                    (self.max_size,),
+                )
+        with self._lock:
+            for kind, arg in ops:
+                if kind == "clear":
+                    continue
+                action_id, seq = arg[0], arg[1]
+                # Keep the entry if a newer write to the same id is still queued.
+                entry = self._pending.get(action_id)
+                if entry is not None and entry[0] == seq:
+                    del self._pending[action_id]
+
+    # -- reads ----------------------------------------------------------
+
+    def get_action(self, action_id: str) -> Optional[Dict[str, Any]]:
+        """Get an action by ID.
+
+        Args:
+            action_id: Action ID
+
+        Returns:
+            Action dict or None if not found
+        """
+        with self._lock:
+            if action_id in self._pending:
+                return self._pending[action_id][1]
+        row = self._reader().execute(
+            "SELECT data FROM actions WHERE id = ?", (action_id,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def list_recent(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """List recent actions.
+
+        Args:
+            limit: Maximum number of actions to return (default: 50)
+
+        Returns:
+            List of action dicts, most recent first
+        """
+        return list(islice(self.iter_recent(), max(limit, 0)))
+
+    def find(
+        self,
+        *,
+        agent_id: Optional[str] = None,
+        tool: Optional[str] = None,
+        status: Optional[str] = None,
+        provenance_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+    ) -> List[Dict[str, Any]]:
+        """Find actions by indexed fields and time range.
+
+        Args:
+            agent_id: Match this agent
+            tool: Match this tool
+            status: Match this status
+            provenance_id: Match this provenance id
+            limit: Maximum number of actions to return (default: all)
+            since: Only actions created at or after this epoch time
+            until: Only actions created before this epoch time
+
+        Returns:
+            List of action dicts, most recent first
+        """
+        if all(v is None for v in (agent_id, tool, status, provenance_id, since, until)):
+            raise ValueError(
+                "find() needs at least one of agent_id, tool, status, provenance_id, since, until"
+            )
+        found = self.iter_recent(
+            agent_id=agent_id, tool=tool, status=status, provenance_id=provenance_id,
+            since=since, until=until,
+        )
+        return list(found if limit is None else islice(found, limit))
+
+    def get_by_provenance(self, provenance_id: str) -> Optional[Dict[str, Any]]:
+        """Get the most recent action with this provenance id, or None."""
+        found = self.find(provenance_id=provenance_id, limit=1)
+        return found[0] if found else None
+
+    def iter_recent(
+        self,
+        *,
+        agent_id: Optional[str] = None,
+        tool: Optional[str] = None,
+        status: Optional[str] = None,
+        provenance_id: Optional[str] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        fetch_size: int = 500,
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream matching actions, most recent first.
+
+        Rows are read through a cursor ``fetch_size`` at a time on a
+        connection of its own, so walking millions of actions keeps memory
+        flat. Queued writes are committed first.
+        """
+        self.flush()
+        clauses: List[str] = []
+        args: List[Any] = []
+        for name, value in zip(INDEXED_FIELDS, (agent_id, tool, status, provenance_id)):
+            if value is not None:
+                clauses.append(f"{name} = ?")
+                args.append(value)
+        if since is not None:
+            clauses.append("ts >= ?")
+            args.append(since)
+        if until is not None:
+            clauses.append("ts < ?")
+            args.append(until)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return self._stream(f"SELECT data FROM actions{where} ORDER BY seq DESC", args, fetch_size)
+
+    def _stream(self, query: str, args: List[Any], fetch_size: int) -> Iterator[Dict[str, Any]]:
+        conn = self._connect()
+        try:
+            cursor = conn.execute(query, args)
+            while True:
+                rows = cursor.fetchmany(fetch_size)
+                if not rows:
+                    return
+                for (data,) in rows:
+                    yield json.loads(data)
+        finally:
+            conn.close()
+
+    def __len__(self) -> int:
+        self.flush()
+        return self._reader().execute("SELECT COUNT(*) FROM actions").fetchone()[0]
+
+    def __contains__(self, action_id: object) -> bool:
+        return isinstance(action_id, str) and self.get_action(action_id) is not None
+
+
+# Decision effects as REST action statuses.
+_EFFECT_STATUS = {
+    "PERMIT": "allowed",
+    "SHADOW": "allowed",
+    "SHADOW_PERMIT": "allowed",
+    "MODIFY": "allowed",
+    "DENY": "denied",
+    "DEFER": "pending_approval",
+    "STEP_UP": "pending_approval",
+}
+
+# REST action fields that name the action's DPR decision record.
+_RECORD_LINK_FIELDS = ("dpr_record_id", "record_id", "provenance_id")
+
+# Most record-id aliases and defer tokens a LiveActionView remembers.
+_MAX_TRACKED_IDS = 10_000
+
+
+def _record_link(action: Dict[str, Any]) -> Optional[str]:
+    for name in _RECORD_LINK_FIELDS:
+        value = action.get(name)
+        if isinstance(value, str) and value:
+            return value
+    return None
+
+
+def _remember(ids: "OrderedDict[str, str]", key: str, value: str) -> None:
+    ids[key] = value
+    ids.move_to_end(key)
+    while len(ids) > _MAX_TRACKED_IDS:
+        ids.popitem(last=False)
+
+
+def action_from_decision(event: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Map an ``audit.subscribe`` decision event onto an action snapshot.
+
+    The snapshot is keyed by the decision's DPR ``record_id``, which is
+    also kept under ``record_id``. Returns None for events without one.
+    """
+    record_id = event.get("record_id")
+    if not record_id:
+        return None
+    effect = str(event.get("effect") or "").upper()
+    timestamp = event.get("timestamp")
+    return {
+        "id": record_id,
+        "record_id": record_id,
+        "agent_id": event.get("agent_id"),
+        "tool": event.get("tool_id"),
+        "operation": event.get("operation"),
+        "status": _EFFECT_STATUS.get(effect, effect.lower()),
+        "effect": effect,
+        "reason_code": event.get("reason_code"),
+        "reason": event.get("reason"),
+        "rule_id": event.get("rule_id"),
+        "defer_token": event.get("defer_token") or None,
+        "policy_version": event.get("policy_version"),
+        "created_at": timestamp,
+        "updated_at": timestamp,
+    }
+
+
+class LiveActionView:
+    """An action store kept current from the daemon's event streams.
+
+    Subscribes to :func:`faramesh.audit.subscribe` (decisions) and
+    :func:`faramesh.callbacks.subscribe` (defer resolutions and other
+    lifecycle events) and applies every event to ``store``, so dashboards
+    read local state instead of fanning out ``get_action`` /
+    ``list_actions`` calls. On every (re)connect the store is resynced
+    once, by default from :func:`faramesh.client.iter_actions`; events that
+    arrive during the resync win over the older listed state.
+
+    Actions are keyed by their REST ``id``. Stream events only carry the
+    DPR ``record_id``, so each resync learns which REST action a record
+    belongs to from the listed action's ``dpr_record_id`` / ``record_id`` /
+    ``provenance_id`` and files later events under that id; actions the
+    REST API has not listed yet stay keyed by their ``record_id`` until it
+    does.
+
+    If either stream drops, the view reports itself stale and reconnects
+    in the background with jittered backoff. A failed resync also leaves
+    the view stale and is retried with backoff while the streams stay up.
+    Reads keep serving the last known state meanwhile; check
+    :attr:`stale` / :attr:`stale_for` before trusting it.
+
+    Example:
+        >>> with LiveActionView() as view:
+        ...     view.wait_until_current(timeout=5)
+        ...     pending = view.find(status="pending_approval")
+        ...     if view.stale:
+        ...         print(f"stale for {view.stale_for:.0f}s")
+    """
+
+    def __init__(
+        self,
+        store: Optional[Any] = None,
+        *,
+        agent_id: Optional[str] = None,
+        socket_path: Optional[str] = None,
+        resync: Union[bool, Callable[[], Iterable[Dict[str, Any]]]] = True,
+        resync_limit: int = 1000,
+        reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 30.0,
+        connect_timeout: float = 5.0,
+    ):
+        """Create the view. Call :meth:`start` (or use it as a context manager).
+
+        Args:
+            store: Store to keep current (default: a new ActionSnapshotStore)
+            agent_id: Only track this agent's actions
+            socket_path: Daemon socket (default: ``$FARAMESH_SOCKET``)
+            resync: True to resync from ``iter_actions``, a callable returning
+                actions newest first, or False to rely on events only
+            resync_limit: Most actions loaded per resync (default: 1000)
+            reconnect_delay: Base delay between reconnect attempts
+            max_reconnect_delay: Cap on the reconnect delay
+            connect_timeout: Seconds to wait for each subscription handshake
+        """
+        self.store = store if store is not None else ActionSnapshotStore()
+        self.agent_id = agent_id
+        self.socket_path = socket_path
+        self.resync_limit = resync_limit
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.connect_timeout = connect_timeout
+        self._resync = resync
+        self._lock = threading.Lock()
+        self._defer_ids: "OrderedDict[str, str]" = OrderedDict()
+        self._aliases: "OrderedDict[str, str]" = OrderedDict()
+        self._touched: Optional[set] = None
+        self._connected = False
+        self._current = threading.Event()
+        self._disconnected_at = time.monotonic()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.last_event_at: Optional[float] = None
+        self.last_resync_at: Optional[float] = None
+        self.events = 0
+        self.resyncs = 0
+        self.reconnects = 0
+
+    # -- lifecycle ------------------------------------------------------
+
+    def start(self) -> "LiveActionView":
+        """Start subscribing in the background. Returns ``self``."""
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._supervise, name="faramesh-live-view", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def close(self) -> None:
+        """Stop subscribing. The store keeps its last state."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.connect_timeout + 2.0)
+            self._thread = None
+
+    def __enter__(self) -> "LiveActionView":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def wait_until_current(self, timeout: Optional[float] = None) -> bool:
+        """Block until the view is connected and resynced. False on timeout."""
+        return self._current.wait(timeout)
+
+    # -- freshness ------------------------------------------------------
+
+    @property
+    def connected(self) -> bool:
+        """True while both event streams are connected."""
+        return self._connected
+
+    @property
+    def stale(self) -> bool:
+        """True unless both streams are connected and the resync finished."""
+        return not self._current.is_set()
+
+    @property
+    def stale_for(self) -> float:
+        """Seconds since the view stopped being current (0.0 while current)."""
+        if self._current.is_set():
+            return 0.0
+        return time.monotonic() - self._disconnected_at
+
+    # -- reads ----------------------------------------------------------
+
+    def get_action(self, action_id: str) -> Optional[Dict[str, Any]]:
+        """Get an action by REST ID (or DPR record ID) from the local store."""
+        with self._lock:
+            action_id = self._aliases.get(action_id, action_id)
+        return self.store.get_action(action_id)
+
+    def list_recent(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """List recent actions from the local store, most recent first."""
+        return self.store.list_recent(limit)
+
+    def find(self, **filters: Any) -> List[Dict[str, Any]]:
+        """Find actions in the local store (see ``ActionSnapshotStore.find``)."""
+        return self.store.find(**filters)
+
+    # -- events ---------------------------------------------------------
+
+    def _apply(self, action: Dict[str, Any]) -> None:
+        # Caller holds self._lock.
+        if self._touched is not None:
+            self._touched.add(action["id"])
+        self.store.add_action(action)
+        self.events += 1
+        self.last_event_at = time.time()
+
+    def _on_decision(self, event: Dict[str, Any]) -> None:
+        action = action_from_decision(event)
+        if action is None:
+            return
+        with self._lock:
+            action_id = self._aliases.get(action["id"], action["id"])
+            current = self.store.get_action(action_id)
+            if current is not None:
+                # Keep the REST fields the stream doesn't carry.
+                merged = dict(current)
+                merged.update((k, v) for k, v in action.items() if v is not None)
+                action = merged
+            action["id"] = action_id
+            token = action.get("defer_token")
+            if token:
+                _remember(self._defer_ids, token, action_id)
+            self._apply(action)
+
+    def _on_callback(self, event: Dict[str, Any]) -> None:
+        event_type = event.get("event_type")
+        if event_type == "decision":
+            return  # mirrored from the decision stream
+        with self._lock:
+            if event_type == "defer_resolved":
+                action_id = self._defer_ids.pop(event.get("defer_token") or "", None)
+            else:
+                action_id = event.get("record_id")
+            if action_id:
+                # Tokens and records seen before a resync may still name the record_id.
+                action_id = self._aliases.get(action_id, action_id)
+            current = self.store.get_action(action_id) if action_id else None
+            if current is None or not event.get("status"):
+                return
+            updated = dict(current, status=event["status"])
+            updated["updated_at"] = event.get("timestamp") or updated.get("updated_at")
+            for name in ("approver_id", "reason"):
+                if event.get(name):
+                    updated[name] = event[name]
+            self._apply(updated)
+
+    # -- connection -----------------------------------------------------
+
+    def _supervise(self) -> None:
+        from . import _retry, audit, callbacks
+
+        backoff = _retry.Backoff(self.reconnect_delay, cap=self.max_reconnect_delay)
+        while not self._stop.is_set():
+            subscriptions = []
+            try:
+                subscriptions.append(audit.subscribe(
+                    self._on_decision, agent_id=self.agent_id,
+                    socket_path=self.socket_path, connect_timeout=self.connect_timeout,
+                ))
+                subscriptions.append(callbacks.subscribe(
+                    self._on_callback,
+                    socket_path=self.socket_path, connect_timeout=self.connect_timeout,
+                ))
+            except (ConnectionError, TimeoutError, RuntimeError) as exc:
+                logger.debug("live view: subscribe failed: %s", exc)
+            else:
+                backoff = _retry.Backoff(self.reconnect_delay, cap=self.max_reconnect_delay)
+                self._connected = True
+                resync_backoff = _retry.Backoff(self.reconnect_delay, cap=self.max_reconnect_delay)
+                resynced = self._resync_once()
+                retry_at = time.monotonic() + (0.0 if resynced else resync_backoff.next())
+                while all(s.active for s in subscriptions) and not self._stop.wait(0.05):
+                    if not resynced and time.monotonic() >= retry_at:
+                        resynced = self._resync_once()
+                        if not resynced:
+                            retry_at = time.monotonic() + resync_backoff.next()
+            for sub in subscriptions:
+                sub.close()
+            if self._connected:
+                self._connected = False
+                self._current.clear()
+                self._disconnected_at = time.monotonic()
+                if not self._stop.is_set():
+                    self.reconnects += 1
+                    logger.info("live view: event stream lost; reconnecting")
+            self._stop.wait(backoff.next())
+
+    def _resync_once(self) -> bool:
+        """Load listed actions into the store. False (view stays stale) on failure."""
+        if self._resync is False:
+            self._current.set()
+            return True
+        if callable(self._resync):
+            source = self._resync
+        else:
+            from . import client
+
+            filters = {"agent_id": self.agent_id} if self.agent_id else {}
+
+            def source() -> Iterable[Dict[str, Any]]:
+                return client.iter_actions(page_size=min(self.resync_limit, 500), **filters)
+
+        with self._lock:
+            self._touched = set()
+        try:
+            actions = list(islice(source(), self.resync_limit))
+        except Exception as exc:
+            logger.warning("live view: resync failed; retrying: %s", exc)
+            with self._lock:
+                self._touched = None
+            return False
+        with self._lock:
+            touched, self._touched = self._touched or set(), None
+            # Listed newest first; add oldest first so recency order holds.
+            for action in reversed(actions):
+                if action.get("id"):
+                    self._resync_action(action, touched)
+            self.resyncs += 1
+            self.last_resync_at = time.time()
+        self._current.set()
+        return True
+
+    def _resync_action(self, action: Dict[str, Any], touched: set) -> None:
+        # Caller holds self._lock.
+        action_id = action["id"]
+        record_id = _record_link(action)
+        streamed = None
+        if record_id and record_id != action_id:
+            _remember(self._aliases, record_id, action_id)
+            # Events seen before the alias was known are filed by record_id.
+            streamed = self.store.remove_action(record_id)
+        if action_id in touched or (record_id is not None and record_id in touched):
+            # An event arrived during the resync: its state is newer.
+            current = streamed if streamed is not None else self.store.get_action(action_id)
+            if current is not None:
+                action = dict(action)
+                action.update((k, v) for k, v in current.items() if v is not None)
+                action["id"] = action_id
+        token = action.get("defer_token")
+        if token:
+            _remember(self._defer_ids, token, action_id)
+        self.store.add_action(action)
 
 
 # Optional singleton instance
 _default_store: Optional[ActionSnapshotStore] = None
+_default_store_lock = threading.Lock()
 
 
 def get_default_store() -> ActionSnapshotStore:
     """Get the default singleton store instance."""
     global _default_store
     if _default_store is None:
-        _default_store = ActionSnapshotStore()
+        with _default_store_lock:
+            if _default_store is None:
+                _default_store = ActionSnapshotStore()
     return _default_store
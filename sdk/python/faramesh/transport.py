@@ -1,16 +1,25 @@
-"""Governance transport: Unix socket daemon or HTTPS remote evaluate."""
+"""Governance transport: Unix socket daemon or HTTPS remote evaluate.
+
+Each socket path and remote URL has a process-wide circuit breaker (see
+:mod:`faramesh._retry`): after repeated connection failures, calls raise
+:class:`~faramesh._retry.CircuitOpenError` at once instead of waiting out
+the 30s I/O timeout against a daemon that is down.
+"""
 
 from __future__ import annotations
 
+import functools
 import json
 import os
 import socket
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import urllib.error
 import urllib.request
 
+from ._retry import get_breaker
+
 
 @dataclass
 class Transport:
@@ -46,6 +55,15 @@ def detect_transport() -> Transport:
     )
 
 
+@functools.lru_cache(maxsize=1024)
+def split_tool_id(tool_id: str) -> Tuple[str, str]:
+    """Split ``tool/operation`` into its parts; bare tool ids use ``invoke``."""
+    parts = tool_id.rsplit("/", 1)
+    if len(parts) > 1:
+        return parts[0], parts[1]
+    return tool_id, "invoke"
+
+
 def govern_via_transport(
     transport: Transport,
     tool_id: str,
@@ -55,9 +73,7 @@ def govern_via_transport(
     action_type: str = "tool_call",
 ) -> Dict[str, Any]:
     agent_id = agent_id or os.environ.get("FARAMESH_AGENT_ID", "auto-patched")
-    parts = tool_id.rsplit("/", 1)
-    tool = parts[0] if len(parts) > 1 else tool_id
-    operation = parts[1] if len(parts) > 1 else "invoke"
+    tool, operation = split_tool_id(tool_id)
     if transport.mode == "remote":
         return _govern_remote(transport, agent_id, tool, operation, args, action_type)
     return _govern_socket(transport.socket_path, agent_id, tool, operation, args, action_type)
@@ -85,14 +101,20 @@ def _govern_socket(
         },
     }
     body = (json.dumps(payload) + "\n").encode("utf-8")
+    breaker = get_breaker(("socket", socket_path))
+    breaker.before_call()
     conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
     try:
         conn.settimeout(30.0)
         conn.connect(socket_path)
         conn.sendall(body)
         data = conn.recv(65536)
+    except OSError:
+        breaker.record_failure()
+        raise
     finally:
         conn.close()
+    breaker.record_success()
     resp = json.loads(data.decode("utf-8"))
     if resp.get("error"):
         err = resp["error"]
@@ -131,11 +153,22 @@ def _govern_remote(
     )
     if transport.token:
         req.add_header("Authorization", f"Bearer {transport.token}")
+    breaker = get_breaker(("remote", transport.remote_url))
+    breaker.before_call()
     try:
         with urllib.request.urlopen(req, timeout=30) as resp:
             decision = json.loads(resp.read().decode("utf-8"))
     except urllib.error.HTTPError as exc:
+        if exc.code >= 500:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
         raise RuntimeError(f"remote evaluate: HTTP {exc.code}") from exc
+    except OSError:
+        # URLError, timeouts and refused connections.
+        breaker.record_failure()
+        raise
+    breaker.record_success()
     effect = (decision.get("effect") or decision.get("outcome") or "").upper()
     return {
         "effect": effect,
@@ -1,9 +1,13 @@
-"""Shared fixtures and helpers for socket-stream subscription tests.
+"""Shared fixtures and helpers for the SDK tests.
 
 A real Faramesh daemon isn't available in unit tests, so we stand up a
 mock Unix-socket server in a thread that mimics the daemon's
 subscribe-style protocols: read one newline-delimited JSON request,
 write a confirmation, then write canned events.
+
+REST client tests use :class:`FakeRestApi` instead: a local HTTP server
+that hands every request to a test-supplied handler and writes back its
+JSON reply (or an SSE stream).
 """
 
 from __future__ import annotations
@@ -14,10 +18,22 @@ import socket
 import tempfile
 import threading
 import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Iterable
+from urllib.parse import parse_qs, urlparse
 
 import pytest
 
 
+def eventually(check: Callable[[], Any], timeout: float = 3.0) -> None:
+    """Poll ``check`` until it returns truthy; fail the test after ``timeout``."""
+    deadline = time.monotonic() + timeout
+    while not check():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.01)
+
+
 def _mock_subscribe_server(
     socket_path: str,
     events: list[dict],
@@ -110,3 +126,121 @@ def start_mock_server():
         return thread, captured_request
 
     return _factory
+
+
+@dataclass
+class FakeRequest:
+    """One request received by :class:`FakeRestApi`."""
+
+    method: str
+    path: str
+    query: dict[str, str]
+    body: Any
+
+
+class SSE:
+    """Handler reply that streams each event as one ``data:`` frame."""
+
+    def __init__(self, events: Iterable[dict]):
+        self.events = events
+
+
+# A handler returns (status, body), (status, body, headers) or an SSE.
+RestHandler = Callable[[FakeRequest], Any]
+
+
+class FakeRestApi:
+    """Threaded HTTP server answering every request through ``handler``.
+
+    ``keep_alive`` speaks HTTP/1.1 so pooled connections are reused;
+    ``connections`` counts the TCP connections accepted.
+    """
+
+    def __init__(self, handler: RestHandler, *, keep_alive: bool = False):
+        self.connections = 0
+        api = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1" if keep_alive else "HTTP/1.0"
+
+            def setup(self):
+                super().setup()
+                api.connections += 1
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                self._dispatch("GET")
+
+            def do_POST(self):
+                self._dispatch("POST")
+
+            def _dispatch(self, method: str) -> None:
+                url = urlparse(self.path)
+                length = int(self.headers.get("Content-Length") or 0)
+                raw = self.rfile.read(length) if length else b""
+                reply = handler(FakeRequest(
+                    method=method,
+                    path=url.path,
+                    query={k: v[0] for k, v in parse_qs(url.query).items()},
+                    body=json.loads(raw) if raw else None,
+                ))
+                if isinstance(reply, SSE):
+                    self._stream(reply.events)
+                    return
+                code, body, *rest = reply
+                data = json.dumps(body).encode()
+                self.send_response(code)
+                self.send_header("Content-Type", "application/json")
+                for name, value in (rest[0] if rest else {}).items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _stream(self, events: Iterable[dict]) -> None:
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.end_headers()
+                for event in events:
+                    self.wfile.write(f"data: {json.dumps(event)}\n\n".encode())
+                    self.wfile.flush()
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, args=(0.05,), daemon=True).start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def close(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def rest_api(monkeypatch):
+    """Factory that starts a FakeRestApi and points the REST client at it.
+
+    Usage:
+        api = rest_api(handler, max_retries=2)  # extra kwargs go to configure()
+
+    Retries are off unless ``max_retries`` is given. Every server started
+    by the test is shut down afterwards.
+    """
+    import faramesh.client as client
+
+    apis: list[FakeRestApi] = []
+
+    def _factory(
+        handler: RestHandler, *, keep_alive: bool = False, **config: Any
+    ) -> FakeRestApi:
+        api = FakeRestApi(handler, keep_alive=keep_alive)
+        apis.append(api)
+        monkeypatch.setattr(client, "_config", None)
+        config.setdefault("max_retries", 0)
+        client.configure(base_url=api.base_url, **config)
+        return api
+
+    yield _factory
+    for api in apis:
+        api.close()
@@ -0,0 +1,117 @@
+"""Tests for event-driven block_until_approved / wait_for_completion."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+from conftest import SSE
+
+import faramesh.client as client
+
+
+class _FakeApi:
+    """Minimal REST + SSE state: GET /v1/actions/<id> and GET /v1/events."""
+
+    def __init__(self, *, sse: bool = True):
+        self.sse = sse
+        self.statuses: dict[str, str] = {}
+        self.get_counts: dict[str, int] = {}
+        self.events: list[dict] = []
+        self.cond = threading.Condition()
+
+    def __call__(self, request):
+        if request.path == "/v1/events" and self.sse:
+            return SSE(self._stream())
+        if request.path.startswith("/v1/actions/"):
+            action_id = request.path.rsplit("/", 1)[1]
+            with self.cond:
+                self.get_counts[action_id] = self.get_counts.get(action_id, 0) + 1
+                status = self.statuses.get(action_id, "pending_approval")
+            return 200, {"id": action_id, "status": status}
+        return 404, {"detail": "not found"}
+
+    def _stream(self):
+        sent = 0
+        while True:
+            with self.cond:
+                self.cond.wait_for(lambda: len(self.events) > sent, timeout=5.0)
+                pending = self.events[sent:]
+            if not pending:
+                return
+            for event in pending:
+                yield event
+                sent += 1
+
+    def update(self, action_id: str, status: str) -> None:
+        with self.cond:
+            self.statuses[action_id] = status
+            self.events.append({"event_type": "action_updated", "action_id": action_id})
+            self.cond.notify_all()
+
+
+@pytest.fixture
+def fake_api(monkeypatch, rest_api):
+    def _factory(**kwargs):
+        api = _FakeApi(**kwargs)
+        rest_api(api)
+        monkeypatch.setattr(client, "_action_waiters", None)
+        monkeypatch.setattr(client, "_action_events", client._ActionEventStream())
+        return api
+
+    yield _factory
+    if client._action_waiters is not None:
+        client._action_waiters.close()
+
+
+def test_event_wakes_waiter_without_polling(fake_api):
+    api = fake_api()
+    threading.Timer(0.3, api.update, args=("a1", "approved")).start()
+
+    started = time.monotonic()
+    action = client.block_until_approved("a1", poll_interval=30, timeout=5)
+    assert action["status"] == "approved"
+    assert time.monotonic() - started < 2.0
+    # Registration check plus the event-triggered confirmation.
+    assert api.get_counts["a1"] == 2
+
+
+def test_many_waiters_share_one_stream(fake_api):
+    api = fake_api()
+    ids = [f"c{i}" for i in range(20)]
+    results: dict[str, dict] = {}
+
+    def wait(action_id):
+        results[action_id] = client.wait_for_completion(action_id, poll_interval=30, timeout=5)
+
+    threads = [threading.Thread(target=wait, args=(i,)) for i in ids]
+    for t in threads:
+        t.start()
+    time.sleep(0.3)
+    for action_id in ids:
+        api.update(action_id, "succeeded")
+    for t in threads:
+        t.join(5)
+    assert {r["status"] for r in results.values()} == {"succeeded"}
+    assert len(results) == len(ids)
+
+
+def test_denied_raises(fake_api):
+    api = fake_api()
+    threading.Timer(0.2, api.update, args=("d1", "denied")).start()
+    with pytest.raises(client.FarameshDeniedError):
+        client.block_until_approved("d1", poll_interval=30, timeout=5)
+
+
+def test_falls_back_to_polling_without_stream(fake_api):
+    api = fake_api(sse=False)
+    threading.Timer(0.2, api.update, args=("p1", "succeeded")).start()
+    action = client.wait_for_completion("p1", poll_interval=0.05, timeout=5)
+    assert action["status"] == "succeeded"
+
+
+def test_timeout_raises_faramesh_timeout(fake_api):
+    fake_api(sse=False)
+    with pytest.raises(client.FarameshTimeoutError, match="Current status: pending_approval"):
+        client.wait_for_completion("never", poll_interval=0.05, timeout=0.2)
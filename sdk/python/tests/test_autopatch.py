@@ -1,7 +1,11 @@
 """Tests for the Faramesh auto-patcher."""
 from __future__ import annotations
 
+import asyncio
+import inspect
 import os
+import sys
+import tempfile
 import types
 import unittest
 from unittest.mock import patch, MagicMock
@@ -193,5 +197,298 @@ class TestAutopatch(unittest.TestCase):
         self.assertEqual(result1, result2)
 
 
+class TestAsyncWrapMethod(unittest.TestCase):
+    """Coroutine dispatch methods get async wrappers that never block the loop."""
+
+    def _make_async_cls(self):
+        from faramesh import _governance_scope
+
+        class AsyncTool:
+            name = "async_tool"
+
+            async def acall(self, query):
+                await asyncio.sleep(0)
+                return f"ran:{query}:{_governance_scope.is_governed('async_tool')}"
+
+        return AsyncTool
+
+    @patch("faramesh.autopatch._govern_call")
+    def test_async_method_gets_async_wrapper(self, mock_govern):
+        from faramesh.autopatch import _wrap_method
+
+        mock_govern.return_value = {"effect": "PERMIT"}
+        cls = self._make_async_cls()
+        _wrap_method(cls, "acall", "test", lambda self, a, kw: self.name)
+
+        self.assertTrue(inspect.iscoroutinefunction(cls.acall))
+        self.assertEqual(asyncio.run(cls().acall("q")), "ran:q:True")
+        mock_govern.assert_called_once_with("async_tool", {"input": "q"})
+
+    @patch("faramesh.autopatch._govern_call")
+    def test_async_deny_raises_before_running(self, mock_govern):
+        from faramesh.autopatch import _wrap_method
+
+        mock_govern.return_value = {"effect": "DENY", "reason_code": "NOPE"}
+        cls = self._make_async_cls()
+        cls.acall = MagicMock(wraps=cls.acall)
+        original = cls.acall
+        _wrap_method(cls, "acall", "test", lambda self, a, kw: self.name)
+
+        with self.assertRaises(RuntimeError) as ctx:
+            asyncio.run(cls().acall("q"))
+        self.assertIn("NOPE", str(ctx.exception))
+        original.assert_not_called()
+
+    @patch("faramesh._defer._DeferPoller.__call__")
+    @patch("faramesh.autopatch._govern_call")
+    def test_async_defer_wait_does_not_block_event_loop(self, mock_govern, mock_poll):
+        from faramesh import _defer
+        from faramesh.autopatch import _wrap_method
+
+        mock_govern.return_value = {"effect": "DEFER", "defer_token": "tok"}
+        mock_poll.side_effect = [{}, {}, {"tok": "approved"}]
+        cls = self._make_async_cls()
+        _wrap_method(cls, "acall", "test", lambda self, a, kw: self.name)
+
+        async def main():
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    ticks += 1
+                    await asyncio.sleep(0.001)
+
+            task = asyncio.create_task(ticker())
+            try:
+                result = await cls().acall("q")
+            finally:
+                task.cancel()
+            return result, ticks
+
+        env = {
+            "FARAMESH_SOCKET": os.path.join(tempfile.mkdtemp(), "faramesh.sock"),
+            "FARAMESH_DEFER_POLL_INTERVAL_SECONDS": "0.02",
+        }
+        with patch.dict(os.environ, env), patch("os.path.exists", return_value=True):
+            try:
+                result, ticks = asyncio.run(main())
+            finally:
+                _defer.close_all()
+
+        self.assertEqual(result, "ran:q:True")
+        self.assertEqual(mock_poll.call_count, 3)
+        self.assertGreater(ticks, 5)
+
+
+class TestGovernanceScope(unittest.TestCase):
+    """Nested patched layers must govern each logical tool call exactly once."""
+
+    def test_scope_matches_tool_name_and_call_id(self):
+        from faramesh import _governance_scope as scope
+
+        token = scope.enter("search", "call-1")
+        try:
+            self.assertTrue(scope.is_governed("search"))
+            self.assertTrue(scope.is_governed("search", "call-1"))
+            self.assertFalse(scope.is_governed("search", "call-2"))
+            self.assertFalse(scope.is_governed("fetch"))
+        finally:
+            scope.leave(token)
+        self.assertFalse(scope.is_governed("search"))
+
+    @patch("faramesh.autopatch._govern_call")
+    def test_nested_layers_of_same_tool_govern_once(self, mock_govern):
+        from faramesh.autopatch import _wrap_method
+
+        mock_govern.return_value = {"effect": "PERMIT"}
+
+        class Tool:
+            name = "search"
+
+            def invoke(self, query):
+                return self.run(query)
+
+            def run(self, query):
+                return f"ran:{query}"
+
+        def tool_id_fn(self, a, kw):
+            return self.name
+
+        _wrap_method(Tool, "invoke", "test", tool_id_fn)
+        _wrap_method(Tool, "run", "test", tool_id_fn)
+
+        self.assertEqual(Tool().invoke("q"), "ran:q")
+        mock_govern.assert_called_once()
+
+    @patch("faramesh.autopatch._govern_call")
+    def test_different_tool_inside_governed_tool_is_governed(self, mock_govern):
+        from faramesh.autopatch import _wrap_method
+
+        mock_govern.return_value = {"effect": "PERMIT"}
+
+        class Tool:
+            def __init__(self, name, inner=None):
+                self.name = name
+                self.inner = inner
+
+            def run(self, query):
+                if self.inner is not None:
+                    return self.inner.run(query)
+                return query
+
+        _wrap_method(Tool, "run", "test", lambda self, a, kw: self.name)
+
+        Tool("outer", inner=Tool("inner")).run("q")
+        self.assertEqual([c[0][0] for c in mock_govern.call_args_list], ["outer", "inner"])
+
+    @patch("faramesh.governed_toolset._govern_call")
+    @patch("faramesh.autopatch._govern_call")
+    def test_governed_toolset_inside_autopatched_framework(self, mock_autopatch, mock_toolset):
+        from faramesh import GovernedToolSet
+        from faramesh.autopatch import _wrap_method
+
+        mock_autopatch.return_value = {"effect": "PERMIT"}
+        mock_toolset.return_value = {"effect": "PERMIT"}
+
+        def search(query):
+            return f"found:{query}"
+
+        governed = GovernedToolSet([search], agent_id="agent-1")[0]
+
+        class FrameworkTool:
+            name = "search"
+
+            def call(self, query):
+                return governed(query)
+
+        _wrap_method(FrameworkTool, "call", "test", lambda self, a, kw: self.name)
+
+        self.assertEqual(FrameworkTool().call("q"), "found:q")
+        mock_autopatch.assert_called_once()
+        mock_toolset.assert_not_called()
+
+    @patch("faramesh.governed_toolset._govern_call")
+    @patch("faramesh.autopatch._govern_call")
+    def test_governed_toolset_function_inside_differently_named_tool(
+        self, mock_autopatch, mock_toolset
+    ):
+        from faramesh import GovernedToolSet
+        from faramesh.autopatch import _instance_tool_id, _wrap_method
+
+        mock_autopatch.return_value = {"effect": "PERMIT"}
+        mock_toolset.return_value = {"effect": "PERMIT"}
+
+        def do_search(query):
+            return f"found:{query}"
+
+        class FrameworkTool:
+            def __init__(self, name, func):
+                self.name = name
+                self.func = func
+
+            def invoke(self, query):
+                return self.func(query)
+
+        _wrap_method(FrameworkTool, "invoke", "test", _instance_tool_id("name"))
+        governed = GovernedToolSet([do_search], agent_id="agent-1")[0]
+
+        self.assertEqual(FrameworkTool("web_search", governed).invoke("q"), "found:q")
+        self.assertEqual(mock_autopatch.call_count + mock_toolset.call_count, 1)
+        self.assertEqual(mock_autopatch.call_args[0][0], "web_search")
+
+
+class TestLazyImportHook(unittest.TestCase):
+    """Tests for the sys.meta_path hook that patches frameworks on first import."""
+
+    def setUp(self):
+        self._tmpdir = tempfile.TemporaryDirectory()
+        pkg = os.path.join(self._tmpdir.name, "faramesh_fake_framework")
+        os.makedirs(pkg)
+        with open(os.path.join(pkg, "__init__.py"), "w") as fh:
+            fh.write("")
+        with open(os.path.join(pkg, "tools.py"), "w") as fh:
+            fh.write(
+                "class BaseTool:\n"
+                "    name = 'fake'\n"
+                "    def _run(self, *args, **kwargs):\n"
+                "        return 'ran'\n"
+            )
+        sys.path.insert(0, self._tmpdir.name)
+
+    def tearDown(self):
+        sys.path.remove(self._tmpdir.name)
+        for name in ("faramesh_fake_framework", "faramesh_fake_framework.tools"):
+            sys.modules.pop(name, None)
+        self._tmpdir.cleanup()
+
+    def _install_hook(self, hooks):
+        from faramesh.autopatch import _FrameworkImportHook
+
+        hook = _FrameworkImportHook(hooks)
+        sys.meta_path.insert(0, hook)
+        self.addCleanup(sys.meta_path.remove, hook)
+        return hook
+
+    def test_patches_framework_on_first_import(self):
+        from faramesh.autopatch import _wrap_method
+
+        calls = []
+
+        def patcher():
+            mod = sys.modules["faramesh_fake_framework.tools"]
+            calls.append(mod)
+            return _wrap_method(mod.BaseTool, "_run", "fake", lambda self, a, kw: self.name)
+
+        self._install_hook({"faramesh_fake_framework.tools": ("fake", patcher)})
+        self.assertEqual(calls, [])
+
+        from faramesh_fake_framework.tools import BaseTool
+
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(getattr(BaseTool._run, "_faramesh_patched", False))
+
+    def test_restores_real_loader_on_module(self):
+        from faramesh.autopatch import _PatchingLoader
+
+        self._install_hook({"faramesh_fake_framework.tools": ("fake", lambda: False)})
+        import faramesh_fake_framework.tools as mod
+
+        self.assertNotIsInstance(mod.__loader__, _PatchingLoader)
+        self.assertNotIsInstance(mod.__spec__.loader, _PatchingLoader)
+
+    def test_unwatched_modules_are_not_intercepted(self):
+        calls = []
+        self._install_hook({"faramesh_fake_framework.tools": ("fake", lambda: calls.append(1))})
+
+        import faramesh_fake_framework  # noqa: F401
+
+        self.assertEqual(calls, [])
+
+    def test_patcher_error_does_not_break_import(self):
+        def patcher():
+            raise ImportError("boom")
+
+        self._install_hook({"faramesh_fake_framework.tools": ("fake", patcher)})
+        from faramesh_fake_framework.tools import BaseTool
+
+        self.assertEqual(BaseTool()._run(), "ran")
+
+    def test_lazy_install_does_not_import_frameworks(self):
+        import faramesh.autopatch as ap
+
+        hooks = {"faramesh_fake_framework.tools": ("fake", lambda: True)}
+        with patch.object(ap, "_IMPORT_HOOKS", hooks), patch.object(ap, "_installed", False), \
+                patch.object(ap, "_import_hook", None), patch.object(ap, "_patched_frameworks", []):
+            patched = ap.install()
+            self.addCleanup(sys.meta_path.remove, ap._import_hook)
+            self.assertEqual(patched, [])
+            self.assertNotIn("faramesh_fake_framework.tools", sys.modules)
+
+            import faramesh_fake_framework.tools  # noqa: F401
+
+            self.assertEqual(ap._patched_frameworks, ["fake"])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,125 @@
+"""Microbenchmarks for the SDK-side overhead of auto-patched dispatch methods.
+
+Each case wraps a fake tool shaped like one framework patcher's dispatch
+point, stubs out the daemon round trip, and measures the wrapper's added
+cost per call against the unwrapped method. The budget is deliberately loose
+for shared CI hosts; run with ``-s`` to see the measured numbers.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+import faramesh.autopatch as autopatch
+
+_CALLS = 20000
+_BUDGET_US = float(os.environ.get("FARAMESH_WRAPPER_BUDGET_US", "25"))
+
+# framework -> (tool id resolver, instance attributes, call args, call kwargs)
+_CASES = {
+    "crewai": ("_NAME_TOOL_ID", {"name": "search"}, ("query text",), {}),
+    "autogen": ("_AUTOGEN_TOOL_ID", {}, (), {"name": "search", "arguments": '{"q": "x"}'}),
+    "openai-agents": ("_NAME_TOOL_ID", {"name": "search"}, (None, '{"q": "x"}'), {}),
+    "pydantic-ai": ("_PYDANTIC_AI_TOOL_ID", {"function_name": "search"}, (), {"args": {"q": "x"}}),
+    "pydantic-ai-agent": ("_PYDANTIC_AI_AGENT_TOOL_ID", {}, (), {"tool_name": "search"}),
+    "google-adk": ("_GOOGLE_ADK_TOOL_ID", {"name": "search"}, (), {"args": {"q": "x"}}),
+    "llamaindex": (
+        "_LLAMAINDEX_TOOL_ID",
+        {"metadata": SimpleNamespace(name="search")},
+        (),
+        {"input": "x"},
+    ),
+    "strands-agents": ("_STRANDS_TOOL_ID", {"tool_name": "search"}, (), {"q": "x"}),
+    "strands-agents-agent": ("_STRANDS_AGENT_TOOL_ID", {}, ("search",), {}),
+    "smolagents": ("_NAME_TOOL_ID", {"name": "search"}, (), {"q": "x"}),
+    "haystack": ("_HAYSTACK_TOOL_ID", {}, ({"retriever": {"query": "x"}},), {}),
+}
+
+
+def _permit(tool_id, args):
+    return {"effect": "PERMIT"}
+
+
+def _per_call_us(fn, args, kwargs) -> float:
+    start = time.perf_counter()
+    for _ in range(_CALLS):
+        fn(*args, **kwargs)
+    return (time.perf_counter() - start) / _CALLS * 1e6
+
+
+@pytest.mark.parametrize("framework", sorted(_CASES))
+def test_wrapper_overhead(framework):
+    resolver_name, attrs, args, kwargs = _CASES[framework]
+
+    class Tool:
+        def dispatch(self, *a, **kw):
+            return None
+
+    tool = Tool()
+    for key, value in attrs.items():
+        setattr(tool, key, value)
+    baseline = _per_call_us(tool.dispatch, args, kwargs)
+
+    assert autopatch._wrap_method(Tool, "dispatch", framework, getattr(autopatch, resolver_name))
+    with patch.object(autopatch, "_govern_call", _permit):
+        wrapped = _per_call_us(tool.dispatch, args, kwargs)
+
+    overhead = wrapped - baseline
+    print(f"{framework}: {overhead:.2f}us/call overhead")
+    assert overhead < _BUDGET_US
+
+
+def test_instance_tool_id_resolved_once_per_tool():
+    calls = []
+
+    class Tool:
+        @property
+        def name(self):
+            calls.append(1)
+            return "search"
+
+        def run(self, query):
+            return query
+
+    autopatch._wrap_method(Tool, "run", "test", autopatch._NAME_TOOL_ID)
+    tool = Tool()
+    with patch.object(autopatch, "_govern_call", _permit):
+        for _ in range(5):
+            tool.run("q")
+        Tool().run("q")
+
+    assert len(calls) == 2
+
+
+def test_json_safe_args_are_not_copied():
+    args = {"input": "x", "opts": {"n": 1, "flags": [True, None, 1.5]}}
+    assert autopatch._json_safe(args) is args
+    assert autopatch._json_safe({"b": b"raw", 1: (2,)}) == {"b": "raw", "1": [2]}
+
+
+def test_instance_tool_id_cached_for_unhashable_tools():
+    calls = []
+
+    class Tool:
+        __hash__ = None  # like pydantic models
+
+        @property
+        def name(self):
+            calls.append(1)
+            return "search"
+
+        def run(self, query):
+            return query
+
+    autopatch._wrap_method(Tool, "run", "test", autopatch._NAME_TOOL_ID)
+    tool = Tool()
+    with patch.object(autopatch, "_govern_call", _permit):
+        tool.run("q")
+        tool.run("q")
+
+    assert len(calls) == 1
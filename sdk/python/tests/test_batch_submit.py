@@ -0,0 +1,227 @@
+"""Tests for submit_actions / submit_actions_bulk batching."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+import faramesh.client as client
+
+
+class _FakeSubmit:
+    """Stands in for submit_action: records peak concurrency, fails on demand."""
+
+    def __init__(self, delay: float = 0.02, fail: tuple[str, ...] = ()):
+        self.delay = delay
+        self.fail = set(fail)
+        self.active = 0
+        self.peak = 0
+        self.calls: list[str] = []
+        self.lock = threading.Lock()
+
+    def __call__(self, agent_id, tool, operation, params=None, context=None):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            self.calls.append(tool)
+        try:
+            # Later items finish first, so ordering has to be restored.
+            time.sleep(self.delay / (1 + int(tool[1:])))
+            if tool in self.fail:
+                raise client.FarameshServerError(f"boom {tool}")
+            return {"id": f"id-{tool}", "status": "allowed"}
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+def _specs(n: int) -> list[dict]:
+    return [{"agent_id": "a", "tool": f"t{i}", "operation": "run"} for i in range(n)]
+
+
+def test_concurrent_results_keep_input_order():
+    fake = _FakeSubmit()
+    with patch.object(client, "submit_action", fake):
+        results = client.submit_actions(_specs(20), concurrency=5)
+    assert [r["id"] for r in results] == [f"id-t{i}" for i in range(20)]
+    assert 1 < fake.peak <= 5
+
+
+def test_default_is_sequential():
+    fake = _FakeSubmit(delay=0.0)
+    with patch.object(client, "submit_action", fake):
+        client.submit_actions(_specs(5))
+    assert fake.peak == 1
+
+
+def test_bulk_placeholders_and_batch_error():
+    fake = _FakeSubmit(fail=("t3",))
+    with patch.object(client, "submit_action", fake):
+        results = client.submit_actions_bulk(_specs(6), concurrency=3, use_batch_endpoint=False)
+        assert results[3]["index"] == 3
+        assert "boom t3" in results[3]["error"]
+        assert results[4]["id"] == "id-t4"
+
+        with pytest.raises(client.FarameshBatchError) as exc:
+            client.submit_actions_bulk(
+                _specs(6), concurrency=3, raise_on_error=True, use_batch_endpoint=False
+            )
+    assert [e["index"] for e in exc.value.errors] == [3]
+    assert len(exc.value.successes) == 5
+
+
+def test_stop_on_error_skips_unsent_actions():
+    fake = _FakeSubmit(delay=0.0, fail=("t1",))
+    with patch.object(client, "submit_action", fake):
+        results = client.submit_actions_bulk(
+            _specs(50), concurrency=2, stop_on_error=True, use_batch_endpoint=False
+        )
+    assert len(results) == 50
+    skipped = [r for r in results if r.get("skipped")]
+    assert skipped and len(fake.calls) < 50
+    assert all("error" in r for r in skipped)
+
+    fake = _FakeSubmit(delay=0.0, fail=("t1",))
+    with patch.object(client, "submit_action", fake):
+        results = client.submit_actions(_specs(5), stop_on_error=True)
+    assert fake.calls == ["t0", "t1"]
+    assert [r.get("skipped", False) for r in results] == [False, False, True, True, True]
+
+
+class _BatchApi:
+    """POST /v1/actions:batch (optional) and POST /v1/actions."""
+
+    def __init__(
+        self,
+        *,
+        batch: bool = True,
+        batch_status: int = 200,
+        deny_tools: tuple[str, ...] = (),
+    ):
+        self.batch = batch
+        self.batch_status = batch_status
+        self.deny_tools = deny_tools
+        self.batch_sizes: list[int] = []
+        self.single_calls = 0
+
+    def _decide(self, spec):
+        if spec["tool"] in self.deny_tools:
+            return {"id": f"id-{spec['tool']}", "status": "denied", "reason": "nope"}
+        return {"id": f"id-{spec['tool']}", "status": "allowed"}
+
+    def __call__(self, request):
+        if request.path == "/v1/actions:batch" and self.batch:
+            self.batch_sizes.append(len(request.body["actions"]))
+            if self.batch_status != 200:
+                return self.batch_status, {"detail": "rejected"}
+            return 200, {"results": [self._decide(spec) for spec in request.body["actions"]]}
+        if request.path == "/v1/actions":
+            self.single_calls += 1
+            return 200, self._decide(request.body)
+        return 404, {"detail": "not found"}
+
+
+@pytest.fixture
+def batch_api(monkeypatch, rest_api):
+    def _factory(**kwargs):
+        api = _BatchApi(**kwargs)
+        monkeypatch.setattr(client, "_batch_unsupported", {})
+        rest_api(api)
+        return api
+
+    return _factory
+
+
+def test_chunk_bounds_respect_count_and_size():
+    specs = _specs(10)
+    assert client._chunk_bounds(specs, 4, 10**6) == [(0, 4), (4, 8), (8, 10)]
+    big = [{"blob": "x" * 100}] * 3
+    assert client._chunk_bounds(big, 100, 150) == [(0, 1), (1, 2), (2, 3)]
+
+
+def test_bulk_uses_batch_endpoint_in_chunks(batch_api):
+    api = batch_api(deny_tools=("t7",))
+    results = client.submit_actions_bulk(_specs(25), batch_size=10, concurrency=3)
+    assert sorted(api.batch_sizes) == [5, 10, 10]
+    assert api.single_calls == 0
+    assert [r.get("id") for r in results if "error" not in r] == [
+        f"id-t{i}" for i in range(25) if i != 7
+    ]
+    assert results[7]["index"] == 7
+    assert "denied by policy" in results[7]["error"]
+
+
+def test_bulk_falls_back_without_batch_endpoint(batch_api):
+    api = batch_api(batch=False)
+    results = client.submit_actions_bulk(_specs(4), batch_size=2)
+    assert [r["id"] for r in results] == [f"id-t{i}" for i in range(4)]
+    assert api.single_calls == 4
+    # The missing endpoint is remembered: no second probe.
+    client.submit_actions_bulk(_specs(2))
+    assert api.single_calls == 6
+
+
+def test_bulk_falls_back_and_remembers_method_not_allowed(batch_api):
+    api = batch_api(batch_status=405)
+    results = client.submit_actions_bulk(_specs(4), batch_size=2)
+    assert [r["id"] for r in results] == [f"id-t{i}" for i in range(4)]
+    assert api.batch_sizes == [2]
+    assert api.single_calls == 4
+    client.submit_actions_bulk(_specs(2))
+    assert api.batch_sizes == [2]
+
+
+@pytest.mark.parametrize("status", [400, 422])
+def test_bulk_rejected_batch_is_per_item_error_not_resubmitted(batch_api, status):
+    api = batch_api(batch_status=status)
+    results = client.submit_actions_bulk(_specs(4), batch_size=2)
+    assert api.single_calls == 0
+    assert sorted(api.batch_sizes) == [2, 2]
+    assert [r["index"] for r in results] == [0, 1, 2, 3]
+    assert all("error" in r for r in results)
+    # Not a missing endpoint: the next call still uses the batch endpoint.
+    client.submit_actions_bulk(_specs(2))
+    assert api.single_calls == 0
+    assert len(api.batch_sizes) == 3
+
+
+def test_submit_stream_is_lazy_and_bounded():
+    fake = _FakeSubmit()
+    consumed = []
+
+    def source():
+        for spec in _specs(30):
+            consumed.append(spec["tool"])
+            yield spec
+
+    with patch.object(client, "submit_action", fake):
+        stream = client.submit_stream(source(), concurrency=4)
+        first = next(stream)
+        assert first == (0, {"id": "id-t0", "status": "allowed"})
+        assert len(consumed) <= 5
+        rest = list(stream)
+    assert [i for i, _ in rest] == list(range(1, 30))
+    assert fake.peak <= 4
+
+
+def test_submit_stream_as_completed_from_jsonl(tmp_path):
+    path = tmp_path / "actions.jsonl"
+    path.write_text("\n".join(json.dumps(s) for s in _specs(8)) + "\n\n")
+    fake = _FakeSubmit(fail=("t5",))
+    with patch.object(client, "submit_action", fake):
+        results = dict(client.submit_stream(path, concurrency=8, ordered=False))
+    assert sorted(results) == list(range(8))
+    assert results[5]["index"] == 5 and "boom t5" in results[5]["error"]
+    assert results[7]["id"] == "id-t7"
+
+
+def test_submit_stream_stop_on_error():
+    fake = _FakeSubmit(delay=0.0, fail=("t2",))
+    with patch.object(client, "submit_action", fake):
+        results = list(client.submit_stream(_specs(100), concurrency=2, stop_on_error=True))
+    assert results[-1][0] >= 2
+    assert len(fake.calls) < 10
@@ -0,0 +1,65 @@
+"""Tests for the pooled keep-alive session used by the REST client."""
+
+from __future__ import annotations
+
+import pytest
+
+import faramesh.client as client
+
+
+def _get_action(request):
+    return 200, {"id": request.path.rsplit("/", 1)[1], "status": "allowed"}
+
+
+@pytest.fixture
+def api(monkeypatch, rest_api):
+    monkeypatch.setattr(client, "_sessions", {})
+    monkeypatch.setattr(client, "_session_refs", {})
+    yield rest_api(_get_action, keep_alive=True)
+    client.close_sessions()
+
+
+def test_requests_reuse_one_connection(api):
+    for i in range(5):
+        assert client.get_action(f"a{i}")["id"] == f"a{i}"
+    assert api.connections == 1
+
+
+def test_session_is_shared_per_config_and_closed(api):
+    session = client._get_session()
+    assert client._get_session() is session
+    other = client.ClientConfig(base_url=api.base_url, pool_maxsize=2)
+    assert client._get_session(other) is not session
+    adapter = client._get_session(other).get_adapter(api.base_url)
+    assert adapter._pool_maxsize == 2
+
+    client.close_sessions()
+    assert client._sessions == {}
+    assert client._get_session() is not session
+
+
+def test_pool_size_from_env(monkeypatch):
+    monkeypatch.setenv("FARAMESH_HTTP_POOL_MAXSIZE", "32")
+    assert client.ClientConfig().pool_maxsize == 32
+
+
+def test_legacy_client_closes_its_pool(api):
+    with client.ExecutionGovernorClient(api.base_url) as legacy:
+        legacy.get_action("x")
+        assert legacy.session is client._get_session()
+    assert client._sessions == {}
+
+
+def test_closing_one_legacy_client_keeps_the_shared_pool(api):
+    first = client.ExecutionGovernorClient(api.base_url)
+    second = client.ExecutionGovernorClient(api.base_url)
+    session = second.session
+
+    first.close()
+    first.close()  # idempotent: releases only once
+    assert second.session is session
+    assert second.get_action("y")["id"] == "y"
+    assert api.connections == 1
+
+    second.close()
+    assert client._sessions == {}
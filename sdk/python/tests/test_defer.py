@@ -0,0 +1,213 @@
+"""Tests for ``faramesh._defer`` (shared DEFER resolution)."""
+
+from __future__ import annotations
+
+import json
+import socket
+import threading
+
+import pytest
+
+from faramesh import _defer
+from faramesh._waiters import WaiterRegistry
+
+
+def _poll_server(socket_path: str, statuses: dict[str, list[str]], connections: list[int]):
+    """Serve ``poll_defer`` on any number of requests per connection."""
+    srv = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    srv.bind(socket_path)
+    srv.listen(4)
+    srv.settimeout(5.0)
+
+    def serve(conn):
+        buf = b""
+        with conn:
+            while True:
+                chunk = conn.recv(4096)
+                if not chunk:
+                    return
+                buf += chunk
+                while b"\n" in buf:
+                    line, buf = buf.split(b"\n", 1)
+                    request = json.loads(line)
+                    if request.get("type") != "poll_defer":
+                        conn.sendall(b'{"error": "unknown type"}\n')
+                        continue
+                    token = request["defer_token"]
+                    queue = statuses.get(token) or ["unknown"]
+                    status = queue.pop(0) if len(queue) > 1 else queue[0]
+                    reply = {"defer_token": token, "status": status}
+                    conn.sendall(json.dumps(reply).encode("utf-8") + b"\n")
+
+    def accept():
+        try:
+            while True:
+                conn, _ = srv.accept()
+                connections.append(1)
+                threading.Thread(target=serve, args=(conn,), daemon=True).start()
+        except OSError:
+            pass
+
+    threading.Thread(target=accept, daemon=True).start()
+    return srv
+
+
+def test_listener_resolves_registered_token(socket_path, start_mock_server):
+    start_mock_server(
+        socket_path,
+        [
+            {"event_type": "decision", "defer_token": "tok-1", "effect": "DEFER"},
+            {"event_type": "defer_resolved", "defer_token": "other", "status": "denied"},
+            {"event_type": "defer_resolved", "defer_token": "tok-1", "status": "approved"},
+            {"event_type": "defer_resolved", "defer_token": "tok-2", "approved": False},
+        ],
+        confirmation=b'{"subscribed": true, "stream": "callbacks"}\n',
+    )
+    registry = WaiterRegistry("test", lambda due: {}, recheck_interval=60.0)
+    listener = _defer.DeferListener(socket_path, registry)
+    first, second = registry.watch("tok-1"), registry.watch("tok-2")
+    try:
+        assert listener.ensure_started()
+        assert first.result(2.0) == "approved"
+        assert second.result(2.0) == "denied"
+    finally:
+        listener.close()
+        registry.close()
+
+
+def test_listener_unavailable_is_remembered(socket_path):
+    registry = WaiterRegistry("test", lambda due: {})
+    listener = _defer.DeferListener(socket_path, registry, connect_timeout=0.2)
+    try:
+        assert listener.ensure_started() is False
+        assert listener.ensure_started() is False
+        assert listener.active is False
+    finally:
+        registry.close()
+
+
+def test_poller_pipelines_tokens_over_one_connection(socket_path):
+    connections: list[int] = []
+    srv = _poll_server(
+        socket_path,
+        {"a": ["pending"], "b": ["approved"], "c": ["expired"], "d": ["bogus"]},
+        connections,
+    )
+    poller = _defer._DeferPoller(socket_path)
+    try:
+        resolved = poller({"a": "agent", "b": "agent", "c": "agent", "d": "agent"})
+        assert resolved["b"] == "approved"
+        assert resolved["c"] == "expired"
+        assert "a" not in resolved
+        assert isinstance(resolved["d"], RuntimeError)
+        assert poller({"a": "agent"}) == {}
+        assert len(connections) == 1
+    finally:
+        poller.close()
+        srv.close()
+
+
+def _scripted_poll_server(socket_path: str, reply, connections: list[int]):
+    """Answer each request line with ``reply(connection_index, request)`` bytes."""
+    srv = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    srv.bind(socket_path)
+    srv.listen(4)
+
+    def serve(conn, index):
+        buf = b""
+        with conn:
+            while True:
+                chunk = conn.recv(4096)
+                if not chunk:
+                    return
+                buf += chunk
+                while b"\n" in buf:
+                    line, buf = buf.split(b"\n", 1)
+                    try:
+                        conn.sendall(reply(index, json.loads(line)))
+                    except OSError:
+                        return  # the poller hung up mid-batch
+
+    def accept():
+        try:
+            while True:
+                conn, _ = srv.accept()
+                connections.append(1)
+                index = len(connections) - 1
+                threading.Thread(target=serve, args=(conn, index), daemon=True).start()
+        except OSError:
+            pass
+
+    threading.Thread(target=accept, daemon=True).start()
+    return srv
+
+
+def test_poller_resets_connection_after_malformed_response(socket_path):
+    connections: list[int] = []
+
+    def reply(index, request):
+        token = request["defer_token"]
+        if index == 0 and token == "a":
+            return b"not json\n"
+        return json.dumps({"defer_token": token, "status": "approved"}).encode() + b"\n"
+
+    srv = _scripted_poll_server(socket_path, reply, connections)
+    poller = _defer._DeferPoller(socket_path)
+    try:
+        with pytest.raises(ValueError):
+            poller({"a": "agent", "b": "agent"})
+        assert poller._sock is None and poller._buf == b""
+        assert poller({"c": "agent"}) == {"c": "approved"}
+        assert len(connections) == 2
+    finally:
+        poller.close()
+        srv.close()
+
+
+def test_poller_drops_responses_for_other_tokens(socket_path):
+    connections: list[int] = []
+
+    def reply(index, request):
+        token = request["defer_token"]
+        if index == 0 and token == "a":
+            token = "stale"
+        return json.dumps({"defer_token": token, "status": "approved"}).encode() + b"\n"
+
+    srv = _scripted_poll_server(socket_path, reply, connections)
+    poller = _defer._DeferPoller(socket_path)
+    try:
+        assert poller({"a": "agent", "b": "agent"}) == {"b": "approved"}
+        assert poller._sock is None
+        assert poller({"a": "agent"}) == {"a": "approved"}
+        assert len(connections) == 2
+    finally:
+        poller.close()
+        srv.close()
+
+
+def test_registry_polls_with_backoff_when_stream_unavailable(socket_path):
+    connections: list[int] = []
+    srv = _poll_server(socket_path, {"tok": ["pending", "pending", "approved"]}, connections)
+    try:
+        future = _defer.watch(
+            "tok", agent_id="agent", socket_path=socket_path,
+            poll_interval=0.01, max_poll_interval=0.04,
+        )
+        assert future.result(3.0) == "approved"
+        # The subscribe attempt and the poll connection: no per-poll sockets.
+        assert len(connections) <= 2
+    finally:
+        _defer.close_all()
+        srv.close()
+
+
+def test_close_all_cancels_waiters(socket_path):
+    future = _defer.watch("tok", agent_id="agent", socket_path=socket_path, poll_interval=60.0)
+    _defer.close_all()
+    assert future.cancelled()
+
+
+def test_parse_poll_response_rejects_errors():
+    with pytest.raises(RuntimeError, match="bad request"):
+        _defer.parse_poll_response({"error": "bad request"})
+    assert _defer.parse_poll_response({}) == "pending"
@@ -0,0 +1,241 @@
+"""Tests for the offline DPR readers (faramesh.dpr)."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import struct
+import zlib
+
+import pytest
+
+from faramesh import dpr
+
+
+def _frame(payload: dict | bytes, version: int = dpr.WAL_VERSION_RECORD) -> bytes:
+    body = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+    return struct.pack("<IBII", dpr.WAL_FRAME_MAGIC, version, len(body), zlib.crc32(body)) + body
+
+
+def _record(i: int, agent: str = "agent-a") -> dict:
+    return {
+        "schema_version": "dpr/2.0",
+        "record_id": f"r{i}",
+        "agent_id": agent,
+        "prev_record_hash": f"h{i - 1}",
+        "record_hash": f"h{i}",
+        "tool_id": "shell/run",
+        "effect": "PERMIT",
+        "created_at": "2026-01-01T00:00:00Z",
+    }
+
+
+def test_wal_scan_skips_control_frames_and_stops_at_torn_tail(tmp_path):
+    path = tmp_path / "faramesh.wal"
+    data = (
+        _frame(_record(1))
+        + _frame({"frame_kind": "budget_update"}, version=dpr.WAL_VERSION_CONTROL)
+        + _frame(_record(2, agent="agent-b"))
+        + _frame(_record(3))
+    )
+    path.write_bytes(data + _frame(_record(4))[:20])
+
+    records = list(dpr.iter_wal(path))
+    assert [r.record_id for r in records] == ["r1", "r2", "r3"]
+    assert records[1].agent_id == "agent-b" and records[1].get("tool_id") == "shell/run"
+    assert [r.record_id for r in dpr.iter_wal(path, agent_id="agent-a")] == ["r1", "r3"]
+
+    frames = list(dpr.iter_wal_frames(path))
+    assert [f.version for f in frames] == [1, 2, 1, 1]
+    assert frames[1].offset == len(_frame(_record(1)))
+    assert json.loads(bytes(frames[1].payload)) == {"frame_kind": "budget_update"}
+
+    with pytest.raises(dpr.DPRFormatError, match="truncated"):
+        list(dpr.iter_wal(path, strict=True))
+
+
+def test_wal_crc_mismatch_is_detected(tmp_path):
+    path = tmp_path / "faramesh.wal"
+    good = _frame(_record(1))
+    bad = bytearray(_frame(_record(2)))
+    bad[-2] ^= 0xFF
+    path.write_bytes(good + bytes(bad) + _frame(_record(3)))
+
+    assert [r.record_id for r in dpr.iter_wal(path)] == ["r1"]
+    with pytest.raises(dpr.DPRFormatError) as exc:
+        list(dpr.iter_wal(path, strict=True))
+    assert exc.value.offset == len(good)
+
+
+def test_empty_wal_and_segments(tmp_path):
+    active = tmp_path / "faramesh.wal"
+    active.write_bytes(b"")
+    assert list(dpr.iter_wal(active)) == []
+
+    (tmp_path / "faramesh.wal.200.bak").write_bytes(_frame(_record(2)))
+    (tmp_path / "faramesh.wal.100.bak").write_bytes(_frame(_record(1)))
+    segments = dpr.wal_segments(active)
+    assert [p.name for p in segments] == [
+        "faramesh.wal.100.bak", "faramesh.wal.200.bak", "faramesh.wal",
+    ]
+    assert [r.record_id for r in dpr.iter_records(segments)] == ["r1", "r2"]
+
+
+def test_sqlite_store_streams_typed_records(tmp_path):
+    path = tmp_path / "faramesh.db"
+    conn = sqlite3.connect(path)
+    conn.execute(
+        """CREATE TABLE dpr_records (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, record_id TEXT, agent_id TEXT,
+            prev_record_hash TEXT, record_hash TEXT, effect TEXT, tool_id TEXT,
+            session_id TEXT, invoked_by_dpr_id TEXT, cascade_path TEXT,
+            network_audit_bypass INTEGER, batch_size TEXT, created_at TEXT)"""
+    )
+    for i in range(5):
+        conn.execute(
+            "INSERT INTO dpr_records (record_id, agent_id, prev_record_hash, record_hash, effect,"
+            " tool_id, session_id, invoked_by_dpr_id, cascade_path, network_audit_bypass,"
+            " batch_size, created_at) VALUES (?,?,?,?,?,?,?,?,?,?,?,?)",
+            (f"r{i}", "agent-a" if i % 2 else "agent-b", f"h{i - 1}", f"h{i}", "DENY",
+             "http/get", None, "parent" if i == 3 else "", '["t0"]' if i == 3 else "",
+             1 if i == 3 else 0, "2", "2026-01-01T00:00:00Z"),
+        )
+    conn.commit()
+    conn.close()
+
+    records = list(dpr.iter_records(path))
+    assert [r.record_id for r in records] == [f"r{i}" for i in range(5)]
+    rec = records[3]
+    assert rec.effect == "DENY" and rec.session_id == ""
+    assert rec.get("invoked_by_dpr_record_id") == "parent"
+    assert rec.get("cascade_path") == ["t0"]
+    assert rec.get("network_audit_bypass") is True and rec.get("batch_size") == 2
+    assert "cascade_path" not in records[0].raw
+
+    agent_a = list(dpr.iter_sqlite(path, agent_id="agent-a", batch_size=1))
+    assert [r.record_id for r in agent_a] == ["r1", "r3"]
+
+
+def test_canonical_bytes_match_the_daemon():
+    rec = {
+        "schema_version": "dpr/2.0", "car_version": "car/1.0", "record_id": "rec-1",
+        "prev_record_hash": dpr.genesis_prev_hash("agent-1"), "agent_id": "agent-1",
+        "session_id": "sess-1", "tool_id": "tool-1", "intercept_adapter": "sdk",
+        "effect": "PERMIT", "matched_rule_id": "rule-1", "reason_code": "RULE_PERMIT",
+        "reason": "ok", "policy_version": "v1", "args_structural_sig": "sig-1",
+        "network_port": 0, "cascade_path": None,
+        "created_at": "1970-01-01T02:00:01.500+02:00",
+    }
+    assert dpr.canonical_record_bytes(rec) == (
+        b'{"schema_version":"dpr/2.0","car_version":"car/1.0","record_id":"rec-1",'
+        b'"prev_record_hash":"' + dpr.genesis_prev_hash("agent-1").encode() + b'",'
+        b'"agent_id":"agent-1","session_id":"sess-1","tool_id":"tool-1",'
+        b'"intercept_adapter":"sdk","effect":"PERMIT","matched_rule_id":"rule-1",'
+        b'"reason_code":"RULE_PERMIT","policy_version":"v1","args_structural_sig":"sig-1",'
+        b'"created_at":"1970-01-01T00:00:01.5Z"}'
+    )
+    rec.update(canonicalization_algorithm="jcs-rfc8785-v1", cascade_path=["a<b"])
+    jcs = dpr.canonical_record_bytes(rec)
+    assert jcs.startswith(b'{"agent_id":"agent-1","args_structural_sig":"sig-1",')
+    assert b'"cascade_path":["a\\u003cb"]' in jcs
+
+
+def _chain(n: int, agents: tuple[str, ...] = ("agent-a", "agent-b")) -> list[dict]:
+    last: dict[str, str] = {}
+    records = []
+    for i in range(n):
+        agent = agents[i % len(agents)]
+        rec = {
+            "schema_version": "dpr/2.0", "record_id": f"r{i}", "agent_id": agent,
+            "prev_record_hash": last.get(agent) or dpr.genesis_prev_hash(agent),
+            "tool_id": "http/get", "effect": "PERMIT", "policy_version": "v1",
+            "created_at": f"2026-01-01T00:00:{i % 60:02d}Z",
+        }
+        if i % 3 == 0:
+            rec["canonicalization_algorithm"] = "jcs-rfc8785-v1"
+        rec["record_hash"] = dpr.compute_record_hash(rec)
+        last[agent] = rec["record_hash"]
+        records.append(rec)
+    return records
+
+
+def test_verify_chain_in_parallel_segments():
+    records = _chain(40)
+    result = dpr.verify_chain(records, workers=2, segment_size=7)
+    assert result.ok
+    assert (result.records, result.agents, result.segments) == (40, 2, 6)
+
+    records[20]["effect"] = "DENY"
+    result = dpr.verify_chain(records, workers=2, segment_size=7)
+    assert result.first_break.position == 20
+    assert result.first_break.reason == "record_hash mismatch"
+    assert result.records == 20
+
+
+def test_verify_chain_finds_breaks_at_segment_boundaries():
+    records = _chain(40)
+    # r14 opens a segment of 7; relinking it breaks the chain only across the seam.
+    records[14]["prev_record_hash"] = "0" * 64
+    records[14]["record_hash"] = dpr.compute_record_hash(records[14])
+    brk = dpr.verify_chain(records, workers=1, segment_size=7).first_break
+    assert (brk.position, brk.record_id, brk.reason) == (14, "r14", "broken chain")
+    assert brk.expected_hash == records[12]["record_hash"]
+
+    window = records[2:10]
+    assert not dpr.verify_chain(window, workers=1).ok
+    assert dpr.verify_chain(window, workers=1, require_genesis=False).ok
+    assert dpr.verify_chain(records[:14], workers=1, agent_id="agent-b").records == 7
+
+
+def test_verify_chain_from_wal_and_sqlite(tmp_path):
+    records = _chain(30)
+    wal = tmp_path / "faramesh.wal"
+    wal.write_bytes(b"".join(_frame(r) for r in records) + _frame(records[0])[:9])
+    assert dpr.verify_chain(wal, workers=2).records == 30
+
+    db = tmp_path / "faramesh.db"
+    conn = sqlite3.connect(db)
+    columns = sorted({k for r in records for k in r})
+    conn.execute(f"CREATE TABLE dpr_records (id INTEGER PRIMARY KEY, {', '.join(columns)})")
+    for r in records:
+        conn.execute(
+            f"INSERT INTO dpr_records ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+            [r.get(c, "") for c in columns],
+        )
+    conn.commit()
+    conn.close()
+    assert dpr.verify_chain(db, workers=1).ok
+    assert dpr.verify_chain(db, workers=1, agent_id="agent-a").records == 15
+
+
+def _inclusion_proof(leaves: list[bytes], index: int) -> dict:
+    level, idx, siblings = list(leaves), index, []
+    while len(level) > 1:
+        if idx % 2 == 0 and idx + 1 < len(level):
+            siblings.append(level[idx + 1].hex())
+        elif idx % 2 == 1:
+            siblings.append(level[idx - 1].hex())
+        level = [
+            dpr._hash_children(level[i], level[i + 1]) if i + 1 < len(level) else level[i]
+            for i in range(0, len(level), 2)
+        ]
+        idx //= 2
+    return {
+        "version": "v1", "hash_algo": "sha256", "tree_size": len(leaves),
+        "leaf_index": index, "leaf_hash": leaves[index].hex(), "hashes": siblings,
+    }
+
+
+def test_inclusion_proofs_in_bulk():
+    leaves = [bytes.fromhex(r["record_hash"]) for r in _chain(13)]
+    root = dpr.compute_merkle_root(leaves)
+    proofs = [_inclusion_proof(leaves, i) for i in range(13)]
+    assert dpr.verify_inclusion_proofs(proofs, root.hex(), workers=2, chunk_size=4) == [True] * 13
+
+    proofs[5] = dict(proofs[5], leaf_hash=leaves[6].hex())
+    proofs[9] = dict(proofs[9], hashes=proofs[9]["hashes"] + [leaves[0].hex()])
+    results = dpr.verify_inclusion_proofs(proofs, root)
+    assert [i for i, ok in enumerate(results) if not ok] == [5, 9]
+    with pytest.raises(ValueError, match="extra sibling"):
+        dpr.verify_inclusion_proof(proofs[9], root)
+    assert dpr.compute_merkle_root([]) is None
@@ -0,0 +1,95 @@
+"""Import-time regression tests for the faramesh package.
+
+Each test runs a fresh interpreter with ``-X importtime`` and records the
+cumulative cost of the import under test, so eager imports of heavy
+dependencies (requests, yaml, framework SDKs) show up as failures rather than
+as slower agent startup.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+_SDK_ROOT = Path(__file__).resolve().parents[1]
+
+# Generous ceiling for noisy CI hosts; the package itself imports in a few ms.
+_BUDGET_US = int(float(os.environ.get("FARAMESH_IMPORT_BUDGET_MS", "100")) * 1000)
+
+
+def _import_profile(statement: str) -> tuple[dict[str, int], set[str]]:
+    """Return (cumulative import time in us per module, loaded module names)."""
+    env = {k: v for k, v in os.environ.items() if not k.startswith("FARAMESH_")}
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(_SDK_ROOT), env.get("PYTHONPATH")]))
+    proc = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            f"{statement}\nimport sys\nprint('\\n'.join(sys.modules))",
+        ],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    cumulative: dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = [part.strip() for part in line[len("import time:"):].split("|")]
+        if len(parts) == 3 and parts[1].isdigit():
+            cumulative[parts[2]] = int(parts[1])
+    return cumulative, set(proc.stdout.split())
+
+
+@pytest.mark.parametrize("module", ["faramesh", "faramesh.autopatch"])
+def test_import_does_not_load_heavy_dependencies(module):
+    _, loaded = _import_profile(f"import {module}")
+
+    assert module in loaded
+    assert "requests" not in loaded
+    assert "yaml" not in loaded
+    assert "faramesh.client" not in loaded
+
+
+def test_autopatch_defers_defer_machinery_until_needed():
+    _, loaded = _import_profile("import faramesh.autopatch")
+
+    assert "asyncio" not in loaded
+    assert "faramesh._defer" not in loaded
+    assert "faramesh.pending" not in loaded
+
+
+@pytest.mark.parametrize("module", ["faramesh", "faramesh.autopatch"])
+def test_import_time_budget(module):
+    cumulative, _ = _import_profile(f"import {module}")
+
+    cost_us = cumulative.get(module)
+    assert cost_us is not None, f"{module} missing from -X importtime output"
+    assert cost_us < _BUDGET_US, f"import {module} took {cost_us}us (budget {_BUDGET_US}us)"
+
+
+def test_public_api_resolves_lazily():
+    import faramesh
+
+    for name in faramesh.__all__:
+        assert getattr(faramesh, name) is not None, name
+    assert callable(faramesh.govern)
+    assert callable(faramesh.governed_tool)
+
+
+def test_submodules_resolve_as_attributes_after_plain_import():
+    _import_profile(
+        "import faramesh\n"
+        "for name in ('client', 'gate', 'snapshot', 'policy', 'transport', 'exceptions',\n"
+        "             'audit', 'callbacks', 'dpr'):\n"
+        "    assert getattr(faramesh, name).__name__ == 'faramesh.' + name, name\n"
+        "assert callable(faramesh.govern)\n"
+        "assert not hasattr(faramesh, 'no_such_module')"
+    )
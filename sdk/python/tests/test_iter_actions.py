@@ -0,0 +1,117 @@
+"""Tests for iter_actions pagination."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+import faramesh.client as client
+from faramesh import gate
+from faramesh.gate import replay_decision
+
+
+class _PagedApi:
+    """GET /v1/actions over ``total`` actions, by offset or by cursor."""
+
+    def __init__(self, total: int, *, keyset: bool, filter_provenance: bool = False):
+        self.actions = [
+            {
+                "id": f"a{i}", "agent_id": "agent", "tool": "http", "operation": "get",
+                "provenance_id": f"p{i}", "outcome": "EXECUTE", "reason_code": "OK",
+            }
+            for i in range(total)
+        ]
+        self.keyset = keyset
+        self.filter_provenance = filter_provenance
+        self.queries: list[dict] = []
+
+    def __call__(self, request):
+        if request.method == "POST":
+            return 200, {"outcome": "EXECUTE", "reason_code": "OK"}
+        if request.path != "/v1/actions":
+            return 200, self.actions[int(request.path.rsplit("/a", 1)[1])]
+        query = request.query
+        self.queries.append(query)
+        limit = int(query["limit"])
+        start = int(query.get("cursor") or query.get("offset") or 0)
+        pool = self.actions
+        if self.filter_provenance and "provenance_id" in query:
+            pool = [a for a in pool if a["provenance_id"] == query["provenance_id"]]
+        page = pool[start:start + limit]
+        if not self.keyset:
+            return 200, page
+        end = start + len(page)
+        return 200, {"actions": page, "next_cursor": str(end) if end < len(pool) else None}
+
+
+@pytest.fixture
+def paged_api(rest_api):
+    def _factory(total, *, keyset=False, filter_provenance=False):
+        api = _PagedApi(total, keyset=keyset, filter_provenance=filter_provenance)
+        rest_api(api)
+        return api
+
+    return _factory
+
+
+@pytest.mark.parametrize("keyset", [False, True])
+def test_walks_every_page(paged_api, keyset):
+    api = paged_api(25, keyset=keyset)
+    ids = [a["id"] for a in client.iter_actions(page_size=10, status="allowed", tool=None)]
+    assert ids == [f"a{i}" for i in range(25)]
+    assert len(api.queries) == 3
+    assert all(q["status"] == "allowed" and "tool" not in q for q in api.queries)
+    assert ("cursor" in api.queries[1]) is keyset
+
+
+def test_is_lazy(paged_api):
+    api = paged_api(100)
+    stream = client.iter_actions(page_size=10, prefetch=False)
+    assert next(stream)["id"] == "a0"
+    assert len(api.queries) == 1
+    stream.close()
+
+
+def test_prefetches_next_page(paged_api):
+    api = paged_api(30)
+    stream = client.iter_actions(page_size=10)
+    next(stream)
+    for _ in range(50):
+        if len(api.queries) == 2:
+            break
+        threading.Event().wait(0.01)
+    assert len(api.queries) == 2
+    assert len(list(stream)) == 29
+
+
+def test_replay_by_provenance_searches_past_first_page(paged_api):
+    paged_api(1200)
+    result = replay_decision(provenance_id="p1100")
+    assert result.original_outcome == "EXECUTE"
+
+
+def test_provenance_filter_answers_in_one_request(paged_api):
+    api = paged_api(5000, filter_provenance=True)
+    assert gate.find_action_by_provenance("p4321")["id"] == "a4321"
+    assert len(api.queries) == 1
+    assert api.queries[0]["provenance_id"] == "p4321"
+
+
+def test_provenance_index_skips_the_search(paged_api):
+    api = paged_api(50)
+    index = gate.enable_provenance_index(max_entries=10)
+    try:
+        client.list_actions(limit=20, offset=30)
+        assert len(index) == 10  # bounded: oldest entries evicted
+        api.queries.clear()
+        assert gate.find_action_by_provenance("p45")["id"] == "a45"
+        assert api.queries == []
+
+        index.add("p-stale", "a3")
+        assert gate.find_action_by_provenance("p3")["id"] == "a3"
+        with pytest.raises(client.FarameshError):
+            gate.find_action_by_provenance("p-stale")
+        assert index.get("p-stale") is None
+    finally:
+        gate.disable_provenance_index()
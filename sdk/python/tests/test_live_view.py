@@ -0,0 +1,193 @@
+"""Tests for LiveActionView (snapshot store kept current from event streams)."""
+
+from __future__ import annotations
+
+import json
+import socket
+import threading
+import time
+
+import pytest
+from conftest import eventually
+
+from faramesh import ActionSnapshotStore, LiveActionView
+
+
+class _MockDaemon:
+    """Accepts any number of subscribe connections; tests push events or drop them."""
+
+    def __init__(self, path: str):
+        self.conns: dict[str, list[socket.socket]] = {}
+        self.subscribes = 0
+        self.lock = threading.Lock()
+        self.srv = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.srv.bind(path)
+        self.srv.listen(8)
+        self.srv.settimeout(0.05)
+        self._stop = threading.Event()
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self):
+        while not self._stop.is_set():
+            try:
+                conn, _ = self.srv.accept()
+            except (socket.timeout, OSError):
+                continue
+            conn.settimeout(2.0)
+            buf = b""
+            while b"\n" not in buf:
+                chunk = conn.recv(4096)
+                if not chunk:
+                    break
+                buf += chunk
+            kind = json.loads(buf.split(b"\n", 1)[0])["type"]
+            conn.sendall(b'{"subscribed": true}\n')
+            with self.lock:
+                self.conns.setdefault(kind, []).append(conn)
+                self.subscribes += 1
+
+    def wait_for(self, subscribes: int, timeout: float = 3.0):
+        deadline = time.monotonic() + timeout
+        while self.subscribes < subscribes and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert self.subscribes >= subscribes
+
+    def send(self, kind: str, event: dict):
+        with self.lock:
+            for conn in self.conns.get(kind, []):
+                conn.sendall(json.dumps(event).encode() + b"\n")
+
+    def drop(self):
+        with self.lock:
+            for conns in self.conns.values():
+                for conn in conns:
+                    conn.close()
+            self.conns.clear()
+
+    def close(self):
+        self._stop.set()
+        self.drop()
+        self.srv.close()
+
+
+@pytest.fixture
+def daemon(socket_path):
+    d = _MockDaemon(socket_path)
+    yield d
+    d.close()
+
+
+def _decision(record_id: str, effect: str = "PERMIT", **extra) -> dict:
+    return {
+        "record_id": record_id, "agent_id": "alice", "tool_id": "http",
+        "operation": "get", "effect": effect, "timestamp": "2026-01-01T00:00:00Z",
+        **extra,
+    }
+
+
+def test_events_keep_store_current_and_events_win_over_resync(daemon, socket_path):
+    release = threading.Event()
+    # REST ids differ from the DPR record ids the streams carry.
+    listed = [
+        {"id": "act-4", "provenance_id": "r4", "status": "pending_approval",
+         "defer_token": "tok-4"},
+        {"id": "act-2", "dpr_record_id": "r2", "status": "allowed", "params": {"q": 1}},
+        {"id": "act-1", "provenance_id": "r1", "status": "pending_approval"},
+    ]
+
+    def resync():
+        release.wait(2.0)
+        return iter(listed)
+
+    store = ActionSnapshotStore()
+    view = LiveActionView(store, socket_path=socket_path, resync=resync)
+    with view:
+        daemon.wait_for(2)
+        assert view.stale
+        # r1 changes while the resync is in flight; the listed state is older.
+        daemon.send("audit_subscribe", _decision("r1", "DENY"))
+        eventually(lambda: view.get_action("r1") is not None)
+        release.set()
+        assert view.wait_until_current(2.0)
+        assert not view.stale and view.stale_for == 0.0
+        assert view.get_action("act-1")["status"] == "denied"
+        assert view.get_action("r1")["id"] == "act-1"
+        assert view.get_action("act-2")["status"] == "allowed"
+        assert sorted(a["id"] for a in view.list_recent()) == ["act-1", "act-2", "act-4"]
+
+        # A later decision for a listed action updates it in place.
+        daemon.send("audit_subscribe", _decision("r2", "DENY"))
+        eventually(lambda: view.get_action("act-2")["status"] == "denied")
+        assert view.get_action("act-2")["params"] == {"q": 1}
+        assert len(store) == 3
+
+        # A defer token learned only through the resync still resolves.
+        daemon.send("callback_subscribe", {
+            "event_type": "defer_resolved", "defer_token": "tok-4", "status": "denied",
+            "approved": False, "timestamp": "2026-01-01T00:00:30Z",
+        })
+        eventually(lambda: view.get_action("act-4")["status"] == "denied")
+
+        daemon.send("audit_subscribe", _decision("r3", "DEFER", defer_token="tok"))
+        eventually(lambda: view.get_action("r3") is not None)
+        assert [a["id"] for a in view.find(status="pending_approval")] == ["r3"]
+
+        daemon.send("callback_subscribe", {"event_type": "decision", "record_id": "r3"})
+        daemon.send("callback_subscribe", {
+            "event_type": "defer_resolved", "defer_token": "tok", "status": "approved",
+            "approved": True, "approver_id": "bob", "timestamp": "2026-01-01T00:01:00Z",
+        })
+        eventually(lambda: view.get_action("r3")["status"] == "approved")
+        assert view.get_action("r3")["approver_id"] == "bob"
+        assert view.list_recent(1)[0]["id"] == "r3"
+        assert view.resyncs == 1
+        assert len(store) == 4
+
+
+def test_reconnects_and_resyncs_after_drop(daemon, socket_path):
+    calls = []
+
+    def resync():
+        calls.append(time.monotonic())
+        return iter([{"id": f"listed-{len(calls)}", "status": "allowed"}])
+
+    view = LiveActionView(
+        socket_path=socket_path, resync=resync, reconnect_delay=0.05, max_reconnect_delay=0.1,
+    )
+    with view:
+        assert view.wait_until_current(3.0)
+        daemon.drop()
+        eventually(lambda: view.stale)
+        assert view.stale_for > 0.0
+        assert view.get_action("listed-1") is not None  # last state still served
+
+        daemon.wait_for(4)
+        eventually(lambda: not view.stale)
+        assert view.connected and view.reconnects == 1 and len(calls) == 2
+        assert view.get_action("listed-2") is not None
+    assert not view.connected
+
+
+def test_failed_resync_stays_stale_and_retries(daemon, socket_path):
+    attempts = []
+
+    def resync():
+        attempts.append(time.monotonic())
+        if len(attempts) < 3:
+            raise ConnectionError("REST API unavailable")
+        return iter([{"id": "act-1", "status": "allowed"}])
+
+    view = LiveActionView(
+        socket_path=socket_path, resync=resync, reconnect_delay=0.05, max_reconnect_delay=0.1,
+    )
+    with view:
+        daemon.wait_for(2)
+        eventually(lambda: len(attempts) >= 1)
+        assert view.stale and view.resyncs == 0 and view.last_resync_at is None
+
+        assert view.wait_until_current(3.0)
+        assert len(attempts) == 3
+        assert view.resyncs == 1 and view.last_resync_at is not None
+        assert view.get_action("act-1") is not None
+        # Retried on the live connection, not by reconnecting.
+        assert view.reconnects == 0 and daemon.subscribes == 2
@@ -0,0 +1,136 @@
+"""Tests for ``faramesh.pending`` (non-blocking DEFER handles)."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+from concurrent.futures import Future
+from unittest.mock import patch
+
+import pytest
+
+from faramesh import _governance_scope
+from faramesh.exceptions import ToolDeniedException
+from faramesh.pending import PendingToolCall, get_pending_call
+
+
+def _defer_env(monkeypatch):
+    monkeypatch.setenv("FARAMESH_DEFER_MODE", "pending")
+    monkeypatch.setenv("FARAMESH_SOCKET", "/tmp/faramesh-pending-test.sock")
+
+
+def test_approved_call_resumes_inside_governance_scope():
+    approval: Future = Future()
+    ran = threading.Event()
+
+    def resume():
+        ran.set()
+        return ("ok", _governance_scope.is_governed("search", "call-1"))
+
+    call = PendingToolCall("search", "tok", approval, resume, tool_call_id="call-1")
+    assert call.status == "pending_approval"
+    assert json.loads(str(call))["defer_token"] == "tok"
+    assert not ran.is_set()
+
+    approval.set_result("approved")
+    assert call.result(timeout=2.0) == ("ok", True)
+    assert call.status == "completed"
+
+
+def test_denied_call_never_runs():
+    approval: Future = Future()
+    call = PendingToolCall("search", "tok", approval, lambda: pytest.fail("ran"))
+    approval.set_result("denied")
+    with pytest.raises(ToolDeniedException) as exc:
+        call.result(timeout=2.0)
+    assert exc.value.defer_token == "tok"
+    assert exc.value.code == "DEFER_DENIED"
+    assert call.status == "denied"
+
+
+def test_coroutine_resume_runs_on_callers_loop():
+    async def main():
+        approval: Future = Future()
+        loop = asyncio.get_running_loop()
+
+        async def resume():
+            assert asyncio.get_running_loop() is loop
+            return "async-ok"
+
+        call = PendingToolCall("fetch", "tok", approval, resume)
+        loop.call_later(0.01, approval.set_result, "approved")
+        return await call
+
+    assert asyncio.run(main()) == "async-ok"
+
+
+@patch("os.path.exists", return_value=True)
+@patch("faramesh._defer.watch")
+@patch("faramesh.autopatch._govern_call")
+def test_autopatched_tool_returns_pending_handle(mock_govern, mock_watch, _exists, monkeypatch):
+    from faramesh.autopatch import _wrap_method
+
+    _defer_env(monkeypatch)
+    approval: Future = Future()
+    mock_watch.return_value = approval
+    mock_govern.return_value = {"effect": "DEFER", "defer_token": "tok-auto"}
+
+    class Tool:
+        name = "refund"
+        calls = 0
+
+        def run(self, amount):
+            Tool.calls += 1
+            return f"refunded {amount}"
+
+    _wrap_method(Tool, "run", "test", lambda self, a, kw: self.name)
+    pending = Tool().run("10")
+
+    assert isinstance(pending, PendingToolCall)
+    assert get_pending_call("tok-auto") is pending
+    assert Tool.calls == 0
+
+    approval.set_result("approved")
+    assert pending.result(timeout=2.0) == "refunded 10"
+    # The resumed call is not evaluated a second time.
+    mock_govern.assert_called_once()
+
+
+@patch("faramesh._defer.watch")
+@patch("faramesh.governed_toolset.detect_transport")
+@patch("faramesh.governed_toolset._govern_call")
+def test_governed_toolset_returns_pending_handle(mock_govern, mock_transport, mock_watch, monkeypatch):
+    from faramesh.governed_toolset import GovernedToolSet
+    from faramesh.transport import Transport
+
+    _defer_env(monkeypatch)
+    approval: Future = Future()
+    mock_watch.return_value = approval
+    mock_transport.return_value = Transport(mode="socket", socket_path="/tmp/x.sock")
+    mock_govern.return_value = {"effect": "DEFER", "defer_token": "tok-set"}
+
+    def transfer(amount: int) -> str:
+        return f"sent {amount}"
+
+    (tool,) = GovernedToolSet([transfer], agent_id="agent")
+    pending = tool(5)
+    assert isinstance(pending, PendingToolCall)
+
+    approval.set_result("approved")
+    assert pending.result(timeout=2.0) == "sent 5"
+
+
+@patch("faramesh.governed_toolset.detect_transport")
+@patch("faramesh.governed_toolset._govern_call")
+def test_blocking_modes_still_raise_for_defer(mock_govern, mock_transport, monkeypatch):
+    from faramesh.governed_toolset import GovernedToolSet
+    from faramesh.transport import Transport
+
+    monkeypatch.delenv("FARAMESH_DEFER_MODE", raising=False)
+    mock_transport.return_value = Transport(mode="socket", socket_path="/tmp/x.sock")
+    mock_govern.return_value = {"effect": "DEFER", "defer_token": "tok"}
+
+    (tool,) = GovernedToolSet([lambda: "x"], agent_id="agent")
+    with pytest.raises(ToolDeniedException):
+        tool()
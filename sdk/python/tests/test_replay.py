@@ -0,0 +1,87 @@
+"""Tests for bulk decision replay (gate.replay_decisions)."""
+
+from __future__ import annotations
+
+import io
+import json
+import threading
+
+import pytest
+
+from faramesh import gate
+
+
+def _action(i: int) -> dict:
+    return {
+        "id": f"a{i}",
+        "agent_id": "alice" if i % 2 else "bob",
+        "tool": "shell" if i % 5 == 0 else "http",
+        "operation": "run",
+        "outcome": "EXECUTE",
+        "reason_code": "ALLOW_RULE",
+        "policy_hash": "old",
+    }
+
+
+class _GateApi:
+    """Stored actions plus a /v1/gate/decide that now halts every shell call."""
+
+    def __init__(self, total: int):
+        self.actions = {f"a{i}": _action(i) for i in range(total)}
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, request):
+        if request.method == "POST":
+            return 200, self._decide(request.body)
+        if request.path == "/v1/actions":
+            return 200, list(self.actions.values())
+        action_id = request.path.rsplit("/", 1)[1]
+        if action_id in self.actions:
+            return 200, self.actions[action_id]
+        return 404, {"detail": "missing"}
+
+    def _decide(self, body):
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        threading.Event().wait(0.01)
+        with self.lock:
+            self.active -= 1
+        if body["tool"] == "shell":
+            return {"outcome": "HALT", "reason_code": "SHELL_BLOCKED", "policy_hash": "new"}
+        return {"outcome": "EXECUTE", "reason_code": "ALLOW_RULE", "policy_hash": "old"}
+
+
+@pytest.fixture
+def gate_api(rest_api):
+    api = _GateApi(20)
+    rest_api(api)
+    return api
+
+
+def test_replay_history_aggregates_report(gate_api, tmp_path):
+    out = tmp_path / "replay.jsonl"
+    summary = tmp_path / "summary.json"
+    report = gate.replay_decisions(workers=4, output=out, summary_path=summary)
+
+    assert (report.total, report.matched, report.mismatched, report.errors) == (20, 16, 4, 0)
+    assert report.outcome_transitions == {"EXECUTE -> HALT": 4}
+    assert report.reason_code_transitions == {"ALLOW_RULE -> SHELL_BLOCKED": 4}
+    assert report.policy_hash_drift == {"old -> new": 4}
+    assert report.per_agent["bob"] == {"total": 10, "mismatched": 2, "errors": 0}
+    assert 1 < gate_api.peak <= 4
+
+    records = [json.loads(line) for line in out.read_text().splitlines()]
+    assert sorted(r["action_id"] for r in records) == sorted(gate_api.actions)
+    assert json.loads(summary.read_text()) == report.to_dict()
+
+
+def test_replay_by_ids_records_errors(gate_api):
+    buffer = io.StringIO()
+    report = gate.replay_decisions(iter(["a1", "a5", "nope"]), workers=2, output=buffer)
+    assert (report.total, report.matched, report.mismatched, report.errors) == (3, 1, 1, 1)
+    records = {r["action_id"]: r for r in map(json.loads, buffer.getvalue().splitlines())}
+    assert "error" in records["nope"]
+    assert records["a5"]["replayed_policy_hash"] == "new"
@@ -0,0 +1,135 @@
+"""Tests for ``faramesh._retry`` and its use by the REST client and transports."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+import faramesh.client as client
+from faramesh import _retry
+from faramesh.transport import Transport, govern_via_transport
+
+
+def test_backoff_is_jittered_and_capped():
+    backoff = _retry.Backoff(0.1, cap=1.0)
+    delays = [backoff.next() for _ in range(50)]
+    assert all(0.1 <= d <= 1.0 for d in delays)
+    assert len({round(d, 6) for d in delays}) > 1
+    assert _retry.Backoff(0).next() == 0.0
+
+
+def test_budget_refills_over_time():
+    budget = _retry.RetryBudget(capacity=2, refill_rate=20.0)
+    assert budget.try_acquire() and budget.try_acquire()
+    assert budget.try_acquire() is False
+    time.sleep(0.06)
+    assert budget.try_acquire()
+
+
+def test_breaker_opens_then_admits_one_probe():
+    breaker = _retry.CircuitBreaker("svc", failure_threshold=2, reset_timeout=0.05)
+    breaker.record_failure()
+    assert breaker.state == _retry.CLOSED
+    breaker.record_failure()
+    assert breaker.state == _retry.OPEN
+    with pytest.raises(_retry.CircuitOpenError):
+        breaker.before_call()
+
+    time.sleep(0.06)
+    assert breaker.state == _retry.HALF_OPEN
+    breaker.before_call()  # the probe
+    with pytest.raises(_retry.CircuitOpenError):
+        breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == _retry.OPEN
+
+    time.sleep(0.06)
+    breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == _retry.CLOSED
+    breaker.before_call()
+
+
+def test_parse_retry_after():
+    assert _retry.parse_retry_after("2") == 2.0
+    assert _retry.parse_retry_after("9999") == _retry.MAX_RETRY_AFTER_SECONDS
+    assert _retry.parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert _retry.parse_retry_after("soon") is None
+    assert _retry.parse_retry_after(None) is None
+
+
+class _FlakyApi:
+    """Answers GET /v1/actions/<id> from a scripted list of status codes."""
+
+    def __init__(self, codes: list[int], headers: dict[str, str] | None = None):
+        self.codes = codes
+        self.headers = headers or {}
+        self.calls = 0
+
+    def __call__(self, request):
+        code = self.codes[min(self.calls, len(self.codes) - 1)]
+        self.calls += 1
+        return code, {"id": "a1", "status": "allowed"}, self.headers
+
+
+@pytest.fixture
+def flaky_api(rest_api):
+    def _factory(codes, *, max_retries=3, headers=None):
+        api = _FlakyApi(codes, headers)
+        rest_api(api, max_retries=max_retries, retry_backoff_factor=0.01)
+        return api
+
+    return _factory
+
+
+def test_server_errors_are_retried(flaky_api):
+    api = flaky_api([503, 502, 200])
+    assert client.get_action("a1")["status"] == "allowed"
+    assert api.calls == 3
+
+
+def test_retry_after_is_honored(flaky_api):
+    api = flaky_api([429, 200], headers={"Retry-After": "0.3"})
+    started = time.monotonic()
+    client.get_action("a1")
+    assert time.monotonic() - started >= 0.3
+    assert api.calls == 2
+
+
+def test_client_errors_are_not_retried(flaky_api):
+    api = flaky_api([400])
+    with pytest.raises(client.FarameshError):
+        client.get_action("a1")
+    assert api.calls == 1
+
+
+def test_exhausted_budget_stops_retries(flaky_api, monkeypatch):
+    monkeypatch.setenv("FARAMESH_RETRY_BUDGET", "1")
+    monkeypatch.setenv("FARAMESH_RETRY_BUDGET_REFILL", "0")
+    api = flaky_api([503])
+    with pytest.raises(client.FarameshServerError):
+        client.get_action("a1")
+    # One first attempt plus the single budgeted retry.
+    assert api.calls == 2
+
+
+def test_open_breaker_fails_fast(flaky_api, monkeypatch):
+    monkeypatch.setenv("FARAMESH_BREAKER_THRESHOLD", "2")
+    api = flaky_api([500], max_retries=0)
+    for _ in range(2):
+        with pytest.raises(client.FarameshServerError):
+            client.get_action("a1")
+    with pytest.raises(client.FarameshCircuitOpenError) as exc:
+        client.get_action("a1")
+    assert exc.value.retry_in > 0
+    assert api.calls == 2
+
+
+def test_socket_transport_shares_breaker(socket_path, monkeypatch):
+    monkeypatch.setenv("FARAMESH_BREAKER_THRESHOLD", "1")
+    transport = Transport(mode="socket", socket_path=socket_path)
+    with pytest.raises(OSError):
+        govern_via_transport(transport, "shell/run", {})
+    with pytest.raises(_retry.CircuitOpenError):
+        govern_via_transport(transport, "shell/run", {})
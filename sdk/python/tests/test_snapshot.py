@@ -0,0 +1,144 @@
+"""Tests for the action snapshot store."""
+
+from __future__ import annotations
+
+import threading
+from datetime import datetime, timezone
+
+import pytest
+
+from faramesh.snapshot import ActionSnapshotStore, SQLiteActionSnapshotStore
+
+
+def _action(i: int, **overrides) -> dict:
+    action = {
+        "id": f"a{i}",
+        "agent_id": f"agent-{i % 3}",
+        "tool": "shell" if i % 2 else "http",
+        "status": "allowed",
+        "provenance_id": f"p{i}",
+    }
+    action.update(overrides)
+    return action
+
+
+def test_eviction_frees_actions_and_index_entries():
+    store = ActionSnapshotStore(max_size=3)
+    for i in range(10):
+        store.add_action(_action(i))
+    assert len(store) == 3
+    assert store.get_action("a0") is None and "a9" in store
+    assert [a["id"] for a in store.list_recent()] == ["a9", "a8", "a7"]
+    assert sum(len(ids) for index in store._indexes.values() for ids in index.values()) == 12
+    assert store.get_by_provenance("p1") is None
+
+
+def test_reads_refresh_recency_for_eviction():
+    store = ActionSnapshotStore(max_size=3)
+    for i in range(3):
+        store.add_action(_action(i))
+    assert store.get_action("a0")["id"] == "a0"
+    store.add_action(_action(3))
+    assert "a0" in store and "a1" not in store
+    assert [a["id"] for a in store.list_recent()] == ["a3", "a0", "a2"]
+
+
+def test_readding_updates_in_place_and_reindexes():
+    store = ActionSnapshotStore(max_size=3)
+    for i in range(3):
+        store.add_action(_action(i))
+    store.add_action(_action(0, status="denied"))
+    assert [a["id"] for a in store.list_recent()] == ["a0", "a2", "a1"]
+    assert len(store) == 3
+    assert [a["id"] for a in store.find(status="denied")] == ["a0"]
+    assert [a["id"] for a in store.find(status="allowed")] == ["a2", "a1"]
+
+    store.add_action(_action(3))
+    assert "a1" not in store and "a0" in store
+
+
+def test_find_intersects_indexes():
+    store = ActionSnapshotStore(max_size=100)
+    store.add_actions(_action(i) for i in range(30))
+    found = store.find(agent_id="agent-1", tool="shell", limit=3)
+    assert [a["id"] for a in found] == ["a25", "a19", "a13"]
+    assert store.find(agent_id="agent-1", tool="shell", status="denied") == []
+    assert store.get_by_provenance("p7")["id"] == "a7"
+    with pytest.raises(ValueError):
+        store.find()
+
+    assert store.remove_action("a7")["id"] == "a7"
+    assert store.get_by_provenance("p7") is None
+    store.clear()
+    assert len(store) == 0 and store.list_recent() == []
+
+
+def test_concurrent_writers_stay_consistent():
+    store = ActionSnapshotStore(max_size=50)
+
+    def writer(offset):
+        for i in range(500):
+            store.add_action(_action(offset + i, status=f"s{i % 4}"))
+
+    threads = [threading.Thread(target=writer, args=(n * 1000,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(store) == 50
+    indexed = {i for ids in store._indexes["status"].values() for i in ids}
+    assert indexed == {a["id"] for a in store.list_recent(limit=100)}
+
+
+@pytest.fixture
+def sqlite_store(tmp_path):
+    stores = []
+
+    def _open(**kwargs):
+        store = SQLiteActionSnapshotStore(tmp_path / "actions.db", **kwargs)
+        stores.append(store)
+        return store
+
+    yield _open
+    for store in stores:
+        store.close()
+
+
+def test_sqlite_store_matches_memory_interface(sqlite_store):
+    store = sqlite_store(flush_interval=5.0)
+    store.add_actions(_action(i) for i in range(30))
+    # Queued writes are visible before the writer commits them.
+    assert store.get_action("a29")["provenance_id"] == "p29"
+    assert [a["id"] for a in store.list_recent(limit=3)] == ["a29", "a28", "a27"]
+    assert len(store) == 30
+    found = store.find(agent_id="agent-1", tool="shell", limit=3)
+    assert [a["id"] for a in found] == ["a25", "a19", "a13"]
+    assert store.get_by_provenance("p7")["id"] == "a7"
+
+    store.add_action(_action(7, status="denied"))
+    assert store.list_recent(limit=1)[0]["status"] == "denied"
+    assert [a["id"] for a in store.find(status="denied")] == ["a7"]
+    assert store.remove_action("a7")["id"] == "a7"
+    assert "a7" not in store and store.get_action("a7") is None
+    assert len(store) == 29
+    store.clear()
+    assert len(store) == 0
+
+
+def test_sqlite_store_survives_restart_and_prunes(sqlite_store):
+    store = sqlite_store(max_size=10, batch_size=4)
+    store.add_actions(
+        _action(i, created_at=f"2026-01-01T00:00:{i:02d}Z") for i in range(25)
+    )
+    store.close()
+
+    store = sqlite_store(max_size=10)
+    assert len(store) == 10
+    assert [a["id"] for a in store.iter_recent()][:2] == ["a24", "a23"]
+    start = datetime(2026, 1, 1, 0, 0, 20, tzinfo=timezone.utc).timestamp()
+    window = store.find(since=start, until=start + 3)
+    assert [a["id"] for a in window] == ["a22", "a21", "a20"]
+    store.add_action(_action(99))
+    assert store.list_recent(limit=1)[0]["id"] == "a99"
+    with pytest.raises(ValueError):
+        store.find()
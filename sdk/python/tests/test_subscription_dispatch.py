@@ -0,0 +1,166 @@
+"""Tests for queued dispatch on subscriptions (overflow, workers, asyncio, batching)."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+from conftest import eventually
+
+from faramesh import audit, callbacks
+from faramesh._subscription import _decode_lines
+
+
+def _events(n: int) -> list[dict]:
+    return [{"effect": "PERMIT", "agent_id": "bot", "record_id": f"r{i}"} for i in range(n)]
+
+
+def test_slow_callback_does_not_stall_the_reader(socket_path, start_mock_server):
+    server, _ = start_mock_server(socket_path, _events(10))
+    release = threading.Event()
+    received: list[str] = []
+
+    def callback(event):
+        release.wait(3.0)
+        received.append(event["record_id"])
+
+    sub = audit.subscribe(callback, socket_path=socket_path)
+    eventually(lambda: sub.stats.received == 10)
+    stats = sub.stats
+    assert stats.delivered == 0 and stats.queued >= 9 and stats.lag_seconds > 0
+    release.set()
+    eventually(lambda: len(received) == 10)
+    sub.close()
+    server.join(timeout=2.0)
+    assert received == [f"r{i}" for i in range(10)]
+    assert sub.stats.delivered == 10 and sub.stats.dropped == 0
+
+
+def test_drop_oldest_keeps_the_newest_events(socket_path, start_mock_server):
+    server, _ = start_mock_server(socket_path, _events(10))
+    release = threading.Event()
+    received: list[str] = []
+
+    def callback(event):
+        release.wait(3.0)
+        received.append(event["record_id"])
+
+    sub = audit.subscribe(
+        callback, socket_path=socket_path, queue_size=3, overflow="drop_oldest",
+    )
+    eventually(lambda: sub.stats.received == 10)
+    release.set()
+    eventually(lambda: sub.stats.queued == 0)
+    sub.close()
+    server.join(timeout=2.0)
+    # One event was already in the callback when the queue started to overflow.
+    assert received == ["r0", "r7", "r8", "r9"]
+    assert sub.stats.dropped == 6 and sub.stats.max_queued == 3
+
+
+def test_spill_preserves_order(socket_path, start_mock_server, tmp_path):
+    server, _ = start_mock_server(socket_path, _events(20))
+    release = threading.Event()
+    received: list[str] = []
+
+    def callback(event):
+        release.wait(3.0)
+        received.append(event["record_id"])
+
+    sub = callbacks.subscribe(
+        callback, socket_path=socket_path, queue_size=4, overflow="spill",
+        spill_dir=str(tmp_path),
+    )
+    eventually(lambda: sub.stats.received == 20)
+    assert sub.stats.spilled > 0 and sub.stats.queued == 19
+    release.set()
+    eventually(lambda: len(received) == 20)
+    sub.close()
+    server.join(timeout=2.0)
+    assert received == [f"r{i}" for i in range(20)]
+    assert sub.stats.dropped == 0
+
+
+def test_workers_deliver_concurrently(socket_path, start_mock_server):
+    server, _ = start_mock_server(socket_path, _events(8))
+    lock = threading.Lock()
+    active = peak = 0
+    received: list[str] = []
+
+    def callback(event):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+            received.append(event["record_id"])
+
+    with audit.subscribe(callback, socket_path=socket_path, workers=4) as sub:
+        eventually(lambda: len(received) == 8)
+    server.join(timeout=2.0)
+    assert peak > 1
+    assert sorted(received) == sorted(e["record_id"] for e in _events(8))
+    assert sub.stats.delivered == 8
+
+
+def test_coroutine_callback_runs_on_the_running_loop(socket_path, start_mock_server):
+    server, _ = start_mock_server(socket_path, _events(3))
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        received: list[str] = []
+        done = asyncio.Event()
+
+        async def on_event(event):
+            assert asyncio.get_running_loop() is loop
+            await asyncio.sleep(0)
+            received.append(event["record_id"])
+            if len(received) == 3:
+                done.set()
+
+        sub = audit.subscribe(on_event, socket_path=socket_path)
+        await asyncio.wait_for(done.wait(), 3.0)
+        await loop.run_in_executor(None, sub.close)
+        return received
+
+    assert asyncio.run(main()) == ["r0", "r1", "r2"]
+    server.join(timeout=2.0)
+
+
+def test_rejects_bad_dispatch_options(socket_path):
+    with pytest.raises(ValueError, match="overflow"):
+        audit.subscribe(print, socket_path=socket_path, overflow="lossy")
+
+    async def on_event(event):
+        pass
+
+    with pytest.raises(ValueError, match="event loop"):
+        audit.subscribe(on_event, socket_path=socket_path)
+
+
+def test_batched_delivery_respects_size_and_latency(socket_path, start_mock_server):
+    server, _ = start_mock_server(socket_path, _events(10))
+    batches: list[list[str]] = []
+
+    sub = callbacks.subscribe(
+        lambda batch: batches.append([e["record_id"] for e in batch]),
+        socket_path=socket_path, batch_size=4, max_latency_ms=150,
+    )
+    eventually(lambda: sum(map(len, batches)) == 10)
+    sub.close()
+    server.join(timeout=2.0)
+
+    assert [r for batch in batches for r in batch] == [f"r{i}" for i in range(10)]
+    assert all(1 <= len(batch) <= 4 for batch in batches)
+    assert len(batches) < 10 and sub.stats.delivered == 10
+
+
+def test_decodes_a_recv_buffer_in_bulk():
+    data = b'{"seq":1}\n\n{"seq":2}\n{broken\n{"seq":3}\n[1]'
+    assert _decode_lines(data) == [{"seq": 1}, {"seq": 2}, {"seq": 3}]
+    assert _decode_lines(b'{"a":1}\n{"b":2}') == [{"a": 1}, {"b": 2}]
+    assert _decode_lines(b"\n") == []
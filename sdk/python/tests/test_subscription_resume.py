@@ -0,0 +1,121 @@
+"""Tests for auto-reconnecting subscriptions that resume from ``since_seq``."""
+
+from __future__ import annotations
+
+import json
+import socket
+import threading
+import time
+
+from conftest import eventually
+
+from faramesh import audit, callbacks
+
+
+def _serve(path: str, sessions: list[tuple[dict, list[dict]]], requests: list[dict]):
+    """Serve one scripted connection per session: ack, events, then hang up.
+
+    The last session keeps its connection open until the client leaves.
+    """
+    srv = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    srv.bind(path)
+    srv.listen(1)
+    srv.settimeout(5.0)
+
+    def run():
+        try:
+            for i, (ack, events) in enumerate(sessions):
+                conn, _ = srv.accept()
+                reader = conn.makefile("rb")
+                requests.append(json.loads(reader.readline()))
+                conn.sendall(json.dumps(ack).encode() + b"\n")
+                for event in events:
+                    conn.sendall(json.dumps(event).encode() + b"\n")
+                if i == len(sessions) - 1:
+                    conn.recv(1)  # wait for the client to close
+                else:
+                    time.sleep(0.05)
+                reader.close()
+                conn.close()
+        except OSError:
+            pass
+        finally:
+            srv.close()
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    return thread
+
+
+def _ev(seq: int) -> dict:
+    return {"seq": seq, "effect": "PERMIT", "agent_id": "bot", "record_id": f"r{seq}"}
+
+
+def test_reconnect_resumes_from_last_seq(socket_path):
+    requests: list[dict] = []
+    server = _serve(socket_path, [
+        ({"subscribed": True, "seq": 0, "epoch": "e1"}, [_ev(1), _ev(2), _ev(4)]),
+        (
+            {"subscribed": True, "seq": 6, "epoch": "e1", "replayed": 2, "missed": 0},
+            [_ev(4), _ev(5), _ev(6)],
+        ),
+    ], requests)
+
+    received: list[int] = []
+    sub = audit.subscribe(
+        lambda e: received.append(e["seq"]),
+        socket_path=socket_path, reconnect=True, reconnect_delay=0.01,
+    )
+    eventually(lambda: len(received) == 5)
+    assert sub.active and sub.connected
+    sub.close()
+    server.join(timeout=2.0)
+
+    assert received == [1, 2, 4, 5, 6]  # the replayed duplicate of 4 is skipped
+    assert requests[0] == {"type": "audit_subscribe", "agent_id": ""}
+    assert requests[1] == {"type": "audit_subscribe", "agent_id": "", "since_seq": 4, "epoch": "e1"}
+    stats = sub.stats
+    assert (stats.missed, stats.reconnects) == (1, 1)  # seq 3 never arrived
+    assert (sub.last_seq, sub.epoch) == (6, "e1")
+
+
+def test_reconnect_across_daemon_restart(socket_path):
+    requests: list[dict] = []
+    server = _serve(socket_path, [
+        ({"subscribed": True, "seq": 7, "epoch": "e1", "stream": "callbacks"},
+         [{"seq": 8, "event_type": "defer_resolved"}]),
+        (
+            {"subscribed": True, "seq": 3, "epoch": "e2", "stream": "callbacks",
+             "epoch_changed": True, "replayed": 1, "missed": 2},
+            [{"seq": 3, "event_type": "defer_resolved"}],
+        ),
+    ], requests)
+
+    received: list[int] = []
+    sub = callbacks.subscribe(
+        lambda e: received.append(e["seq"]),
+        socket_path=socket_path, reconnect=True, reconnect_delay=0.01,
+    )
+    eventually(lambda: len(received) == 2)
+    sub.close()
+    server.join(timeout=2.0)
+
+    assert received == [8, 3]
+    assert requests[1] == {"type": "callback_subscribe", "since_seq": 8, "epoch": "e1"}
+    assert (sub.stats.missed, sub.last_seq, sub.epoch) == (2, 3, "e2")
+
+
+def test_without_reconnect_the_stream_just_ends(socket_path):
+    requests: list[dict] = []
+    server = _serve(socket_path, [
+        ({"subscribed": True}, [{"effect": "PERMIT"}]),
+        ({"subscribed": True}, []),
+    ], requests)
+
+    received: list[dict] = []
+    sub = audit.subscribe(received.append, socket_path=socket_path)
+    eventually(lambda: not sub.active)
+    sub.close()
+    assert len(received) == 1 and len(requests) == 1
+    assert sub.last_seq is None
+    server.join(timeout=0.1)
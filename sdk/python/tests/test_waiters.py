@@ -0,0 +1,112 @@
+"""Tests for ``faramesh._waiters`` (shared waiter registry)."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from faramesh._waiters import WaiterRegistry
+
+
+class _Checker:
+    """Resolves a key once it has been checked ``after`` times."""
+
+    def __init__(self, after: int = 1, value: str = "done"):
+        self.after = after
+        self.value = value
+        self.batches: list[list] = []
+        self.seen: dict = {}
+
+    def __call__(self, due):
+        self.batches.append(sorted(due))
+        resolved = {}
+        for key in due:
+            self.seen[key] = self.seen.get(key, 0) + 1
+            if self.seen[key] >= self.after:
+                resolved[key] = self.value
+        return resolved
+
+
+def test_new_key_is_checked_immediately():
+    check = _Checker(after=1)
+    registry = WaiterRegistry("test", check, poll_interval=10.0)
+    try:
+        assert registry.wait("a", timeout=1.0) == "done"
+        assert len(registry) == 0
+    finally:
+        registry.close()
+
+
+def test_many_waiters_share_batched_checks():
+    check = _Checker(after=2)
+    registry = WaiterRegistry("test", check, poll_interval=0.05)
+    try:
+        futures = [registry.watch(f"k{i}") for i in range(200)]
+        assert [f.result(2.0) for f in futures] == ["done"] * 200
+        # 200 keys resolved in a handful of batch calls, not 400 polls.
+        assert len(check.batches) < 10
+    finally:
+        registry.close()
+
+
+def test_pending_keys_back_off_exponentially():
+    check = _Checker(after=10**6)
+    registry = WaiterRegistry("test", check, poll_interval=0.02, max_poll_interval=0.08)
+    try:
+        with pytest.raises(TimeoutError):
+            registry.wait("slow", timeout=0.35)
+        # Checks at ~0, .02, .06, .14, .22, .30 — far fewer than 0.35/0.02.
+        assert 3 <= check.seen["slow"] <= 7
+        assert len(registry) == 0
+    finally:
+        registry.close()
+
+
+def test_push_resolution_and_slow_recheck_while_streaming():
+    check = _Checker(after=10**6)
+    registry = WaiterRegistry(
+        "test", check, poll_interval=0.01, push_active=lambda: True, recheck_interval=60.0
+    )
+    try:
+        future = registry.watch("tok")
+        time.sleep(0.1)
+        assert check.seen["tok"] == 1  # only the registration check
+        assert registry.resolve("tok", "approved") is True
+        assert future.result(1.0) == "approved"
+        assert registry.resolve("tok", "approved") is False
+    finally:
+        registry.close()
+
+
+def test_exception_values_fail_the_waiter():
+    registry = WaiterRegistry("test", lambda due: {k: RuntimeError("boom") for k in due})
+    try:
+        with pytest.raises(RuntimeError, match="boom"):
+            registry.wait("x", timeout=1.0)
+    finally:
+        registry.close()
+
+
+def test_asyncio_waiters_do_not_need_threads():
+    gate = threading.Event()
+
+    def check(due):
+        return {k: "ok" for k in due} if gate.is_set() else {}
+
+    registry = WaiterRegistry("test", check, poll_interval=0.01, max_poll_interval=0.01)
+
+    async def main():
+        threads_before = threading.active_count()
+        waits = [asyncio.wrap_future(registry.watch(i)) for i in range(100)]
+        await asyncio.sleep(0.05)
+        assert threading.active_count() <= threads_before + 1
+        gate.set()
+        return await asyncio.gather(*waits)
+
+    try:
+        assert asyncio.run(main()) == ["ok"] * 100
+    finally:
+        registry.close()